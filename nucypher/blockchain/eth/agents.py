@@ -48,7 +48,8 @@ from nucypher.blockchain.eth.constants import (
     STAKING_INTERFACE_ROUTER_CONTRACT_NAME,
     WORKLOCK_CONTRACT_NAME
 )
-from nucypher.blockchain.eth.decorators import contract_api, validate_checksum_address
+from nucypher.blockchain.eth.caches import ContractCallCache, StakerSamplingIndex
+from nucypher.blockchain.eth.decorators import cached_call, contract_api, validate_checksum_address
 from nucypher.blockchain.eth.events import ContractEvents
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory, VersionedContract
 from nucypher.blockchain.eth.registry import AllocationRegistry, BaseContractRegistry
@@ -96,10 +97,12 @@ class EthereumContractAgent:
                  registry: BaseContractRegistry,
                  provider_uri: Optional[str] = None,
                  contract: Optional[Contract] = None,
-                 transaction_gas: Optional[Wei] = None):
+                 transaction_gas: Optional[Wei] = None,
+                 call_cache: Optional[ContractCallCache] = None):
 
         self.log = Logger(self.__class__.__name__)
         self.registry = registry
+        self.call_cache = call_cache  # Opt-in; see enable_call_cache
 
         self.blockchain = BlockchainInterfaceFactory.get_or_create_interface(provider_uri=provider_uri)
 
@@ -135,6 +138,19 @@ class EthereumContractAgent:
     def contract(self) -> Contract:
         return self.__contract
 
+    def enable_call_cache(self, ttls: Optional[Dict[str, float]] = None) -> ContractCallCache:
+        """Serves this agent's cacheable contract calls from a cache valid for one block (see ContractCallCache)."""
+        if self.call_cache is None:
+            self.call_cache = ContractCallCache(blockchain=self.blockchain, ttls=ttls)
+        elif ttls:
+            self.call_cache.ttls.update(ttls)
+        return self.call_cache
+
+    def clear_caches(self) -> None:
+        """Forgets whatever this agent cached from the chain; called once it sends a transaction."""
+        if self.call_cache is not None:
+            self.call_cache.clear()
+
     @property  # type: ignore
     def contract_address(self) -> ChecksumAddress:
         return self.__contract.address
@@ -229,29 +245,40 @@ class StakingEscrowAgent(EthereumContractAgent):
     class NotEnoughStakers(Exception):
         """Raised when the are not enough stakers available to complete an operation"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__sampling_indices = dict()  # type: Dict[Tuple[Period, int], StakerSamplingIndex]  # By period and duration
+
+    def clear_caches(self) -> None:
+        super().clear_caches()
+        self.__sampling_indices = dict()
+
     #
     # Staker Network Status
     #
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_staker_population(self) -> int:
         """Returns the number of stakers on the blockchain"""
         return self.contract.functions.getStakersLength().call()
     
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_current_period(self) -> Period:
         """Returns the current period"""
         return self.contract.functions.getCurrentPeriod().call()
 
     @contract_api(CONTRACT_CALL)
-    def get_stakers(self) -> List[ChecksumAddress]:
-        """Returns a list of stakers"""
+    def get_stakers(self, batch_size: Optional[int] = None) -> List[ChecksumAddress]:
+        """Returns a list of stakers, looked up in batches of `batch_size` (see BlockchainInterface.batch_call)"""
         num_stakers: int = self.get_staker_population()
-        stakers: List[ChecksumAddress] = [self.contract.functions.stakers(i).call() for i in range(num_stakers)]
+        calls = [self.contract.functions.stakers(i) for i in range(num_stakers)]
+        stakers: List[ChecksumAddress] = self.blockchain.batch_call(calls, batch_size=batch_size)
         return stakers
 
     @contract_api(CONTRACT_CALL)
-    def partition_stakers_by_activity(self) -> Tuple[List[ChecksumAddress], List[ChecksumAddress], List[ChecksumAddress]]:
+    def partition_stakers_by_activity(self, batch_size: Optional[int] = None) -> Tuple[List[ChecksumAddress], List[ChecksumAddress], List[ChecksumAddress]]:
         """
         Returns three lists of stakers depending on their commitments:
         The first list contains stakers that already committed to next period.
@@ -259,15 +286,14 @@ class StakingEscrowAgent(EthereumContractAgent):
         The third contains stakers that have missed commitments before current period
         """
 
-        num_stakers: int = self.get_staker_population()
+        stakers: List[ChecksumAddress] = self.get_stakers(batch_size=batch_size)
+        last_committed_periods = self.get_last_committed_periods(stakers, batch_size=batch_size)
         current_period: Period = self.get_current_period()
         active_stakers: List[ChecksumAddress] = list()
         pending_stakers: List[ChecksumAddress] = list()
         missing_stakers: List[ChecksumAddress] = list()
 
-        for i in range(num_stakers):
-            staker = self.contract.functions.stakers(i).call()
-            last_committed_period = self.get_last_committed_period(staker)
+        for staker, last_committed_period in zip(stakers, last_committed_periods):
             if last_committed_period == current_period + 1:
                 active_stakers.append(staker)
             elif last_committed_period == current_period:
@@ -322,6 +348,7 @@ class StakingEscrowAgent(EthereumContractAgent):
     # StakingEscrow Contract API
     #
     
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_global_locked_tokens(self, at_period: Optional[Period] = None) -> NuNits:
         """
@@ -346,10 +373,12 @@ class StakingEscrowAgent(EthereumContractAgent):
             at_period = self.contract.functions.getCurrentPeriod().call()
         return NuNits(self.contract.functions.lockedPerPeriod(at_period).call())
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_staker_info(self, staker_address: ChecksumAddress) -> StakerInfo:
         return StakerInfo(*self.contract.functions.stakerInfo(staker_address).call())
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_locked_tokens(self, staker_address: ChecksumAddress, periods: int = 0) -> NuNits:
         """
@@ -360,6 +389,15 @@ class StakingEscrowAgent(EthereumContractAgent):
             raise ValueError(f"Periods value must not be negative, Got '{periods}'.")
         return NuNits(self.contract.functions.getLockedTokens(staker_address, periods).call())
 
+    @contract_api(CONTRACT_CALL)
+    def get_locked_tokens_of_stakers(self, staker_addresses: List[ChecksumAddress], periods: int = 0) -> List[NuNits]:
+        """Like get_locked_tokens, for each of `staker_addresses` at once."""
+        if periods < 0:
+            raise ValueError(f"Periods value must not be negative, Got '{periods}'.")
+        calls = [self.contract.functions.getLockedTokens(staker_address, periods) for staker_address in staker_addresses]
+        return [NuNits(locked_tokens) for locked_tokens in self.blockchain.batch_call(calls)]
+
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def owned_tokens(self, staker_address: ChecksumAddress) -> NuNits:
         """
@@ -367,12 +405,14 @@ class StakingEscrowAgent(EthereumContractAgent):
         """
         return NuNits(self.contract.functions.getAllTokens(staker_address).call())
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_substake_info(self, staker_address: ChecksumAddress, stake_index: int) -> SubStakeInfo:
         first_period, *others, locked_value = self.contract.functions.getSubStakeInfo(staker_address, stake_index).call()
         last_period: Period = self.contract.functions.getLastPeriodOfSubStake(staker_address, stake_index).call()
         return SubStakeInfo(first_period, last_period, locked_value)
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_raw_substake_info(self, staker_address: ChecksumAddress, stake_index: int) -> RawSubStakeInfo:
         result: RawSubStakeInfo = self.contract.functions.getSubStakeInfo(staker_address, stake_index).call()
@@ -472,21 +512,39 @@ class StakingEscrowAgent(EthereumContractAgent):
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=staker_address)
         return receipt
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_last_committed_period(self, staker_address: ChecksumAddress) -> Period:
         period: int = self.contract.functions.getLastCommittedPeriod(staker_address).call()
         return Period(period)
 
+    @contract_api(CONTRACT_CALL)
+    def get_last_committed_periods(self,
+                                   staker_addresses: List[ChecksumAddress],
+                                   batch_size: Optional[int] = None
+                                   ) -> List[Period]:
+        """Like get_last_committed_period, for each of `staker_addresses` at once."""
+        calls = [self.contract.functions.getLastCommittedPeriod(staker_address) for staker_address in staker_addresses]
+        return [Period(period) for period in self.blockchain.batch_call(calls, batch_size=batch_size)]
+
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_worker_from_staker(self, staker_address: ChecksumAddress) -> ChecksumAddress:
         worker: str = self.contract.functions.getWorkerFromStaker(staker_address).call()
         return to_checksum_address(worker)
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_staker_from_worker(self, worker_address: ChecksumAddress) -> ChecksumAddress:
         staker = self.contract.functions.stakerFromWorker(worker_address).call()
         return to_checksum_address(staker)
 
+    @contract_api(CONTRACT_CALL)
+    def get_stakers_from_workers(self, worker_addresses: List[ChecksumAddress]) -> List[ChecksumAddress]:
+        """Like get_staker_from_worker, for each of `worker_addresses` at once."""
+        calls = [self.contract.functions.stakerFromWorker(worker_address) for worker_address in worker_addresses]
+        return [to_checksum_address(staker) for staker in self.blockchain.batch_call(calls)]
+
     @contract_api(TRANSACTION)
     def bond_worker(self, staker_address: ChecksumAddress, worker_address: ChecksumAddress) -> TxReceipt:
         contract_function: ContractFunction = self.contract.functions.bondWorker(worker_address)
@@ -517,6 +575,7 @@ class StakingEscrowAgent(EthereumContractAgent):
         receipt: TxReceipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=staker_address)
         return receipt
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def calculate_staking_reward(self, staker_address: ChecksumAddress) -> NuNits:
         token_amount: NuNits = self.owned_tokens(staker_address)
@@ -544,17 +603,20 @@ class StakingEscrowAgent(EthereumContractAgent):
                                                    sender_address=staker_address)
         return receipt
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_flags(self, staker_address: ChecksumAddress) -> StakerFlags:
         flags: tuple = self.contract.functions.getFlags(staker_address).call()
         wind_down_flag, restake_flag, measure_work_flag, snapshot_flag = flags
         return StakerFlags(wind_down_flag, restake_flag, measure_work_flag, snapshot_flag)
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def is_restaking(self, staker_address: ChecksumAddress) -> bool:
         flags = self.get_flags(staker_address)
         return flags.restake_flag
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def is_restaking_locked(self, staker_address: ChecksumAddress) -> bool:
         return self.contract.functions.isReStakeLocked(staker_address).call()
@@ -577,12 +639,14 @@ class StakingEscrowAgent(EthereumContractAgent):
         # TODO: Handle ReStakeLocked event (see #1193)
         return receipt
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_restake_unlock_period(self, staker_address: ChecksumAddress) -> Period:
         staker_info: StakerInfo = self.get_staker_info(staker_address)
         restake_unlock_period: int = int(staker_info.lock_restake_until_period)
         return Period(restake_unlock_period)
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def is_winding_down(self, staker_address: ChecksumAddress) -> bool:
         flags = self.get_flags(staker_address)
@@ -599,6 +663,7 @@ class StakingEscrowAgent(EthereumContractAgent):
         # TODO: Handle WindDownSet event (see #1193)
         return receipt
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def is_taking_snapshots(self, staker_address: ChecksumAddress) -> bool:
         _winddown_flag, _restake_flag, _measure_work_flag, snapshots_flag = self.get_flags(staker_address)
@@ -615,6 +680,7 @@ class StakingEscrowAgent(EthereumContractAgent):
         # TODO: Handle SnapshotSet event (see #1193)
         return receipt
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def staking_parameters(self) -> StakingEscrowParameters:
         parameter_signatures = (
@@ -648,14 +714,17 @@ class StakingEscrowAgent(EthereumContractAgent):
     #
 
     @contract_api(CONTRACT_CALL)
-    def swarm(self) -> Iterable[ChecksumAddress]:
+    def swarm(self, batch_size: Optional[int] = None) -> Iterable[ChecksumAddress]:
         """
         Returns an iterator of all staker addresses via cumulative sum, on-network.
-        Staker addresses are returned in the order in which they registered with the StakingEscrow contract's ledger
+        Staker addresses are returned in the order in which they registered with the StakingEscrow contract's ledger,
+        and looked up a batch at a time, as they're iterated over.
         """
-        for index in range(self.get_staker_population()):
-            staker_address: ChecksumAddress = self.contract.functions.stakers(index).call()
-            yield staker_address
+        batch_size = batch_size or self.blockchain.BATCH_CALL_SIZE
+        num_stakers: int = self.get_staker_population()
+        for start in range(0, num_stakers, batch_size):
+            calls = [self.contract.functions.stakers(index) for index in range(start, min(start + batch_size, num_stakers))]
+            yield from self.blockchain.batch_call(calls, batch_size=batch_size)
 
     @contract_api(CONTRACT_CALL)
     def sample(self,
@@ -686,38 +755,22 @@ class StakingEscrowAgent(EthereumContractAgent):
         In this case, Stakers 0, 1, 3 and 5 will be selected.
 
         Only stakers which made a commitment to the current period (in the previous period) are used.
+        They're looked up once per period and duration (see get_sampling_index).
         """
 
         system_random = random.SystemRandom()
-        n_tokens, stakers_map = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
+        sampling_index = self.get_sampling_index(duration=duration, pagination_size=pagination_size)
+        n_tokens = sampling_index.total_stake
         if n_tokens == 0:
             raise self.NotEnoughStakers('There are no locked tokens for duration {}.'.format(duration))
 
         sample_size = quantity
         for _ in range(attempts):
             sample_size = math.ceil(sample_size * additional_ursulas)
-            points = sorted(system_random.randrange(n_tokens) for _ in range(sample_size))
+            points = [system_random.randrange(n_tokens) for _ in range(sample_size)]
             self.log.debug(f"Sampling {sample_size} stakers with random points: {points}")
 
-            addresses = set()
-            stakers = list(stakers_map.items())
-
-            point_index = 0
-            sum_of_locked_tokens = 0
-            staker_index = 0
-            stakers_len = len(stakers)
-            while staker_index < stakers_len and point_index < sample_size:
-                current_staker = stakers[staker_index][0]
-                staker_tokens = stakers[staker_index][1]
-                next_sum_value = sum_of_locked_tokens + staker_tokens
-
-                point = points[point_index]
-                if sum_of_locked_tokens <= point < next_sum_value:
-                    addresses.add(to_checksum_address(current_staker))
-                    point_index += 1
-                else:
-                    staker_index += 1
-                    sum_of_locked_tokens = next_sum_value
+            addresses = sampling_index.stakers_at(points)
 
             self.log.debug(f"Sampled {len(addresses)} stakers: {list(addresses)}")
             if len(addresses) >= quantity:
@@ -725,11 +778,31 @@ class StakingEscrowAgent(EthereumContractAgent):
 
         raise self.NotEnoughStakers('Selection failed after {} attempts'.format(attempts))
 
+    def get_sampling_index(self, duration: int, pagination_size: Optional[int] = None) -> StakerSamplingIndex:
+        """
+        The active stakers with tokens locked for `duration` periods, for sampling.  Built once per period, since
+        fetching them is a heavy call; stakes which change later in the period are seen in the next one,
+        unless this agent sends a transaction in the meantime.
+        """
+        current_period = self.get_current_period()
+        try:
+            return self.__sampling_indices[(current_period, duration)]
+        except KeyError:
+            _n_tokens, stakers_map = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
+            sampling_index = StakerSamplingIndex(stakers=stakers_map)
+            # Indices of past periods are of no further use.
+            self.__sampling_indices = {key: index for key, index in self.__sampling_indices.items()
+                                       if key[0] == current_period}
+            self.__sampling_indices[(current_period, duration)] = sampling_index
+            return sampling_index
+
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_completed_work(self, bidder_address: ChecksumAddress) -> Work:
         total_completed_work = self.contract.functions.getCompletedWork(bidder_address).call()
         return total_completed_work
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_missing_commitments(self, checksum_address: ChecksumAddress) -> int:
         # TODO: Move this up one layer, since it utilizes a combination of contract API methods.
@@ -848,23 +921,27 @@ class PolicyManagerAgent(EthereumContractAgent):
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=author_address)
         return receipt
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_fee_amount(self, staker_address: ChecksumAddress) -> Wei:
         fee_amount = self.contract.functions.nodes(staker_address).call()[0]
         return fee_amount
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_fee_rate_range(self) -> Tuple[Wei, Wei, Wei]:
         """Check minimum, default & maximum fee rate for all policies ('global fee range')"""
         minimum, default, maximum = self.contract.functions.feeRateRange().call()
         return minimum, default, maximum
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_min_fee_rate(self, staker_address: ChecksumAddress) -> Wei:
         """Check minimum fee rate that staker accepts"""
         min_rate = self.contract.functions.getMinFeeRate(staker_address).call()
         return min_rate
 
+    @cached_call
     @contract_api(CONTRACT_CALL)
     def get_raw_min_fee_rate(self, staker_address: ChecksumAddress) -> Wei:
         """Check minimum acceptable fee rate set by staker for their associated worker"""
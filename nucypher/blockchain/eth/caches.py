@@ -0,0 +1,150 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import time
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from threading import RLock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from eth_typing.evm import ChecksumAddress
+
+from twisted.logger import Logger
+
+
+class ContractCallCache:
+    """
+    A read-through cache for the contract calls of agents, valid for one block.
+
+    Agents with a call cache (see `EthereumContractAgent.call_cache`) serve the results of their methods marked
+    with `cached_call` from it, keyed by the method and its arguments.  Once a new block arrives, all of them
+    are called again.  Calls to methods with a TTL are instead kept for that many seconds, whatever the block;
+    this suits contract parameters which never change.  Sending a transaction through an agent clears its cache.
+
+    The block number is only checked every `block_number_ttl` seconds, so results may be that much older
+    than the latest block.
+    """
+
+    BLOCK_NUMBER_TTL = 1  # seconds
+    DEFAULT_TTLS = {
+        'staking_parameters': math.inf,  # Set when the contract is deployed.
+    }
+
+    def __init__(self,
+                 blockchain,
+                 ttls: Optional[Dict[str, float]] = None,
+                 block_number_ttl: Optional[float] = None):
+        self.log = Logger(self.__class__.__name__)
+        self.blockchain = blockchain
+        self.ttls = dict(self.DEFAULT_TTLS)
+        self.ttls.update(ttls or dict())
+        self.block_number_ttl = self.BLOCK_NUMBER_TTL if block_number_ttl is None else block_number_ttl
+
+        self.hits = Counter()    # By method name
+        self.misses = Counter()  # By method name
+        self.__lock = RLock()
+        self.__entries = dict()  # type: Dict[Tuple, Tuple[float, Any]]  # Expiry (a block number or time) and result
+        self.__timed_entries = dict()  # type: Dict[Tuple, Tuple[float, Any]]
+        self.__block_number = None
+        self.__block_number_checked = -math.inf
+
+    def __len__(self) -> int:
+        return len(self.__entries) + len(self.__timed_entries)
+
+    @property
+    def block_number(self) -> int:
+        """The latest block number, as of at most `block_number_ttl` seconds ago."""
+        now = time.monotonic()
+        with self.__lock:
+            if now - self.__block_number_checked >= self.block_number_ttl:
+                block_number = self.blockchain.client.block_number
+                self.__block_number_checked = now
+                if block_number != self.__block_number:
+                    self.__block_number = block_number
+                    self.__entries.clear()  # They're all from older blocks.
+            return self.__block_number
+
+    def call(self, agent, agent_method: Callable, args: tuple, kwargs: dict) -> Any:
+        """Returns the result of `agent_method` from the cache if it's still valid; otherwise, calls it."""
+        method_name = agent_method.__name__
+        key = (agent.contract_address, method_name, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return agent_method(agent, *args, **kwargs)  # These arguments can't be cached.
+
+        ttl = self.ttls.get(method_name)
+        if ttl is None:
+            entries, valid_until = self.__entries, self.block_number
+            is_valid = lambda expiry: expiry == valid_until
+        else:
+            entries, now = self.__timed_entries, time.monotonic()
+            valid_until = now + ttl
+            is_valid = lambda expiry: expiry > now
+
+        with self.__lock:
+            cached = entries.get(key)
+            if cached is not None and is_valid(cached[0]):
+                self.hits[method_name] += 1
+                return cached[1]
+            self.misses[method_name] += 1
+
+        result = agent_method(agent, *args, **kwargs)
+        with self.__lock:
+            entries[key] = (valid_until, result)
+        return result
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__timed_entries.clear()
+
+    def stats(self) -> dict:
+        with self.__lock:
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+            methods = {name: dict(hits=self.hits[name], misses=self.misses[name])
+                       for name in set(self.hits) | set(self.misses)}
+            return dict(hits=hits,
+                        misses=misses,
+                        hit_rate=hits / (hits + misses) if hits + misses else 0.0,
+                        entries=len(self),
+                        block_number=self.__block_number,
+                        methods=methods)
+
+
+class StakerSamplingIndex:
+    """
+    The active stakers of a period, laid end to end by their locked tokens for sampling (see StakingEscrowAgent.sample).
+    Each staker's stake spans [cumulative_stakes[i - 1], cumulative_stakes[i]); drawing a point is a binary search.
+    """
+
+    def __init__(self, stakers: Dict[ChecksumAddress, int]):
+        self.addresses = list(stakers.keys())  # type: List[ChecksumAddress]
+        self.cumulative_stakes = list(accumulate(stakers.values()))  # type: List[int]
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    @property
+    def total_stake(self) -> int:
+        return self.cumulative_stakes[-1] if self.cumulative_stakes else 0
+
+    def stakers_at(self, points: Iterable[int]) -> Set[ChecksumAddress]:
+        """The stakers whose stakes span each of `points`, which must each be less than `total_stake`."""
+        return {self.addresses[bisect_right(self.cumulative_stakes, point)] for point in points}
@@ -150,6 +150,36 @@ def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTE
         if COLLECT_CONTRACT_API:
             agent_method.contract_api = interface
         agent_method = validate_checksum_address(func=agent_method)
+        if interface is TRANSACTION:
+            agent_method = clears_caches(agent_method)
         return agent_method
 
     return decorator
+
+
+def cached_call(agent_method: Callable) -> Callable:
+    """
+    Serves the results of a contract call from the agent's call cache, if it has one.
+    Only for calls whose results are immutable, and which read nothing but the chain.
+    Goes above `contract_api`, so that addresses are validated as the call is made.
+    """
+    @functools.wraps(agent_method)
+    def wrapped(agent, *args, **kwargs):
+        call_cache = getattr(agent, 'call_cache', None)
+        if call_cache is None:
+            return agent_method(agent, *args, **kwargs)
+        return call_cache.call(agent, agent_method, args, kwargs)
+    return wrapped
+
+
+def clears_caches(agent_method: Callable) -> Callable:
+    """Clears what the agent cached from the chain once a transaction was sent, since it may have changed."""
+    @functools.wraps(agent_method)
+    def wrapped(agent, *args, **kwargs):
+        try:
+            return agent_method(agent, *args, **kwargs)
+        finally:
+            clear_caches = getattr(agent, 'clear_caches', None)
+            if clear_caches is not None:
+                clear_caches()
+    return wrapped
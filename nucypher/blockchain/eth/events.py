@@ -14,24 +14,48 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import json
+import os
+import socket
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from requests.exceptions import Timeout
+from twisted.logger import Logger
 from web3.contract import Contract
 
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
+from nucypher.config.constants import DEFAULT_CONFIG_ROOT
+
+
+@lru_cache(maxsize=1024)
+def get_block_timestamp(block_number: int) -> Optional[int]:
+    """The timestamp of a block, or None without a blockchain to ask.  Events tend to come a few to a block."""
+    try:
+        blockchain = BlockchainInterfaceFactory.get_interface()
+    except BlockchainInterfaceFactory.NoRegisteredInterfaces:
+        return None
+    return blockchain.client.w3.eth.getBlock(block_number)['timestamp']
 
 
 class EventRecord:
-    def __init__(self, event: dict):
+    def __init__(self, event: dict, timestamp: Optional[int] = None):
         self.raw_event = dict(event)
         self.args = dict(event['args'])
         self.block_number = event['blockNumber']
         self.transaction_hash = event['transactionHash'].hex()
+        self.__timestamp = timestamp
 
-        try:
-            blockchain = BlockchainInterfaceFactory.get_interface()
-        except BlockchainInterfaceFactory.NoRegisteredInterfaces:
-            self.timestamp = None
-        else:
-            self.timestamp = blockchain.client.w3.eth.getBlock(self.block_number)['timestamp'],
+    @property
+    def timestamp(self) -> Optional[int]:
+        """The timestamp of this event's block, which is only looked up if it's asked for."""
+        if self.__timestamp is None:
+            self.__timestamp = get_block_timestamp(self.block_number)
+        return self.__timestamp
 
     def __repr__(self):
         pairs_to_show = dict(self.args.items())
@@ -41,11 +65,308 @@ class EventRecord:
         return r
 
 
+class EventReader:
+    """
+    Reads a contract's events of one kind over a range of blocks, a window of blocks at a time, so that
+    neither the provider nor this process has to hold the whole range's events at once.
+
+    Windows shrink when the provider refuses one for returning too many results, and grow while they come
+    back sparse.  A window whose request times out is asked for again, up to TIMEOUT_RETRIES times.
+    With `prefetch`, the next window is fetched in the background while the events of the current one
+    are consumed.
+    """
+
+    INITIAL_WINDOW = 1_000  # blocks
+    MIN_WINDOW = 1
+    MAX_WINDOW = 100_000
+    TARGET_EVENTS_PER_WINDOW = 1_000  # Windows with less than half of this are grown, up to twice as large.
+
+    TIMEOUT_RETRIES = 3
+
+    # How providers refuse a query whose results are too large: with a JSON-RPC error code of its own
+    # (e.g. Infura's -32005), with a generic server error code and one of these messages (e.g. geth's -32000),
+    # or by refusing the request over HTTP outright.
+    TOO_MANY_RESULTS_CODES = (-32005,)
+    TOO_MANY_RESULTS_MESSAGES = ('query returned more than', 'response size exceeded')
+    SERVER_ERROR_CODE = -32000
+    TOO_MANY_RESULTS_HTTP_STATUS = 413
+
+    class RangeTooLarge(Exception):
+        """Raised when even a window of MIN_WINDOW blocks has too many results."""
+
+    def __init__(self,
+                 event_method,
+                 from_block: int,
+                 to_block: int,
+                 argument_filters: Optional[dict] = None,
+                 window: Optional[int] = None,
+                 max_window: Optional[int] = None,
+                 prefetch: bool = False):
+        self.log = Logger(self.__class__.__name__)
+        self.event_method = event_method
+        self.from_block = from_block
+        self.to_block = to_block
+        self.argument_filters = argument_filters or dict()
+        self.max_window = max_window or self.MAX_WINDOW
+        self.window = min(window or self.INITIAL_WINDOW, self.max_window)
+        self.prefetch = prefetch
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        for _start, _end, entries in self.windows():
+            for entry in entries:
+                yield EventRecord(entry)
+
+    @classmethod
+    def _is_too_many_results(cls, error: Exception) -> bool:
+        # web3 raises JSON-RPC errors as a ValueError carrying the error object.
+        rpc_error = error.args[0] if error.args and isinstance(error.args[0], dict) else None
+        if rpc_error is not None:
+            code = rpc_error.get('code')
+            if code in cls.TOO_MANY_RESULTS_CODES:
+                return True
+            message = str(rpc_error.get('message', '')).lower()
+            is_server_error = code == cls.SERVER_ERROR_CODE
+            return is_server_error and any(fragment in message for fragment in cls.TOO_MANY_RESULTS_MESSAGES)
+        response = getattr(error, 'response', None)
+        return getattr(response, 'status_code', None) == cls.TOO_MANY_RESULTS_HTTP_STATUS
+
+    @staticmethod
+    def _is_timeout(error: Exception) -> bool:
+        return isinstance(error, (Timeout, socket.timeout, TimeoutError))
+
+    def __get_logs(self, start: int, end: int) -> List[dict]:
+        return self.event_method.getLogs(argument_filters=self.argument_filters, fromBlock=start, toBlock=end)
+
+    def __adapt_window(self, events_in_window: int) -> None:
+        if events_in_window < self.TARGET_EVENTS_PER_WINDOW // 2:
+            self.window = min(self.window * 2, self.max_window)
+
+    def windows(self) -> Iterator[Tuple[int, int, List[dict]]]:
+        """Yields the first and last block of each window, and the window's events, in order."""
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='events') if self.prefetch else None
+        prefetched: Optional[Future] = None  # The current window's events, if they were prefetched.
+        retries = 0
+        try:
+            start = self.from_block
+            end = min(start + self.window - 1, self.to_block)
+            while start <= self.to_block:
+                try:
+                    entries = prefetched.result() if prefetched is not None else self.__get_logs(start, end)
+                except Exception as error:
+                    prefetched = None
+                    if self._is_timeout(error) and retries < self.TIMEOUT_RETRIES:
+                        retries += 1
+                        self.log.debug(f"Timed out reading blocks {start} to {end}; "
+                                       f"retrying ({retries} of {self.TIMEOUT_RETRIES}).")
+                        continue
+                    if not self._is_too_many_results(error):
+                        raise
+                    if end == start:
+                        raise self.RangeTooLarge(f"Too many events to read block {start} at once: {error}")
+                    self.window = max((end - start + 1) // 2, self.MIN_WINDOW)
+                    self.log.debug(f"Too many events in blocks {start} to {end}; reading {self.window} blocks at a time.")
+                    end = start + self.window - 1
+                    continue
+
+                retries = 0
+                self.__adapt_window(len(entries))
+                next_start = end + 1
+                next_end = min(next_start + self.window - 1, self.to_block)
+                if executor is not None and next_start <= self.to_block:
+                    prefetched = executor.submit(self.__get_logs, next_start, next_end)
+                yield start, end, entries
+                start, end = next_start, next_end
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+class EventStore:
+    """
+    A local index of contract events in SQLite, which is synced from the chain incrementally.
+
+    Each contract's events of each kind are synced from the block after the last one indexed for them,
+    in windows of at most `chunk_size` blocks (see EventReader), up to `confirmations` blocks behind the latest one.
+    The first sync of an event reads from block 0 unless told otherwise, since the registry doesn't record the
+    block each contract was deployed in.
+    Block timestamps are fetched once per block, and kept alongside the events.  Queries by block range
+    and by event arguments are then answered from the index alone.
+    """
+
+    DB_FILE_NAME = 'events.sqlite'
+    DEFAULT_DB_FILEPATH = os.path.join(DEFAULT_CONFIG_ROOT, DB_FILE_NAME)
+    CHUNK_SIZE = 10_000  # blocks
+    CONFIRMATIONS = 12  # How many of the latest blocks to leave out of the index, in case they're reorganized.
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS events (id integer primary key, contract_address text, event_name text, "
+        "block_number integer, log_index integer, transaction_hash text, args text, "
+        "UNIQUE (contract_address, event_name, block_number, log_index))",
+        "CREATE INDEX IF NOT EXISTS events_by_block ON events (contract_address, event_name, block_number)",
+        "CREATE TABLE IF NOT EXISTS event_arguments (event_id integer, name text, value text)",
+        "CREATE INDEX IF NOT EXISTS event_arguments_by_value ON event_arguments (name, value, event_id)",
+        "CREATE TABLE IF NOT EXISTS synced_blocks (contract_address text, event_name text, block_number integer, "
+        "PRIMARY KEY (contract_address, event_name))",
+        "CREATE TABLE IF NOT EXISTS block_timestamps (block_number integer primary key, timestamp integer)",
+    )
+
+    def __init__(self,
+                 db_filepath: str = ':memory:',
+                 chunk_size: Optional[int] = None,
+                 confirmations: Optional[int] = None):
+        self.log = Logger(self.__class__.__name__)
+        self.db_filepath = db_filepath
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.confirmations = self.CONFIRMATIONS if confirmations is None else confirmations
+        self.__db_conn = None  # Connected on first use; the configuration root may not exist yet.
+        self._lock = Lock()
+
+    @property
+    def db_conn(self) -> sqlite3.Connection:
+        if self.__db_conn is None:
+            self.__db_conn = sqlite3.connect(self.db_filepath, check_same_thread=False)
+            with self.__db_conn:
+                for statement in self.SCHEMA:
+                    self.__db_conn.execute(statement)
+        return self.__db_conn
+
+    #
+    # Arguments
+    #
+
+    @staticmethod
+    def _encode_argument(value) -> list:
+        """A JSON-friendly argument value, tagged with its type so that it's decoded as it was."""
+        if isinstance(value, (bytes, bytearray)):
+            return ['bytes', HexBytes(value).hex()]
+        if isinstance(value, (list, tuple)):
+            return ['list', [EventStore._encode_argument(item) for item in value]]
+        return ['value', value]
+
+    @staticmethod
+    def _decode_argument(encoded: list):
+        kind, value = encoded
+        if kind == 'bytes':
+            return HexBytes(value)
+        if kind == 'list':
+            return [EventStore._decode_argument(item) for item in value]
+        return value
+
+    @staticmethod
+    def _argument_key(value) -> str:
+        """How an argument's value is indexed, and looked up."""
+        return json.dumps(EventStore._encode_argument(value))
+
+    #
+    # Sync
+    #
+
+    def last_synced_block(self, contract_address: str, event_name: str) -> Optional[int]:
+        with self._lock:
+            row = self.db_conn.execute("SELECT block_number FROM synced_blocks WHERE contract_address=? AND event_name=?",
+                                       (contract_address, event_name)).fetchone()
+        return row[0] if row else None
+
+    def sync(self, contract: Contract, event_name: str, from_block: int = 0, to_block: Optional[int] = None) -> int:
+        """
+        Indexes `contract`'s `event_name` events up to `to_block` (or the latest confirmed block), from the block
+        after the last one indexed for them, or `from_block` if there's none.  Returns the last block indexed.
+        """
+        w3 = contract.web3
+        latest_confirmed_block = w3.eth.blockNumber - self.confirmations
+        to_block = latest_confirmed_block if to_block is None else min(to_block, latest_confirmed_block)
+        last_synced_block = self.last_synced_block(contract.address, event_name)
+        start = from_block if last_synced_block is None else last_synced_block + 1
+
+        reader = EventReader(event_method=getattr(contract.events, event_name),
+                             from_block=start,
+                             to_block=to_block,
+                             window=self.chunk_size,
+                             max_window=self.chunk_size)
+        for start, end, entries in reader.windows():
+            self.__store(w3, contract.address, event_name, entries, synced_block=end)
+            self.log.debug(f"Indexed {len(entries)} {event_name} events from blocks {start} to {end}")
+        return self.last_synced_block(contract.address, event_name)
+
+    def __store(self, w3, contract_address: str, event_name: str, entries: Iterable[dict], synced_block: int) -> None:
+        entries = list(entries)
+        block_numbers = tuple({entry['blockNumber'] for entry in entries})
+        with self._lock:
+            known_blocks = {row[0] for row in self.db_conn.execute(
+                "SELECT block_number FROM block_timestamps WHERE block_number IN ({})".format(','.join('?' * len(block_numbers))),
+                block_numbers)}
+        new_blocks = set(block_numbers) - known_blocks
+        timestamps = [(block_number, w3.eth.getBlock(block_number)['timestamp']) for block_number in sorted(new_blocks)]
+
+        with self._lock, self.db_conn:
+            self.db_conn.executemany("INSERT OR IGNORE INTO block_timestamps VALUES (?,?)", timestamps)
+            for entry in entries:
+                args = {name: self._encode_argument(value) for name, value in entry['args'].items()}
+                cursor = self.db_conn.execute("INSERT OR IGNORE INTO events "
+                                              "(contract_address, event_name, block_number, log_index, transaction_hash, args) "
+                                              "VALUES (?,?,?,?,?,?)",
+                                              (contract_address, event_name, entry['blockNumber'], entry['logIndex'],
+                                               HexBytes(entry['transactionHash']).hex(), json.dumps(args)))
+                if not cursor.rowcount:
+                    continue  # Already indexed
+                self.db_conn.executemany("INSERT INTO event_arguments VALUES (?,?,?)",
+                                         ((cursor.lastrowid, name, self._argument_key(value))
+                                          for name, value in entry['args'].items()))
+            self.db_conn.execute("REPLACE INTO synced_blocks VALUES (?,?,?)", (contract_address, event_name, synced_block))
+
+    #
+    # Queries
+    #
+
+    def query(self,
+              contract_address: str,
+              event_name: str,
+              from_block: int = 0,
+              to_block: Optional[int] = None,
+              **argument_filters) -> Iterable[EventRecord]:
+        """
+        The indexed events within the block range, in the order they were emitted.  Each argument filter
+        matches a single value, or any of a list of values.
+        """
+        conditions = ["events.contract_address=?", "events.event_name=?", "events.block_number>=?"]
+        parameters = [contract_address, event_name, from_block]
+        if to_block is not None:
+            conditions.append("events.block_number<=?")
+            parameters.append(to_block)
+        for name, value in argument_filters.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            conditions.append("events.id IN (SELECT event_id FROM event_arguments WHERE name=? AND value IN ({}))".format(
+                ','.join('?' * len(values))))
+            parameters.extend([name, *(self._argument_key(v) for v in values)])
+
+        statement = ("SELECT events.block_number, events.log_index, events.transaction_hash, events.args, "
+                     "block_timestamps.timestamp FROM events "
+                     "LEFT JOIN block_timestamps ON events.block_number = block_timestamps.block_number "
+                     "WHERE {} ORDER BY events.block_number, events.log_index".format(" AND ".join(conditions)))
+        with self._lock:
+            rows = self.db_conn.execute(statement, parameters).fetchall()
+
+        for block_number, log_index, transaction_hash, args, timestamp in rows:
+            event = dict(event=event_name,
+                         address=contract_address,
+                         args={name: self._decode_argument(value) for name, value in json.loads(args).items()},
+                         blockNumber=block_number,
+                         logIndex=log_index,
+                         transactionHash=HexBytes(transaction_hash))
+            yield EventRecord(event, timestamp=timestamp)
+
+    def clear(self) -> None:
+        with self._lock, self.db_conn:
+            for table in ('events', 'event_arguments', 'synced_blocks', 'block_timestamps'):
+                self.db_conn.execute(f"DELETE FROM {table}")
+
+
 class ContractEvents:
 
-    def __init__(self, contract: Contract):
+    def __init__(self, contract: Contract, event_store: Optional[EventStore] = None):
         self.contract = contract
         self.names = tuple(e.event_name for e in contract.events)
+        self.event_store = event_store  # Opt-in; when set, events are synced to it and read from it.
 
     def __get_web3_event_by_name(self, event_name: str):
         if event_name not in self.names:
@@ -60,15 +381,26 @@ class ContractEvents:
 
             if from_block is None:
                 from_block = 0  # TODO: we can do better. Get contract creation block.
-            if to_block is None:
-                to_block = 'latest'
 
-            event_filter = event_method.createFilter(fromBlock=from_block,
-                                                     toBlock=to_block,
-                                                     argument_filters=argument_filters)
-            entries = event_filter.get_all_entries()
-            for entry in entries:
-                yield EventRecord(entry)
+            if self.event_store is not None:
+                if to_block == 'latest':
+                    to_block = None
+                self.event_store.sync(contract=self.contract, event_name=event_name, to_block=to_block)
+                yield from self.event_store.query(contract_address=self.contract.address,
+                                                  event_name=event_name,
+                                                  from_block=from_block,
+                                                  to_block=to_block,
+                                                  **argument_filters)
+                return
+
+            if to_block is None or to_block == 'latest':
+                to_block = self.contract.web3.eth.blockNumber
+
+            # Read a window of blocks at a time, rather than the whole range's events in one response.
+            yield from EventReader(event_method=event_method,
+                                   from_block=from_block,
+                                   to_block=to_block,
+                                   argument_filters=argument_filters)
         return wrapper
 
     def __getattr__(self, event_name: str):
@@ -34,10 +34,13 @@ from constant_sorrow.constants import (
 from eth_tester import EthereumTester
 from eth_tester.exceptions import TransactionFailed as TestTransactionFailed
 from eth_utils import to_checksum_address
+from hexbytes import HexBytes
 from twisted.logger import Logger
-from typing import Callable, List, NamedTuple, Tuple, Union
+from typing import Any, Callable, List, NamedTuple, Tuple, Union
 from urllib.parse import urlparse
 from web3 import HTTPProvider, IPCProvider, Web3, WebsocketProvider, middleware
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.contract import Contract, ContractConstructor, ContractFunction
 from web3.exceptions import TimeExhausted, ValidationError
 from web3.gas_strategies import time_based
@@ -75,6 +78,7 @@ class BlockchainInterface:
     """
 
     TIMEOUT = 600  # seconds  # TODO: Correlate with the gas strategy - #2070
+    BATCH_CALL_SIZE = 100  # calls per JSON-RPC batch request
 
     DEFAULT_GAS_STRATEGY = 'medium'
     GAS_STRATEGIES = {'glacial': time_based.glacial_gas_price_strategy,     # 24h
@@ -579,6 +583,49 @@ class BlockchainInterface:
     def get_blocktime(self):
         return self.client.get_blocktime()
 
+    def batch_call(self, contract_functions: List[ContractFunction], batch_size: int = None) -> List[Any]:
+        """
+        Calls each of `contract_functions`, returning their results in the same order.
+
+        Over HTTP, the calls are sent as JSON-RPC batch requests of up to `batch_size` calls each,
+        rather than one request per call.  Other providers (IPC, websockets, eth-tester) get them one at a time.
+        """
+        if not isinstance(self.provider, HTTPProvider):
+            return [contract_function.call() for contract_function in contract_functions]
+
+        batch_size = batch_size or self.BATCH_CALL_SIZE
+        results = list()
+        for start in range(0, len(contract_functions), batch_size):
+            results.extend(self.__batch_call(contract_functions[start:start + batch_size]))
+        return results
+
+    def __batch_call(self, contract_functions: List[ContractFunction]) -> List[Any]:
+        batch = [dict(jsonrpc='2.0',
+                      id=request_id,
+                      method='eth_call',
+                      params=[dict(to=contract_function.address, data=contract_function._encode_transaction_data()), 'latest'])
+                 for request_id, contract_function in enumerate(contract_functions)]
+        response = requests.post(self.provider.endpoint_uri, json=batch, **self.provider.get_request_kwargs())
+        response.raise_for_status()
+        replies = response.json()
+        if not isinstance(replies, list):  # This endpoint doesn't take batches.
+            replies = list()
+        replies = {reply.get('id'): reply for reply in replies}
+
+        results = list()
+        for request_id, contract_function in enumerate(contract_functions):
+            reply = replies.get(request_id, dict())
+            if 'result' not in reply:
+                # Make this call again on its own, so that it fails (or not) just as it would have.
+                self.log.debug(f"Batched call to {contract_function.fn_name} failed ({reply.get('error')}); retrying.")
+                results.append(contract_function.call())
+                continue
+            output_types = get_abi_output_types(contract_function.abi)
+            output_data = self.w3.codec.decode_abi(output_types, HexBytes(reply['result']))
+            normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+            results.append(normalized_data[0] if len(normalized_data) == 1 else normalized_data)
+        return results
+
     @validate_checksum_address
     def send_transaction(self,
                          contract_function: Union[ContractFunction, ContractConstructor],
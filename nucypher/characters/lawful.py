@@ -17,13 +17,14 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import json
 from base64 import b64decode, b64encode
-from collections import OrderedDict
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from random import shuffle
 
 import maya
 import time
 from bytestring_splitter import BytestringKwargifier, BytestringSplitter, BytestringSplittingError, \
-    VariableLengthBytestring
+    VARIABLE_HEADER_LENGTH, VariableLengthBytestring
 from constant_sorrow import constants
 from constant_sorrow.constants import INCLUDED_IN_BYTESTRING, PUBLIC_ONLY, STRANGER_ALICE
 from cryptography.hazmat.backends import default_backend
@@ -40,7 +41,6 @@ from twisted.internet import reactor, stdio, threads
 from twisted.internet.task import LoopingCall
 from twisted.logger import Logger
 from typing import Dict, Iterable, List, Set, Tuple, Union
-from umbral import pre
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 from umbral.pre import UmbralCorrectnessError
@@ -68,12 +68,16 @@ from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import DecryptingPower, DelegatingPower, PowerUpError, SigningPower, TransactingPower
 from nucypher.crypto.signing import InvalidSignature
 from nucypher.datastore.keypairs import HostingKeypair
+from nucypher.datastore.group_commit import WorkOrderCommitQueue
+from nucypher.datastore.kfrags import DecodedKFragCache
 from nucypher.datastore.threading import ThreadedSession
+from nucypher.datastore.treasure_maps import TreasureMapStore
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.nodes import NodeSprout, Teacher
 from nucypher.network.protocols import InterfaceInfo, parse_node_uri
+from nucypher.network.reencryption import ReencryptionEngine
 from nucypher.network.server import ProxyRESTServer, TLSHostingPower, make_rest_app
 from nucypher.network.trackers import AvailabilityTracker
 
@@ -195,6 +199,9 @@ class Alice(Character, BlockchainPolicyAuthor):
         Generates KFrags and attaches them.
         """
 
+        negotiation_params = dict(negotiation_workers=policy_params.pop('negotiation_workers', 1),
+                                  negotiation_timeout=policy_params.pop('negotiation_timeout', None),
+                                  treasure_map_replicas=policy_params.pop('treasure_map_replicas', None))
         policy_params = self.generate_policy_parameters(**policy_params)
         N = policy_params.pop('n')
 
@@ -209,7 +216,8 @@ class Alice(Character, BlockchainPolicyAuthor):
                        kfrags=kfrags,
                        public_key=public_key,
                        m=policy_params['m'],
-                       expiration=policy_params['expiration'])
+                       expiration=policy_params['expiration'],
+                       **negotiation_params)
 
         if self.federated_only:
             # Use known nodes
@@ -443,9 +451,14 @@ class Bob(Character):
         def __init__(self, evidence: List):
             self.evidence = evidence
 
-    def __init__(self, controller: bool = True, *args, **kwargs) -> None:
+    def __init__(self, controller: bool = True, retrieval_concurrency: int = 1, *args, **kwargs) -> None:
         Character.__init__(self, known_node_class=Ursula, *args, **kwargs)
 
+        # How many WorkOrders may be in flight at once during retrieval; 1 keeps the serial behavior.
+        if retrieval_concurrency < 1:
+            raise ValueError(f"retrieval_concurrency must be at least 1, got {retrieval_concurrency}.")
+        self.retrieval_concurrency = retrieval_concurrency
+
         if controller:
             self.make_cli_controller()
 
@@ -537,8 +550,7 @@ class Bob(Character):
             # plans to learn about any more, than this function will surely fail.
             raise self.NotEnoughTeachers
 
-        treasure_map = self.get_treasure_map_from_known_ursulas(self.network_middleware,
-                                                                map_id)
+        treasure_map = self.get_treasure_map_from_known_ursulas(self.network_middleware, map_id)
 
         alice = Alice.from_public_keys(verifying_key=alice_verifying_key)
         compass = self.make_compass_for_alice(alice)
@@ -567,9 +579,13 @@ class Bob(Character):
         """
         Iterate through the nodes we know, asking for the TreasureMap.
         Return the first one who has it.
+
+        Nodes are asked in the rendezvous order Alice uses to pick the map's replica holders
+        (see Policy's treasure_map_replicas), so those holders are asked first, and then everyone else.
         """
         from nucypher.policy.collections import TreasureMap
-        for node in self.known_nodes.shuffled():
+        known_nodes = self.known_nodes.shuffled()  # A snapshot, safe from learning on another thread.
+        for node in TreasureMap.rank_nodes_for_map(map_id, known_nodes):
             try:
                 response = network_middleware.get_treasure_map_from_node(node=node, map_id=map_id)
             except NodeSeemsToBeDown:
@@ -669,6 +685,88 @@ class Bob(Character):
 
         return cfrags
 
+    def _attach_cfrags_from_work_order(self, work_order, capsules_to_activate: set, m: int, grievances: list) -> None:
+        for capsule, pre_task in work_order.tasks.items():
+            try:
+                capsule.attach_cfrag(pre_task.cfrag)
+            except UmbralCorrectnessError:
+                task = work_order.tasks[0]
+                # TODO: WARNING - This block is untested.
+                from nucypher.policy.collections import IndisputableEvidence
+                evidence = IndisputableEvidence(task=task, work_order=work_order)
+                # I got a lot of problems with you people ...
+                grievances.append(evidence)
+
+            if len(capsule) >= m:
+                capsules_to_activate.discard(capsule)
+
+    def _reencrypt_work_orders_concurrently(self,
+                                            work_orders: Iterable,
+                                            capsules_to_activate: set,
+                                            m: int,
+                                            retain_cfrags: bool,
+                                            grievances: list) -> bool:
+        """
+        Sends up to `retrieval_concurrency` WorkOrders at a time, attaching CFrags as responses arrive.
+        A WorkOrder is only sent while some capsule in it is still short of m CFrags, counting those already
+        requested, so extra Ursulas are only asked when one fails to deliver.  As soon as every capsule has m CFrags,
+        outstanding requests are cancelled (or, if already on the wire, abandoned and their responses discarded).
+        Returns True if every capsule was activated.
+
+        Only the network round trip happens on the worker threads; verifying the response, recording the
+        WorkOrder and attaching CFrags all happen on the calling thread.
+        """
+        pending = deque(work_orders)
+        in_flight = dict()
+        executor = ThreadPoolExecutor(max_workers=self.retrieval_concurrency,
+                                      thread_name_prefix=f"{self.__class__.__name__}-retrieval")
+        try:
+            while capsules_to_activate:
+
+                # Top up the window with WorkOrders for capsules still short of m, counting CFrags already on their way.
+                while pending and len(in_flight) < self.retrieval_concurrency:
+                    work_order = pending.popleft()
+                    outstanding = Counter(capsule for wo in in_flight.values() for capsule in wo.tasks)
+                    if not any(len(capsule) + outstanding[capsule] < m for capsule in work_order.tasks):
+                        continue
+                    future = executor.submit(self.network_middleware.reencrypt, work_order)
+                    in_flight[future] = work_order
+
+                if not in_flight:
+                    break  # Out of Ursulas to ask.
+
+                done, _not_done = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    work_order = in_flight.pop(future)
+                    try:
+                        cfrags_and_signatures = future.result()
+                    except NodeSeemsToBeDown:
+                        # TODO: What to do here?  Ursula isn't supposed to be down.  NRN
+                        self.log.info(
+                            f"Ursula ({work_order.ursula}) seems to be down while trying to complete WorkOrder: {work_order}")
+                        continue
+                    except self.network_middleware.NotFound:
+                        # TODO: What's the thing to do here?  Do we want to track these Ursulas in some way in case they're lying?  567
+                        self.log.warn(
+                            f"Ursula ({work_order.ursula}) claims not to have the KFrag to complete WorkOrder: {work_order}.  Has accessed been revoked?")
+                        continue
+
+                    work_order.complete(cfrags_and_signatures)
+                    self._completed_work_orders.save_work_order(work_order, as_replete=retain_cfrags)
+                    self._attach_cfrags_from_work_order(work_order=work_order,
+                                                        capsules_to_activate=capsules_to_activate,
+                                                        m=m,
+                                                        grievances=grievances)
+                    if not capsules_to_activate:
+                        break
+        finally:
+            # First m wins: whatever is still outstanding is no longer needed.
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        return not capsules_to_activate
+
     def join_policy(self, label, alice_verifying_key, node_list=None, block=False):
         if node_list:
             self._node_ids_to_learn_about_immediately.update(node_list)
@@ -769,7 +867,21 @@ class Bob(Character):
             # TODO Optimization: Block here (or maybe even later) until map is done being followed (instead of blocking above). #1114
             the_airing_of_grievances = []
 
+            if self.retrieval_concurrency > 1:
+                all_activated = self._reencrypt_work_orders_concurrently(work_orders=new_work_orders.values(),
+                                                                         capsules_to_activate=capsules_to_activate,
+                                                                         m=m,
+                                                                         retain_cfrags=retain_cfrags,
+                                                                         grievances=the_airing_of_grievances)
+                if not all_activated:
+                    raise Ursula.NotEnoughUrsulas(
+                        "Unable to reach m Ursulas.  See the logs for which Ursulas are down or noncompliant.")
+
             for work_order in new_work_orders.values():
+                # Nothing left to do if the concurrent fan-out above already activated every capsule.
+                if not capsules_to_activate:
+                    break
+
                 for capsule in work_order.tasks:
                     work_order_is_useful = False
                     if len(capsule) >= m:
@@ -801,19 +913,10 @@ class Bob(Character):
                         f"Ursula ({work_order.ursula}) claims not to have the KFrag to complete WorkOrder: {work_order}.  Has accessed been revoked?")
                     continue
 
-                for capsule, pre_task in work_order.tasks.items():
-                    try:
-                        capsule.attach_cfrag(pre_task.cfrag)
-                    except UmbralCorrectnessError:
-                        task = work_order.tasks[0]
-                        # TODO: WARNING - This block is untested.
-                        from nucypher.policy.collections import IndisputableEvidence
-                        evidence = IndisputableEvidence(task=task, work_order=work_order)
-                        # I got a lot of problems with you people ...
-                        the_airing_of_grievances.append(evidence)
-
-                    if len(capsule) >= m:
-                        capsules_to_activate.discard(capsule)
+                self._attach_cfrags_from_work_order(work_order=work_order,
+                                                    capsules_to_activate=capsules_to_activate,
+                                                    m=m,
+                                                    grievances=the_airing_of_grievances)
 
                 # If all the capsules are now activated, we can stop here.
                 if not capsules_to_activate:
@@ -918,6 +1021,10 @@ class Ursula(Teacher, Character, Worker):
                  availability_check: bool = True,
                  prune_datastore: bool = True,
                  metrics_port: int = None,
+                 reencryption_workers: int = 0,
+                 datastore_profile: str = 'default',
+                 workorder_group_commit: bool = False,
+                 async_workorder_persistence: bool = False,
 
                  # Blockchain
                  decentralized_identity_evidence: bytes = constants.NOT_SIGNED,
@@ -966,9 +1073,6 @@ class Ursula(Teacher, Character, Worker):
 
         if is_me:
 
-            # In-Memory TreasureMap tracking
-            self._stored_treasure_maps = dict()
-
             # Learner
             self._start_learning_now = start_learning_now
 
@@ -984,6 +1088,15 @@ class Ursula(Teacher, Character, Worker):
             # Prometheus / Metrics
             self._metrics_port = metrics_port
 
+            # Work order persistence; see WorkOrderCommitQueue
+            self.workorder_commit_queue = None
+
+            # Decoded KFrags of hot arrangements, for the reencrypt endpoint
+            self.kfrag_cache = DecodedKFragCache()
+
+            # Re-encryption
+            self.reencryption_engine = ReencryptionEngine(stamp=self.stamp, workers=reencryption_workers)
+
         #
         # Ursula the Decentralized Worker (Self)
         #
@@ -1027,6 +1140,7 @@ class Ursula(Teacher, Character, Worker):
                     this_node=self,
                     db_filepath=db_filepath,
                     serving_domains=domains,
+                    datastore_profile=datastore_profile,
                 )
 
                 # TLSHostingPower (Ephemeral Powers and Private Keys)
@@ -1037,6 +1151,15 @@ class Ursula(Teacher, Character, Worker):
                                                    rest_app=rest_app, datastore=datastore,
                                                    hosting_power=tls_hosting_power)
 
+                # Persistent TreasureMap tracking
+                self.treasure_maps = TreasureMapStore(datastore=datastore)
+
+                # Answering Bob doesn't need to wait for his work order to be written if it's asynchronous.
+                if workorder_group_commit or async_workorder_persistence:
+                    self.workorder_commit_queue = WorkOrderCommitQueue(datastore=datastore,
+                                                                       asynchronous=async_workorder_persistence)
+                    self.workorder_commit_queue.start()
+
             #
             # Stranger-Ursula
             #
@@ -1098,6 +1221,18 @@ class Ursula(Teacher, Character, Worker):
             if result > 0:
                 self.log.debug(f"Pruned {result} policy arrangements.")
 
+        self.kfrag_cache.prune(now=now)
+
+        try:
+            # Unlike the arrangements', treasure map expirations are in UTC.
+            utc_now = datetime.utcfromtimestamp(self._arrangement_pruning_task.clock.seconds())
+            result = self.treasure_maps.prune(now=utc_now)
+        except OperationalError:
+            self.log.warn("Failed to prune treasure maps; DB session rolled back.")
+        else:
+            if result > 0:
+                self.log.debug(f"Pruned {result} treasure maps.")
+
     def run(self,
             emitter: StdoutEmitter = None,
             hendrix: bool = True,
@@ -1192,6 +1327,9 @@ class Ursula(Teacher, Character, Worker):
             self.work_tracker.stop()
         if self._arrangement_pruning_task.running:
             self._arrangement_pruning_task.stop()
+        self.reencryption_engine.shutdown(wait=False)
+        if self.workorder_commit_queue:
+            self.workorder_commit_queue.stop()
         if halt_reactor:
             reactor.stop()
 
@@ -1217,7 +1355,13 @@ class Ursula(Teacher, Character, Worker):
         return self._crypto_power.power_ups(TLSHostingPower).keypair.certificate
 
     def __bytes__(self):
+        # Re-encoding the certificate every time we're served to a learner adds up; our metadata only
+        # changes when we re-sign it, which forgets this (see Teacher._forget_serialized_metadata).
+        if self._metadata_bytes is None:
+            self._metadata_bytes = self._serialize_metadata()
+        return self._metadata_bytes
 
+    def _serialize_metadata(self) -> bytes:
         version = self.TEACHER_VERSION.to_bytes(2, "big")
         interface_info = VariableLengthBytestring(bytes(self.rest_interface))
         decentralized_identity_evidence = VariableLengthBytestring(self.decentralized_identity_evidence)
@@ -1358,6 +1502,10 @@ class Ursula(Teacher, Character, Worker):
         temp_node_storage.forget()
         return potential_seed_node
 
+    # What follows the timestamp in an Ursula's metadata takes at least this many bytes: the interface
+    # signature, both keys, and the length headers of the evidence, certificate and REST interface.
+    _MIN_METADATA_TAIL_LENGTH = Signature.expected_bytes_length() + 2 * PUBLIC_KEY_LENGTH + 3 * VARIABLE_HEADER_LENGTH
+
     @classmethod
     def internal_splitter(cls, splittable, partial=False):
         splitter = BytestringKwargifier(
@@ -1440,24 +1588,36 @@ class Ursula(Teacher, Character, Worker):
                          fail_fast: bool = False,
                          ) -> List['Ursula']:
 
-        node_splitter = BytestringSplitter(VariableLengthBytestring)
-        nodes_vbytes = node_splitter.repeat(ursulas_as_bytes)
-        version_splitter = BytestringSplitter((int, 2, {"byteorder": "big"}))
-        versions_and_node_bytes = [version_splitter(n, return_remainder=True) for n in nodes_vbytes]
-
+        # Rather than copying each node's bytes out of the payload and splitting them up front,
+        # each sprout refers to its own slice of the payload, and reads only what it's asked for.
+        payload = memoryview(ursulas_as_bytes)
         sprouts = []
-        for version, node_bytes in versions_and_node_bytes:
-            try:
-                sprout = cls.from_bytes(node_bytes,
-                                        version=version,
-                                        registry=registry)
-            except Ursula.IsFromTheFuture as e:
-                if fail_fast:
-                    raise
-                else:
-                    cls.log.warn(e.args[0])
-            else:
-                sprouts.append(sprout)
+        cursor = 0
+        while cursor < len(payload):
+            node_length = int.from_bytes(payload[cursor:cursor + VARIABLE_HEADER_LENGTH], "big")
+            cursor += VARIABLE_HEADER_LENGTH
+            node_view = payload[cursor:cursor + node_length]
+            cursor += node_length
+            if len(node_view) != node_length or node_length < 2:
+                raise BytestringSplittingError(f"Node claimed a length of {node_length}, "
+                                               f"but only {len(node_view)} bytes are left.")
+
+            version = int.from_bytes(node_view[:2], "big")
+            if version > cls.LEARNER_VERSION:
+                try:
+                    cls.from_bytes(bytes(node_view[2:]), version=version, registry=registry)
+                except Ursula.IsFromTheFuture as e:
+                    if fail_fast:
+                        raise
+                    else:
+                        cls.log.warn(e.args[0])
+                continue
+
+            sprout = NodeSprout.from_view(node_view[2:],
+                                          splitter=cls.internal_splitter,
+                                          receiver=cls.from_processed_bytes,
+                                          min_tail_length=cls._MIN_METADATA_TAIL_LENGTH)
+            sprouts.append(sprout)
         return sprouts
 
     @classmethod
@@ -1503,7 +1663,13 @@ class Ursula(Teacher, Character, Worker):
     # Work Orders & Re-Encryption
     #
 
-    def work_orders(self, bob=None) -> List['WorkOrder']:
+    def work_orders(self, bob=None, flush: bool = True, flush_timeout: float = None) -> List['WorkOrder']:
+        """
+        Work orders Ursula has accepted, from `bob` or from everyone.  Unless `flush` is False, those still
+        queued for writing when this is called are waited on (for up to `flush_timeout` seconds) and included.
+        """
+        if flush and self.workorder_commit_queue:
+            self.workorder_commit_queue.flush(timeout=flush_timeout)  # Read our own writes.
         with ThreadedSession(self.datastore.engine):
             if not bob:  # All
                 return self.datastore.get_workorders()
@@ -1511,30 +1677,11 @@ class Ursula(Teacher, Character, Worker):
                 work_orders_from_bob = self.datastore.get_workorders(bob_verifying_key=bytes(bob.stamp))
                 return work_orders_from_bob
 
-    def _reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey):
-
-        # Prepare a bytestring for concatenating re-encrypted
-        # capsule data for each work order task.
-        cfrag_byte_stream = bytes()
-        for task in work_order.tasks:
-            # Ursula signs on top of Bob's signature of each task.
-            # Now both are committed to the same task.  See #259.
-            reencryption_metadata = bytes(self.stamp(bytes(task.signature)))
-
-            # Ursula sets Alice's verifying key for capsule correctness verification.
-            capsule = task.capsule
-            capsule.set_correctness_keys(verifying=alice_verifying_key)
-
-            # Then re-encrypts the fragment.
-            cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)  # <--- pyUmbral
-            self.log.info(f"Re-encrypted capsule {capsule} -> made {cfrag}.")
-
-            # Next, Ursula signs to commit to her results.
-            reencryption_signature = self.stamp(bytes(cfrag))
-            cfrag_byte_stream += VariableLengthBytestring(cfrag) + reencryption_signature
-
-        # ... and finally returns all the re-encrypted bytes
-        return cfrag_byte_stream
+    def _reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey) -> bytes:
+        # Returns the concatenated re-encrypted capsule data for each work order task.
+        return self.reencryption_engine.reencrypt(kfrag=kfrag,
+                                                  work_order=work_order,
+                                                  alice_verifying_key=alice_verifying_key)
 
 
 class Enrico(Character):
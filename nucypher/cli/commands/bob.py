@@ -33,6 +33,7 @@ from nucypher.cli.options import (
     option_checksum_address,
     option_config_file,
     option_config_root,
+    option_connection_pooling,
     option_controller_port,
     option_dev,
     option_discovery_port,
@@ -69,7 +70,8 @@ class BobConfigOptions:
                  middleware: RestMiddleware,
                  federated_only: bool,
                  gas_strategy: str,
-                 signer_uri: str):
+                 signer_uri: str,
+                 connection_pooling: bool):
 
         self.provider_uri = provider_uri
         self.signer_uri = signer_uri
@@ -81,6 +83,7 @@ class BobConfigOptions:
         self.dev = dev
         self.middleware = middleware
         self.federated_only = federated_only
+        self.connection_pooling = connection_pooling
 
     def create_config(self, emitter: StdoutEmitter, config_file: str) -> BobConfiguration:
         if self.dev:
@@ -93,7 +96,8 @@ class BobConfigOptions:
                 signer_uri=self.signer_uri,
                 federated_only=True,
                 checksum_address=self.checksum_address,
-                network_middleware=self.middleware)
+                network_middleware=self.middleware,
+                connection_pooling=self.connection_pooling)
         else:
             try:
                 return BobConfiguration.from_configuration_file(
@@ -106,7 +110,8 @@ class BobConfigOptions:
                     signer_uri=self.signer_uri,
                     gas_strategy=self.gas_strategy,
                     registry_filepath=self.registry_filepath,
-                    network_middleware=self.middleware)
+                    network_middleware=self.middleware,
+                    connection_pooling=self.connection_pooling)
             except FileNotFoundError:
                 handle_missing_configuration_file(character_config_class=BobConfiguration,
                                                   config_file=config_file)
@@ -129,6 +134,7 @@ class BobConfigOptions:
             provider_uri=self.provider_uri,
             signer_uri=self.signer_uri,
             gas_strategy=self.gas_strategy,
+            connection_pooling=self.connection_pooling,
         )
 
     def get_updates(self) -> dict:
@@ -138,7 +144,8 @@ class BobConfigOptions:
                        registry_filepath=self.registry_filepath,
                        provider_uri=self.provider_uri,
                        signer_uri=self.signer_uri,
-                       gas_strategy=self.gas_strategy
+                       gas_strategy=self.gas_strategy,
+                       connection_pooling=self.connection_pooling
                        )
         # Depends on defaults being set on Configuration classes, filtrates None values
         updates = {k: v for k, v in payload.items() if v is not None}
@@ -156,7 +163,8 @@ group_config_options = group_options(
     discovery_port=option_discovery_port(),
     dev=option_dev,
     middleware=option_middleware,
-    federated_only=option_federated_only
+    federated_only=option_federated_only,
+    connection_pooling=option_connection_pooling
 )
 
 
@@ -25,6 +25,7 @@ from nucypher.blockchain.eth.constants import (
     POLICY_MANAGER_CONTRACT_NAME,
     STAKING_ESCROW_CONTRACT_NAME
 )
+from nucypher.blockchain.eth.events import EventStore
 from nucypher.blockchain.eth.utils import datetime_at_period
 from nucypher.cli.config import group_general_config
 from nucypher.cli.options import (
@@ -120,12 +121,20 @@ def locked_tokens(general_config, registry_options, periods):
 @option_event_name
 @click.option('--from-block', help="Collect events from this block number", type=click.INT)
 @click.option('--to-block', help="Collect events until this block number", type=click.INT)
+@click.option('--event-store', help=f"Sync events to, and read them from, a local index at this path "
+                                    f"(e.g. {EventStore.DEFAULT_DB_FILEPATH}).  The first sync reads each event "
+                                    f"from block 0, which can take a while; later ones only read the new blocks, "
+                                    f"up to {EventStore.CONFIRMATIONS} blocks behind the latest one",
+              type=click.Path(dir_okay=False))
 # TODO: Add options for number of periods in the past (default current period), or range of blocks
 # TODO: Add way to input additional event filters? (e.g., staker, etc)
-def events(general_config, registry_options, contract_name, from_block, to_block, event_name):
+def events(general_config, registry_options, contract_name, from_block, to_block, event_name, event_store):
     """Show events associated to NuCypher contracts."""
 
     emitter, registry, blockchain = registry_options.setup(general_config=general_config)
+    if event_store:
+        os.makedirs(os.path.dirname(os.path.abspath(event_store)), exist_ok=True)
+        event_store = EventStore(db_filepath=event_store)
     if not contract_name:
         if event_name:
             raise click.BadOptionUsage(option_name='--event-name', message='--event-name requires --contract-name')
@@ -156,6 +165,8 @@ def events(general_config, registry_options, contract_name, from_block, to_block
         title = f" {contract_name} Events ".center(40, "-")
         emitter.echo(f"\n{title}\n", bold=True, color='green')
         agent = ContractAgency.get_agent_by_contract_name(contract_name, registry)
+        if event_store:
+            agent.events.event_store = event_store
         names = agent.events.names if not event_name else [event_name]
         for name in names:
             emitter.echo(f"{name}:", bold=True, color='yellow')
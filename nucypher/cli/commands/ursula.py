@@ -45,6 +45,7 @@ from nucypher.cli.options import (
     group_options,
     option_config_file,
     option_config_root,
+    option_connection_pooling,
     option_db_filepath,
     option_dev,
     option_dry_run,
@@ -72,6 +73,7 @@ from nucypher.config.constants import (
     TEMPORARY_DOMAIN
 )
 from nucypher.config.keyring import NucypherKeyring
+from nucypher.datastore.db import DATASTORE_ENGINE_PROFILES
 from nucypher.utilities.networking import determine_external_ip_address
 
 
@@ -94,7 +96,13 @@ class UrsulaConfigOptions:
                  light,
                  gas_strategy,
                  signer_uri,
-                 availability_check):
+                 availability_check,
+                 cache_node_verification,
+                 connection_pooling,
+                 reencryption_workers,
+                 datastore_profile,
+                 workorder_group_commit,
+                 async_workorder_persistence):
 
         if federated_only:
             if geth:
@@ -125,6 +133,12 @@ class UrsulaConfigOptions:
         self.light = light
         self.gas_strategy = gas_strategy
         self.availability_check = availability_check
+        self.cache_node_verification = cache_node_verification
+        self.connection_pooling = connection_pooling
+        self.reencryption_workers = reencryption_workers
+        self.datastore_profile = datastore_profile
+        self.workorder_group_commit = workorder_group_commit
+        self.async_workorder_persistence = async_workorder_persistence
 
     def create_config(self, emitter, config_file):
         if self.dev:
@@ -144,7 +158,13 @@ class UrsulaConfigOptions:
                 rest_host=self.rest_host,
                 rest_port=self.rest_port,
                 db_filepath=self.db_filepath,
-                availability_check=self.availability_check
+                availability_check=self.availability_check,
+                cache_node_verification=self.cache_node_verification,
+                connection_pooling=self.connection_pooling,
+                reencryption_workers=self.reencryption_workers,
+                datastore_profile=self.datastore_profile,
+                workorder_group_commit=self.workorder_group_commit,
+                async_workorder_persistence=self.async_workorder_persistence
             )
         else:
             try:
@@ -163,7 +183,13 @@ class UrsulaConfigOptions:
                     poa=self.poa,
                     light=self.light,
                     federated_only=self.federated_only,
-                    availability_check=self.availability_check
+                    availability_check=self.availability_check,
+                    cache_node_verification=self.cache_node_verification,
+                    connection_pooling=self.connection_pooling,
+                    reencryption_workers=self.reencryption_workers,
+                    datastore_profile=self.datastore_profile,
+                    workorder_group_commit=self.workorder_group_commit,
+                    async_workorder_persistence=self.async_workorder_persistence
                 )
             except FileNotFoundError:
                 return handle_missing_configuration_file(character_config_class=UrsulaConfiguration, config_file=config_file)
@@ -209,7 +235,13 @@ class UrsulaConfigOptions:
                                             gas_strategy=self.gas_strategy,
                                             poa=self.poa,
                                             light=self.light,
-                                            availability_check=self.availability_check)
+                                            availability_check=self.availability_check,
+                                            cache_node_verification=self.cache_node_verification,
+                                            connection_pooling=self.connection_pooling,
+                                            reencryption_workers=self.reencryption_workers,
+                                            datastore_profile=self.datastore_profile,
+                                            workorder_group_commit=self.workorder_group_commit,
+                                            async_workorder_persistence=self.async_workorder_persistence)
 
     def get_updates(self) -> dict:
         payload = dict(rest_host=self.rest_host,
@@ -224,7 +256,13 @@ class UrsulaConfigOptions:
                        gas_strategy=self.gas_strategy,
                        poa=self.poa,
                        light=self.light,
-                       availability_check=self.availability_check)
+                       availability_check=self.availability_check,
+                       cache_node_verification=self.cache_node_verification,
+                       connection_pooling=self.connection_pooling,
+                       reencryption_workers=self.reencryption_workers,
+                       datastore_profile=self.datastore_profile,
+                       workorder_group_commit=self.workorder_group_commit,
+                       async_workorder_persistence=self.async_workorder_persistence)
         # Depends on defaults being set on Configuration classes, filtrates None values
         updates = {k: v for k, v in payload.items() if v is not None}
         return updates
@@ -246,7 +284,13 @@ group_config_options = group_options(
     poa=option_poa,
     light=option_light,
     dev=option_dev,
-    availability_check=click.option('--availability-check/--disable-availability-check', help="Enable or disable self-health checks while running", is_flag=True, default=None)
+    availability_check=click.option('--availability-check/--disable-availability-check', help="Enable or disable self-health checks while running", is_flag=True, default=None),
+    cache_node_verification=click.option('--cache-node-verification/--no-cache-node-verification', help="Remember which nodes were verified, so they aren't verified again after a restart", is_flag=True, default=None),
+    connection_pooling=option_connection_pooling,
+    reencryption_workers=click.option('--reencryption-workers', help="Number of worker processes to re-encrypt on (0 re-encrypts serially)", type=click.IntRange(min=0)),
+    datastore_profile=click.option('--datastore-profile', help="SQLite tuning for the node's datastore", type=click.Choice(list(DATASTORE_ENGINE_PROFILES))),
+    workorder_group_commit=click.option('--workorder-group-commit/--no-workorder-group-commit', help="Write work orders to the datastore in batches", is_flag=True, default=None),
+    async_workorder_persistence=click.option('--async-workorder-persistence/--no-async-workorder-persistence', help="Answer Bob before his work order is written to the datastore", is_flag=True, default=None)
 )
 
 
@@ -197,8 +197,7 @@ def process_middleware(mock_networking) -> tuple:
     if mock_networking:
         middleware = MockRestMiddleware()
     else:
-        from nucypher.network.middleware import RestMiddleware
-        middleware = RestMiddleware()
+        middleware = None  # The character's configuration makes its own, pooling connections if it's set to.
     return 'middleware', middleware
 
 
@@ -207,3 +206,4 @@ option_middleware = wrap_option(
     mock_networking=click.option('-Z', '--mock-networking', help="Use in-memory transport instead of networking", count=True),
     )
 option_signer_uri = click.option('--signer', 'signer_uri', '-S', default=None, type=str)
+option_connection_pooling = click.option('--connection-pooling/--no-connection-pooling', help="Reuse TLS connections to the nodes contacted most recently", is_flag=True, default=None)
@@ -44,6 +44,8 @@ class UrsulaConfiguration(CharacterConfiguration):
     __DEFAULT_TLS_CURVE = ec.SECP384R1
     DEFAULT_DB_NAME = '{}.db'.format(NAME)
     DEFAULT_AVAILABILITY_CHECKS = True
+    DEFAULT_REENCRYPTION_WORKERS = 0  # Re-encrypt on the request thread
+    DEFAULT_DATASTORE_PROFILE = 'default'  # See DATASTORE_ENGINE_PROFILES
     LOCAL_SIGNERS_ALLOWED = True
 
     def __init__(self,
@@ -55,6 +57,10 @@ class UrsulaConfiguration(CharacterConfiguration):
                  tls_curve: EllipticCurve = None,
                  certificate: Certificate = None,
                  availability_check: bool = None,
+                 reencryption_workers: int = None,
+                 datastore_profile: str = None,
+                 workorder_group_commit: bool = False,
+                 async_workorder_persistence: bool = False,
                  *args, **kwargs) -> None:
 
         if not rest_port:
@@ -69,6 +75,10 @@ class UrsulaConfiguration(CharacterConfiguration):
         self.db_filepath = db_filepath or UNINITIALIZED_CONFIGURATION
         self.worker_address = worker_address
         self.availability_check = availability_check if availability_check is not None else self.DEFAULT_AVAILABILITY_CHECKS
+        self.reencryption_workers = reencryption_workers or self.DEFAULT_REENCRYPTION_WORKERS
+        self.datastore_profile = datastore_profile or self.DEFAULT_DATASTORE_PROFILE
+        self.workorder_group_commit = bool(workorder_group_commit)
+        self.async_workorder_persistence = bool(async_workorder_persistence)
         super().__init__(dev_mode=dev_mode, *args, **kwargs)
 
     def generate_runtime_filepaths(self, config_root: str) -> dict:
@@ -88,6 +98,10 @@ class UrsulaConfiguration(CharacterConfiguration):
             rest_port=self.rest_port,
             db_filepath=self.db_filepath,
             availability_check=self.availability_check,
+            reencryption_workers=self.reencryption_workers,
+            datastore_profile=self.datastore_profile,
+            workorder_group_commit=self.workorder_group_commit,
+            async_workorder_persistence=self.async_workorder_persistence,
         )
         return {**super().static_payload(), **payload}
 
@@ -45,6 +45,7 @@ from nucypher.config.keyring import NucypherKeyring
 from nucypher.config.storages import ForgetfulNodeStorage, LocalFileBasedNodeStorage, NodeStorage
 from nucypher.crypto.powers import CryptoPower, CryptoPowerUp
 from nucypher.network.middleware import RestMiddleware
+from nucypher.network.verification import VerificationCache
 
 
 # TODO: Relocate - #1575
@@ -93,12 +94,14 @@ class CharacterConfiguration(BaseConfiguration):
                  domains: Set[str] = None,  # TODO: Mapping between learning domains and "registry" domains - #1580
                  interface_signature: Signature = None,
                  network_middleware: RestMiddleware = None,
+                 connection_pooling: bool = False,
 
                  # Node Storage
                  known_nodes: set = None,
                  node_storage: NodeStorage = None,
                  reload_metadata: bool = True,
                  save_metadata: bool = True,
+                 cache_node_verification: bool = False,
 
                  # Blockchain
                  poa: bool = None,
@@ -151,6 +154,7 @@ class CharacterConfiguration(BaseConfiguration):
         self.start_learning_now = start_learning_now
         self.save_metadata = save_metadata
         self.reload_metadata = reload_metadata
+        self.cache_node_verification = bool(cache_node_verification)
         self.known_nodes = known_nodes or set()  # handpicked
 
         # Configuration
@@ -226,7 +230,11 @@ class CharacterConfiguration(BaseConfiguration):
 
         # Network
         self.controller_port = controller_port or self.DEFAULT_CONTROLLER_PORT
-        self.network_middleware = network_middleware or self.DEFAULT_NETWORK_MIDDLEWARE(registry=self.registry)
+        self.connection_pooling = bool(connection_pooling)
+        if not network_middleware:
+            network_middleware = self.DEFAULT_NETWORK_MIDDLEWARE(registry=self.registry,
+                                                                 connection_pooling=self.connection_pooling)
+        self.network_middleware = network_middleware
         self.interface_signature = interface_signature
 
         super().__init__(filepath=self.config_file_location, config_root=self.config_root)
@@ -305,8 +313,17 @@ class CharacterConfiguration(BaseConfiguration):
                                                      federated_only=self.federated_only)
         self.node_storage = node_storage
 
+        # If asked, nodes verified in previous runs needn't be verified again, unless their metadata has changed.
+        if self.dev_mode or not self.cache_node_verification:
+            self.verification_cache = None
+        else:
+            self.verification_cache = VerificationCache(db_filepath=os.path.join(self.config_root,
+                                                                                 VerificationCache.DB_FILE_NAME))
+
     def forget_nodes(self) -> None:
         self.node_storage.clear()
+        if self.verification_cache is not None:
+            self.verification_cache.clear()
         message = "Removed all stored node node metadata and certificates"
         self.log.debug(message)
 
@@ -327,7 +344,9 @@ class CharacterConfiguration(BaseConfiguration):
                            'provider_uri',
                            'registry_filepath',
                            'gas_strategy',
-                           'signer_uri')
+                           'signer_uri',
+                           'cache_node_verification',
+                           'connection_pooling')
         character_init_params = filter(lambda t: t[0] not in non_init_params, merged_parameters.items())
         return dict(character_init_params)
 
@@ -399,6 +418,8 @@ class CharacterConfiguration(BaseConfiguration):
             abort_on_learning_error=self.abort_on_learning_error,
             start_learning_now=self.start_learning_now,
             save_metadata=self.save_metadata,
+            cache_node_verification=self.cache_node_verification,
+            connection_pooling=self.connection_pooling,
             node_storage=self.node_storage.payload(),
         )
 
@@ -431,9 +452,12 @@ class CharacterConfiguration(BaseConfiguration):
             payload.update(dict(registry=self.registry,
                                 signer=Signer.from_signer_uri(self.signer_uri)))
 
-        payload.update(dict(network_middleware=self.network_middleware or self.DEFAULT_NETWORK_MIDDLEWARE(),
+        network_middleware = self.network_middleware or \
+            self.DEFAULT_NETWORK_MIDDLEWARE(connection_pooling=self.connection_pooling)
+        payload.update(dict(network_middleware=network_middleware,
                             known_nodes=self.known_nodes,
                             node_storage=self.node_storage,
+                            verification_cache=self.verification_cache,
                             crypto_power_ups=self.derive_node_power_ups()))
         return payload
 
@@ -544,9 +568,8 @@ class CharacterConfiguration(BaseConfiguration):
 
     @classmethod
     def load_node_storage(cls, storage_payload: dict, federated_only: bool):
-        from nucypher.config.storages import NodeStorage
-        node_storage_subclasses = {storage._name: storage for storage in NodeStorage.__subclasses__()}
+        from nucypher.config.storages import NODE_STORAGES, NodeStorage
         storage_type = storage_payload[NodeStorage._TYPE_LABEL]
-        storage_class = node_storage_subclasses[storage_type]
+        storage_class = NODE_STORAGES[storage_type]
         node_storage = storage_class.from_payload(payload=storage_payload, federated_only=federated_only)
         return node_storage
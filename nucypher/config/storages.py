@@ -15,6 +15,7 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import mmap
 import sqlite3
 
 import OpenSSL
@@ -22,11 +23,14 @@ import binascii
 import os
 import tempfile
 from abc import ABC, abstractmethod
+from contextlib import suppress
+from bytestring_splitter import VARIABLE_HEADER_LENGTH
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509 import Certificate, NameOID
-from eth_utils import is_checksum_address
+from eth_utils import is_checksum_address, to_canonical_address, to_checksum_address
+from threading import RLock
 from twisted.logger import Logger
 from typing import Any, Callable, Set, Tuple, Union
 
@@ -34,6 +38,7 @@ from nucypher.blockchain.eth.decorators import validate_checksum_address
 from nucypher.blockchain.eth.registry import BaseContractRegistry
 from nucypher.config.constants import DEFAULT_CONFIG_ROOT
 from nucypher.crypto.api import read_certificate_pseudonym
+from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH
 
 
 class NodeStorage(ABC):
@@ -148,6 +153,11 @@ class NodeStorage(ABC):
         """Save a single node's metadata and tls certificate"""
         raise NotImplementedError
 
+    def store_nodes_metadata(self, nodes) -> None:
+        """Save the metadata of several nodes at once"""
+        for node in nodes:
+            self.store_node_metadata(node=node)
+
     @abstractmethod
     def generate_certificate_filepath(self, checksum_address: str) -> str:
         raise NotImplementedError
@@ -626,8 +636,229 @@ class TemporaryFileBasedNodeStorage(LocalFileBasedNodeStorage):
         return bool(os.path.isdir(self.metadata_dir) and os.path.isdir(self.certificates_dir))
 
 
+class MemoryMappedNodeStorage(LocalFileBasedNodeStorage):
+    """
+    Keeps the metadata of all known nodes in a single append-only file, instead of one file per node.
+
+    Storing a node appends a record of its metadata - unless it's unchanged - and removing one appends a
+    tombstone.  When the file is opened, an index of each node's latest record is rebuilt from the records'
+    headers alone, and stored nodes are loaded as sprouts, which aren't parsed until they're used.  Reads
+    go through a memory map of the file, which is compacted once most of it is made of superseded records.
+
+    Records are not synced to disk as they're appended: after a crash, the last few may be lost, and
+    a record which was only partly written is discarded the next time the file is opened.  Compaction
+    is atomic; the file is either compacted or left as it was.
+
+    TLS certificates are kept as files, as with LocalFileBasedNodeStorage.
+    """
+    _name = 'mmap'
+    NODES_FILENAME = 'known_nodes.dat'
+    FILE_HEADER = b'NUNODES' + bytes([1])  # Magic, and the version of this format
+
+    # Each record is its kind, the node's canonical address, and the node's metadata as variable length bytes.
+    STORE_RECORD = b'\x01'
+    REMOVE_RECORD = b'\x02'
+    RECORD_HEADER_LENGTH = 1 + PUBLIC_ADDRESS_LENGTH + VARIABLE_HEADER_LENGTH
+
+    COMPACTION_THRESHOLD = 0.5  # The fraction of the file which may be superseded records
+    MIN_COMPACTION_SIZE = 1024 * 1024  # bytes
+
+    def __init__(self, nodes_filepath: str = None, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.nodes_filepath = nodes_filepath or os.path.join(self.root_dir, self.NODES_FILENAME)
+        self.__lock = RLock()
+        self.__file = None
+        self.__mmap = None
+        self.__index = None  # The offset and length of each node's latest record, by checksum address
+        self.__size = 0
+        self.__live_size = 0  # How much of the file is made of latest records
+
+    @property
+    def source(self) -> str:
+        """Human readable source string"""
+        return self.nodes_filepath
+
+    #
+    # Records
+    #
+
+    def __open(self) -> None:
+        if self.__file is not None:
+            return
+        os.makedirs(os.path.dirname(self.nodes_filepath), exist_ok=True)
+        self.__file = open(self.nodes_filepath, 'a+b')
+        self.__size = os.fstat(self.__file.fileno()).st_size
+        if not self.__size:
+            self.__file.write(self.FILE_HEADER)
+            self.__file.flush()
+            self.__size = len(self.FILE_HEADER)
+        self.__index = dict()
+        self.__live_size = 0
+
+        records = self.__map()
+        if records[:len(self.FILE_HEADER)] != self.FILE_HEADER:
+            self.__close()
+            raise self.NodeStorageError(f"{self.nodes_filepath} is not a node storage file.")
+
+        offset = len(self.FILE_HEADER)
+        while offset + self.RECORD_HEADER_LENGTH <= self.__size:
+            kind, checksum_address, record_length = self.__read_record_header(offset)
+            if offset + record_length > self.__size:
+                break
+            self.__index_record(kind, checksum_address, offset, record_length)
+            offset += record_length
+
+        if offset < self.__size:
+            self.log.warn(f"Discarding a partly written record at the end of {self.nodes_filepath}.")
+            self.__file.truncate(offset)
+            self.__size = offset
+            self.__map()
+        self.log.info(f"Found {len(self.__index)} known nodes at {self.nodes_filepath}")
+
+    def __close(self) -> None:
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def __map(self) -> mmap.mmap:
+        """The memory map of the file, remapped if records were appended since it was last mapped."""
+        if self.__mmap is None or len(self.__mmap) != self.__size:
+            if self.__mmap is not None:
+                self.__mmap.close()
+            self.__file.flush()  # Records appended without flushing them must reach the file before they're mapped.
+            self.__mmap = mmap.mmap(self.__file.fileno(), self.__size, access=mmap.ACCESS_READ)
+        return self.__mmap
+
+    def __read_record_header(self, offset: int) -> Tuple[bytes, str, int]:
+        header = self.__mmap[offset:offset + self.RECORD_HEADER_LENGTH]
+        kind, canonical_address = header[:1], header[1:1 + PUBLIC_ADDRESS_LENGTH]
+        metadata_length = int.from_bytes(header[1 + PUBLIC_ADDRESS_LENGTH:], 'big')
+        return kind, to_checksum_address(canonical_address), self.RECORD_HEADER_LENGTH + metadata_length
+
+    def __index_record(self, kind: bytes, checksum_address: str, offset: int, record_length: int) -> None:
+        superseded = self.__index.pop(checksum_address, None)
+        if superseded is not None:
+            self.__live_size -= superseded[1]
+        if kind == self.STORE_RECORD:
+            self.__index[checksum_address] = (offset, record_length)
+            self.__live_size += record_length
+
+    def __read_metadata(self, checksum_address: str) -> bytes:
+        try:
+            offset, record_length = self.__index[checksum_address]
+        except KeyError:
+            raise self.UnknownNode
+        return self.__map()[offset + self.RECORD_HEADER_LENGTH:offset + record_length]
+
+    def __append(self, kind: bytes, checksum_address: str, node_bytes: bytes = b'', flush: bool = True) -> None:
+        record = kind + to_canonical_address(checksum_address) + len(node_bytes).to_bytes(VARIABLE_HEADER_LENGTH, 'big') + node_bytes
+        self.__file.write(record)
+        if flush:
+            self.__file.flush()
+        self.__index_record(kind, checksum_address, self.__size, len(record))
+        self.__size += len(record)
+
+        superseded_size = self.__size - len(self.FILE_HEADER) - self.__live_size
+        if self.__size >= self.MIN_COMPACTION_SIZE and superseded_size > self.__size * self.COMPACTION_THRESHOLD:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrites the file with only the latest record of each node."""
+        with self.__lock:
+            self.__open()
+            records = self.__map()
+            compacted_filepath = f'{self.nodes_filepath}.compacting'
+            index, offset = dict(), len(self.FILE_HEADER)
+            with open(compacted_filepath, 'wb') as compacted_file:
+                compacted_file.write(self.FILE_HEADER)
+                for checksum_address, (record_offset, record_length) in self.__index.items():
+                    compacted_file.write(records[record_offset:record_offset + record_length])
+                    index[checksum_address] = (offset, record_length)
+                    offset += record_length
+                compacted_file.flush()
+                os.fsync(compacted_file.fileno())
+
+            self.__close()
+            os.replace(compacted_filepath, self.nodes_filepath)
+            self.__file = open(self.nodes_filepath, 'a+b')
+            self.__index, self.__size = index, offset
+            self.__live_size = offset - len(self.FILE_HEADER)
+            self.log.debug(f"Compacted {self.nodes_filepath} to {len(index)} records.")
+
+    #
+    # API
+    #
+
+    def all(self, federated_only: bool, certificates_only: bool = False) -> Set[Union[Any, Certificate]]:
+        if certificates_only:
+            return super().all(federated_only=federated_only, certificates_only=True)
+        with self.__lock:
+            self.__open()
+            records = self.__map()
+            # The latest records' metadata, as variable length bytes, makes a payload of known nodes.
+            payload = b''.join(records[offset + 1 + PUBLIC_ADDRESS_LENGTH:offset + record_length]
+                               for offset, record_length in self.__index.values())
+        return set(self.character_class.batch_from_bytes(payload, registry=self.registry))
+
+    @validate_checksum_address
+    def get(self, checksum_address: str, federated_only: bool, certificate_only: bool = False):
+        if certificate_only is True:
+            return super().get(checksum_address=checksum_address, federated_only=federated_only, certificate_only=True)
+        with self.__lock:
+            self.__open()
+            node_bytes = self.__read_metadata(checksum_address)
+        return self.character_class.from_bytes(node_bytes, registry=self.registry)
+
+    def store_node_metadata(self, node, filepath: str = None) -> str:
+        node_bytes = bytes(node)
+        with self.__lock:
+            self.__open()
+            if node.checksum_address not in self.__index or self.__read_metadata(node.checksum_address) != node_bytes:
+                self.__append(self.STORE_RECORD, node.checksum_address, node_bytes)
+        return self.nodes_filepath
+
+    def store_nodes_metadata(self, nodes) -> None:
+        """Appends the records of all the changed nodes, flushing them to the file together."""
+        with self.__lock:
+            self.__open()
+            for node in nodes:
+                node_bytes = bytes(node)
+                if node.checksum_address not in self.__index or self.__read_metadata(node.checksum_address) != node_bytes:
+                    self.__append(self.STORE_RECORD, node.checksum_address, node_bytes, flush=False)
+            self.__file.flush()
+
+    @validate_checksum_address
+    def remove(self, checksum_address: str, metadata: bool = True, certificate: bool = True) -> None:
+        if metadata is True:
+            with self.__lock:
+                self.__open()
+                if checksum_address not in self.__index:
+                    raise self.UnknownNode
+                self.__append(self.REMOVE_RECORD, checksum_address)
+            self.log.debug("Deleted {} from the filesystem".format(checksum_address))
+        if certificate is True:
+            super().remove(checksum_address=checksum_address, metadata=False, certificate=True)
+
+    def clear(self, metadata: bool = True, certificates: bool = True) -> None:
+        """Forget all stored nodes and certificates"""
+        if metadata is True:
+            with self.__lock:
+                self.__close()
+                with suppress(FileNotFoundError):
+                    os.remove(self.nodes_filepath)
+        super().clear(metadata=False, certificates=certificates)
+
+    def payload(self) -> dict:
+        payload = super().payload()
+        payload['nodes_filepath'] = self.nodes_filepath
+        return payload
+
+
 #
 # Node Storage Registry
 #
 NODE_STORAGES = {storage_class._name: storage_class
-                 for storage_class in NodeStorage.__subclasses__()}
+                 for storage_class in (*NodeStorage.__subclasses__(), MemoryMappedNodeStorage)}
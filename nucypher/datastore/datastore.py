@@ -21,13 +21,13 @@ from bytestring_splitter import BytestringSplitter
 from datetime import datetime
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
-from typing import List
+from typing import Iterable, List
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
 from nucypher.crypto.signing import Signature
 from nucypher.crypto.utils import fingerprint_from_key
-from nucypher.datastore.db.models import Key, PolicyArrangement, Workorder
+from nucypher.datastore.db.models import Key, PolicyArrangement, TreasureMapRecord, Workorder
 
 
 class NotFound(Exception):
@@ -43,6 +43,8 @@ class Datastore:
     """
     kfrag_splitter = BytestringSplitter(Signature, (KFrag, KFrag.expected_bytes_length()))
 
+    EXPIRY_PURGE_CHUNK_SIZE = 1000  # rows per delete
+
     def __init__(self, sqlalchemy_engine=None) -> None:
         """
         Initializes a Datastore object.
@@ -151,6 +153,35 @@ class Datastore:
         self.__commit(session=session)
         return new_policy_arrangement
 
+    def add_policy_arrangements(self, arrangements: Iterable[dict], session=None) -> List[PolicyArrangement]:
+        """
+        Creates many PolicyArrangements in the Keystore with a single commit.
+
+        :param arrangements: dicts of add_policy_arrangement keyword arguments
+        :return: The newly added PolicyArrangement objects
+        """
+        session = session or self._session_on_init_thread
+
+        alice_keys = dict()
+        new_policy_arrangements = list()
+        for arrangement in arrangements:
+            alice_key_data = bytes(arrangement['alice_verifying_key'])
+            if alice_key_data not in alice_keys:
+                alice_key_instance = session.query(Key).filter_by(key_data=alice_key_data).first()
+                if not alice_key_instance:
+                    alice_key_instance = Key.from_umbral_key(arrangement['alice_verifying_key'], is_signing=True)
+                alice_keys[alice_key_data] = alice_key_instance
+
+            new_policy_arrangements.append(PolicyArrangement(expiration=arrangement['expiration'],
+                                                             id=arrangement['arrangement_id'],
+                                                             kfrag=arrangement.get('kfrag'),
+                                                             alice_verifying_key=alice_keys[alice_key_data],
+                                                             alice_signature=None))
+
+        session.add_all(new_policy_arrangements)
+        self.__commit(session=session)
+        return new_policy_arrangements
+
     def get_policy_arrangement(self, arrangement_id: bytes, session=None) -> PolicyArrangement:
         """
         Retrieves a PolicyArrangement by its HRAC.
@@ -196,17 +227,29 @@ class Datastore:
         self.__commit(session=session)
         return deleted_records
 
-    def del_expired_policy_arrangements(self, session=None, now=None) -> int:
+    def del_expired_policy_arrangements(self, session=None, now=None, chunk_size: int = None) -> int:
         """
         Deletes all expired PolicyArrangements from the Keystore.
+
+        Deletes at most `chunk_size` rows per transaction, so a large backlog of expired
+        arrangements doesn't hold the database lock for the whole purge.
         """
         session = session or self._session_on_init_thread
         now = now or datetime.now()
-        result = session.query(PolicyArrangement).filter(PolicyArrangement.expiration <= now)
+        chunk_size = chunk_size or self.EXPIRY_PURGE_CHUNK_SIZE
 
         deleted_records = 0
-        if result.count() > 0:
-            deleted_records = result.delete()
+        while True:
+            expired = session.query(PolicyArrangement.id).filter(PolicyArrangement.expiration <= now).limit(chunk_size)
+            expired_ids = [row.id for row in expired]
+            if not expired_ids:
+                break
+            deleted_records += session.query(PolicyArrangement)\
+                .filter(PolicyArrangement.id.in_(expired_ids))\
+                .delete(synchronize_session=False)
+            self.__commit(session=session)
+            if len(expired_ids) < chunk_size:
+                break
         self.__commit(session=session)
         return deleted_records
 
@@ -239,6 +282,34 @@ class Datastore:
         self.__commit(session=session)
         return new_workorder
 
+    def save_workorders(self, workorders: Iterable[dict], session=None) -> int:
+        """
+        Adds many Workorders to the keystore with a single commit.
+
+        :param workorders: dicts of save_workorder keyword arguments
+        :return: The number of Workorders added
+        """
+        session = session or self._session_on_init_thread
+
+        bob_key_ids = dict()
+        mappings = list()
+        for workorder in workorders:
+            fingerprint = fingerprint_from_key(workorder['bob_verifying_key'])
+            if fingerprint not in bob_key_ids:
+                key = session.query(Key).filter_by(fingerprint=fingerprint).first()
+                if not key:
+                    key = self.add_key(key=workorder['bob_verifying_key'], session=session)
+                bob_key_ids[fingerprint] = key.id
+
+            mappings.append(dict(bob_verifying_key_id=bob_key_ids[fingerprint],
+                                 bob_signature=workorder['bob_signature'],
+                                 arrangement_id=workorder['arrangement_id'],
+                                 created_at=datetime.utcnow()))
+
+        session.bulk_insert_mappings(Workorder, mappings)
+        self.__commit(session=session)
+        return len(mappings)
+
     def get_workorders(self,
                        arrangement_id: bytes = None,
                        bob_verifying_key: bytes = None,
@@ -280,3 +351,97 @@ class Datastore:
         deleted = workorders.delete()
         self.__commit(session=session)
         return deleted
+
+    #
+    # Treasure Maps
+    #
+
+    def add_treasure_map(self,
+                         map_id: bytes,
+                         treasure_map: bytes,
+                         expiration: datetime,
+                         now: datetime = None,
+                         session=None,
+                         commit: bool = True
+                         ) -> bool:
+        """
+        Stores the bytes of a TreasureMap, replacing any previous copy and renewing
+        both its expiration and when it was stored.  Returns True if the map is new.
+
+        The map is written before anything is read, so that with `commit=False` the rest
+        of the caller's transaction sees (and, in SQLite, holds the write lock for) the result.
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.utcnow()
+
+        replaced = session.query(TreasureMapRecord).filter_by(id=map_id).update(
+            dict(treasure_map=treasure_map, expiration=expiration, created_at=now),
+            synchronize_session=False)
+        if not replaced:
+            stored_map = TreasureMapRecord(id=map_id, treasure_map=treasure_map, expiration=expiration)
+            stored_map.created_at = now
+            session.add(stored_map)
+            session.flush()
+        if commit:
+            self.__commit(session=session)
+        return not replaced
+
+    def get_treasure_map(self, map_id: bytes, session=None) -> bytes:
+        """
+        Returns the stored bytes of a TreasureMap by its ID.
+        """
+        session = session or self._session_on_init_thread
+
+        stored_map = session.query(TreasureMapRecord).filter_by(id=map_id).first()
+        if not stored_map:
+            raise NotFound
+        return stored_map.treasure_map
+
+    def count_treasure_maps(self, session=None) -> int:
+        session = session or self._session_on_init_thread
+        return session.query(TreasureMapRecord).count()
+
+    def del_treasure_map(self, map_id: bytes, session=None) -> int:
+        """
+        Deletes a TreasureMap from the Keystore.
+        """
+        session = session or self._session_on_init_thread
+
+        deleted_records = session.query(TreasureMapRecord).filter_by(id=map_id).delete()
+        self.__commit(session=session)
+        return deleted_records
+
+    def del_expired_treasure_maps(self, session=None, now=None) -> List[bytes]:
+        """
+        Deletes all expired TreasureMaps from the Keystore, returning their IDs.
+        Their expirations are in UTC, as is `now`.
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.utcnow()
+
+        expired = session.query(TreasureMapRecord.id).filter(TreasureMapRecord.expiration <= now)
+        expired_ids = [row.id for row in expired]
+        if expired_ids:
+            session.query(TreasureMapRecord).filter(TreasureMapRecord.id.in_(expired_ids)).delete(synchronize_session=False)
+        self.__commit(session=session)
+        return expired_ids
+
+    def del_oldest_treasure_maps(self, keep: int, session=None, commit: bool = True) -> List[bytes]:
+        """
+        Deletes the least recently stored TreasureMaps so that at most `keep` remain, returning their IDs.
+        """
+        session = session or self._session_on_init_thread
+
+        surplus = session.query(TreasureMapRecord).count() - keep
+        if surplus <= 0:
+            return list()
+        oldest = session.query(TreasureMapRecord.id).order_by(TreasureMapRecord.created_at).limit(surplus)
+        oldest_ids = [row.id for row in oldest]
+        session.query(TreasureMapRecord).filter(TreasureMapRecord.id.in_(oldest_ids)).delete(synchronize_session=False)
+        if commit:
+            self.__commit(session=session)
+        return oldest_ids
+
+    def commit(self, session=None) -> None:
+        """Commits the work of calls made with `commit=False`."""
+        self.__commit(session=session or self._session_on_init_thread)
@@ -14,15 +14,93 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine, create_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import QueuePool, StaticPool
+from typing import List
 
 Base = declarative_base()
 
+# Named sets of pragmas applied to every datastore connection.
+DATASTORE_ENGINE_PROFILES = {
+
+    # SQLite defaults: rollback journal, fsync on every commit.
+    'default': dict(),
+
+    # Write-ahead log: readers don't block the writer, and with synchronous=NORMAL a commit
+    # only appends to the WAL - the fsync happens at checkpoint.  A committed transaction
+    # survives a crash of the process, but may be lost on power failure.
+    'wal': dict(journal_mode='WAL',
+                synchronous='NORMAL',
+                cache_size=-65536,      # KiB, i.e. 64 MiB of page cache per connection
+                temp_store='MEMORY',
+                busy_timeout=5000),     # ms to wait for the write lock instead of failing at once
+}
+
+DATASTORE_POOL_SIZE = 10  # connections; roughly the number of threads serving requests
+
 
 @event.listens_for(Engine, "connect")
 def set_secure_delete_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA secure_delete=on")
     cursor.close()
+
+
+def create_datastore_engine(db_filepath: str = None, profile: str = 'default') -> Engine:
+    """
+    Creates the SQLAlchemy engine for a node's datastore, applying the pragmas of the named profile.
+    File-backed datastores get a pool of connections shared by the threads serving requests.
+    """
+    try:
+        pragmas = DATASTORE_ENGINE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown datastore engine profile '{profile}'; "
+                         f"choose from {', '.join(DATASTORE_ENGINE_PROFILES)}.")
+
+    # See: https://docs.sqlalchemy.org/en/rel_0_9/dialects/sqlite.html#connect-strings
+    if not db_filepath:
+        # An in-memory database lives and dies with its connection, so every thread
+        # serving a request must share that single connection to see the same data.
+        # There's no journal or fsync to tune, so the profile's pragmas don't apply.
+        return create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+
+    if not pragmas:
+        return create_engine(f'sqlite:///{db_filepath}')
+
+    engine = create_engine(f'sqlite:///{db_filepath}',
+                           connect_args={'check_same_thread': False},
+                           poolclass=QueuePool,
+                           pool_size=DATASTORE_POOL_SIZE,
+                           max_overflow=DATASTORE_POOL_SIZE)
+
+    @event.listens_for(engine, "connect")
+    def set_profile_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+    return engine
+
+
+def upgrade_schema(engine) -> List[str]:
+    """
+    Brings an existing database up to date with the current models.
+
+    `create_all` only creates missing tables, so indexes added to the models since a
+    database was created (e.g. an older ursula.db) are created here.  Safe to run repeatedly.
+    Returns the names of the indexes that were created.
+    """
+    Base.metadata.create_all(engine)
+
+    inspector = inspect(engine)
+    created = list()
+    for table in Base.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind=engine)
+                created.append(index.name)
+    return created
@@ -0,0 +1,186 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from concurrent.futures import Future, wait
+from queue import Empty, Full, Queue
+from threading import Thread
+
+from twisted.logger import Logger
+
+from nucypher.datastore.datastore import Datastore
+from nucypher.datastore.threading import ThreadedSession
+
+
+class WorkOrderCommitQueue:
+    """
+    Group commit for Ursula's work orders.
+
+    Work orders saved from many concurrent requests are batched into a single transaction by one
+    writer thread, so they share one commit (and one fsync) instead of paying for one each.
+    A batch is committed once it holds `max_batch_size` work orders or its oldest work order has
+    waited `max_latency` seconds, whichever comes first.
+
+    `save` returns a Future which resolves once the work order is committed.  With `asynchronous`
+    set, callers aren't expected to wait on it: the work order is persisted in the background, and
+    at most `max_pending` of them may be waiting to be written before `save` blocks (back-pressure).
+    """
+
+    DEFAULT_MAX_BATCH_SIZE = 500   # work orders
+    DEFAULT_MAX_LATENCY = 0.01     # seconds
+    DEFAULT_MAX_PENDING = 10_000   # work orders
+
+    FLUSH_POLL_INTERVAL = 0.5      # seconds between checks that the writer is still alive
+
+    __STOP = object()
+
+    def __init__(self,
+                 datastore: Datastore,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_latency: float = DEFAULT_MAX_LATENCY,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 asynchronous: bool = False):
+        self.log = Logger(self.__class__.__name__)
+        self.datastore = datastore
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.max_pending = max_pending
+        self.asynchronous = asynchronous
+
+        self._queue = Queue(maxsize=max_pending)
+        self._writer = None
+        self.batches_committed = 0
+        self.work_orders_committed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._writer is not None and self._writer.is_alive()
+
+    def start(self) -> None:
+        if not self.running:
+            self._writer = Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+            self._writer.start()
+
+    def stop(self) -> None:
+        """Commits everything already queued, then stops the writer thread."""
+        if self.running:
+            self._queue.put(self.__STOP)
+            self._writer.join()
+        self._writer = None
+
+    def flush(self, timeout: float = None) -> None:
+        """
+        Blocks until everything queued before the call has been written, or `timeout` seconds have passed.
+        Work orders saved while waiting don't hold it up.  Raises if the writer thread dies or the timeout
+        expires first.
+        """
+        if self._writer is None:
+            return
+        if not self._writer.is_alive():
+            raise RuntimeError(f"{self.__class__.__name__} writer died before flushing.")
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        # The writer resolves this marker once it has committed everything queued ahead of it.
+        flushed = Future()
+        try:
+            self._queue.put(flushed, timeout=timeout)
+        except Full:
+            raise TimeoutError(f"{self.__class__.__name__} stayed full for {timeout} seconds.")
+
+        while not flushed.done():
+            if not self._writer.is_alive():
+                raise RuntimeError(f"{self.__class__.__name__} writer died before flushing.")
+            wait_for = self.FLUSH_POLL_INTERVAL
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"{self.__class__.__name__} didn't flush within {timeout} seconds.")
+                wait_for = min(wait_for, remaining)
+            wait([flushed], timeout=wait_for)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def save(self, bob_verifying_key, bob_signature, arrangement_id) -> Future:
+        if not self.running:
+            raise RuntimeError(f"{self.__class__.__name__} is not running.")
+        committed = Future()
+        work_order = dict(bob_verifying_key=bob_verifying_key,
+                          bob_signature=bob_signature,
+                          arrangement_id=arrangement_id)
+        self._queue.put((work_order, committed))  # Blocks while max_pending work orders are waiting.
+        return committed
+
+    def _next_batch(self):
+        """Returns the next batch of work orders, the flush marker that ended it (if any), and whether to stop."""
+        first = self._queue.get()
+        if first is self.__STOP:
+            return list(), None, True
+        if isinstance(first, Future):
+            return list(), first, False
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_latency
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except Empty:
+                break
+            if item is self.__STOP:
+                return batch, None, True
+            if isinstance(item, Future):
+                return batch, item, False
+            batch.append(item)
+        return batch, None, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, flushed, stopping = self._next_batch()
+            if batch:
+                self._commit(batch)
+            if flushed:
+                flushed.set_result(True)
+            for _ in range(len(batch) + bool(flushed) + stopping):
+                self._queue.task_done()
+
+    def _commit(self, batch) -> None:
+        work_orders = [work_order for work_order, _committed in batch]
+        try:
+            with ThreadedSession(self.datastore.engine) as session:
+                self.datastore.save_workorders(work_orders, session=session)
+        except Exception as e:
+            if len(batch) > 1:
+                # Don't let one bad work order (e.g. a replayed signature) fail its whole batch.
+                self.log.warn(f"Failed to commit a batch of {len(batch)} work orders ({e}); committing them one by one.")
+                for item in batch:
+                    self._commit([item])
+                return
+            for work_order, committed in batch:
+                if self.asynchronous:
+                    # Nobody is waiting on this one.
+                    self.log.warn(f"Failed to persist work order for arrangement {work_order['arrangement_id']}: {e}")
+                committed.set_exception(e)
+        else:
+            self.batches_committed += 1
+            self.work_orders_committed += len(batch)
+            for _work_order, committed in batch:
+                committed.set_result(True)
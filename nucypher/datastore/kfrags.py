@@ -0,0 +1,109 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+from threading import Lock
+from typing import Optional
+
+from umbral.keys import UmbralPublicKey
+from umbral.kfrags import KFrag
+
+
+DecodedArrangement = namedtuple('DecodedArrangement', ('kfrag', 'alice_verifying_key', 'alice_address', 'expiration'))
+
+
+class DecodedKFragCache:
+    """
+    A bounded LRU cache of what the reencrypt endpoint decodes from a PolicyArrangement:
+    the KFrag, Alice's verifying key and her address, keyed by arrangement ID.
+
+    Entries must be invalidated whenever the stored arrangement changes or goes away
+    (enactment, revocation, expiry pruning).  Since an arrangement may be invalidated while
+    it's being read, take the cache's `generation` before reading it, and pass it to `put`.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10_000  # arrangements
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+        self.__generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, arrangement_id: bytes) -> Optional[DecodedArrangement]:
+        with self.__lock:
+            entry = self.__entries.get(arrangement_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(arrangement_id)
+            self.hits += 1
+            return entry
+
+    @property
+    def generation(self) -> int:
+        """Advances whenever entries are invalidated or pruned."""
+        return self.__generation
+
+    def put(self,
+            arrangement_id: bytes,
+            kfrag: KFrag,
+            alice_verifying_key: UmbralPublicKey,
+            alice_address: bytes,
+            expiration: datetime,
+            generation: int = None) -> DecodedArrangement:
+        entry = DecodedArrangement(kfrag, alice_verifying_key, alice_address, expiration)
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                # Something was invalidated since the arrangement was read; it may have been this one.
+                return entry
+            self.__entries[arrangement_id] = entry
+            self.__entries.move_to_end(arrangement_id)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, arrangement_id: bytes) -> None:
+        with self.__lock:
+            self.__entries.pop(arrangement_id, None)
+            self.__generation += 1
+
+    def prune(self, now: datetime) -> int:
+        """Drops the entries of arrangements expired as of `now`, as the datastore's expiry pruning does."""
+        # The datastore compares wall-clock times; so do we.
+        now = now.replace(tzinfo=None)
+        with self.__lock:
+            expired = [arrangement_id for arrangement_id, entry in self.__entries.items()
+                       if entry.expiration is not None and entry.expiration.replace(tzinfo=None) <= now]
+            for arrangement_id in expired:
+                del self.__entries[arrangement_id]
+            self.__generation += 1
+        return len(expired)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return dict(size=len(self), hits=self.hits, misses=self.misses, hit_rate=self.hit_rate)
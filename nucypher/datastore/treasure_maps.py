@@ -0,0 +1,158 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+
+from nucypher.datastore.datastore import Datastore, NotFound
+from nucypher.datastore.threading import ThreadedSession
+
+
+class TreasureMapStore:
+    """
+    Ursula's TreasureMaps, persisted in her datastore with a small LRU cache of hot maps in front.
+
+    Maps are kept as the exact bytes Alice pushed, so they can be served without re-serialization.
+    Since Ursula can't read a map's policy expiration, each map expires `ttl` after it was last pushed;
+    beyond `max_maps`, the least recently pushed maps are evicted first.  The stored maps are counted
+    once, and the count kept up to date from then on, so that a push only prunes when it's over the cap.
+    """
+
+    DEFAULT_CACHE_SIZE = 1000    # maps
+    DEFAULT_MAX_MAPS = 100_000   # maps
+    DEFAULT_TTL = timedelta(days=365)
+
+    def __init__(self,
+                 datastore: Datastore,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 max_maps: int = DEFAULT_MAX_MAPS,
+                 ttl: timedelta = DEFAULT_TTL):
+        self.datastore = datastore
+        self.cache_size = cache_size
+        self.max_maps = max_maps
+        self.ttl = ttl
+
+        self.__cache = OrderedDict()
+        self.__lock = Lock()
+        self.__count = None  # Of the maps in the datastore; counted on first use.
+        self.hits = 0
+        self.misses = 0
+
+    def __cache_put(self, map_id: bytes, map_bytes: bytes) -> None:
+        with self.__lock:
+            self.__cache[map_id] = map_bytes
+            self.__cache.move_to_end(map_id)
+            while len(self.__cache) > self.cache_size:
+                self.__cache.popitem(last=False)
+
+    def __cache_evict(self, map_ids) -> None:
+        with self.__lock:
+            for map_id in map_ids:
+                self.__cache.pop(map_id, None)
+
+    def __count_change(self, change: int) -> None:
+        with self.__lock:
+            if self.__count is not None:
+                self.__count += change
+
+    def store(self, map_id: bytes, map_bytes: bytes, now: datetime = None) -> None:
+        now = now or datetime.utcnow()
+        evicted = list()
+        with ThreadedSession(self.datastore.engine) as session:
+            # One transaction: whether the map is new, the count, and any eviction all follow from this write.
+            is_new = self.datastore.add_treasure_map(map_id=map_id,
+                                                     treasure_map=map_bytes,
+                                                     expiration=now + self.ttl,
+                                                     now=now,
+                                                     session=session,
+                                                     commit=False)
+            with self.__lock:
+                if self.__count is None:
+                    # Counted as of before this push, which is only added to the count once it's committed.
+                    self.__count = self.datastore.count_treasure_maps(session=session) - is_new
+                stored = self.__count + is_new
+            if stored > self.max_maps:
+                evicted = self.datastore.del_oldest_treasure_maps(keep=self.max_maps, session=session, commit=False)
+            self.datastore.commit(session=session)
+        self.__count_change(is_new - len(evicted))
+        self.__cache_evict(evicted)
+        self.__cache_put(map_id, map_bytes)
+
+    def get_bytes(self, map_id: bytes) -> bytes:
+        """Raises KeyError if there is no such map."""
+        with self.__lock:
+            map_bytes = self.__cache.get(map_id)
+            if map_bytes is not None:
+                self.__cache.move_to_end(map_id)
+                self.hits += 1
+                return map_bytes
+            self.misses += 1
+
+        try:
+            with ThreadedSession(self.datastore.engine) as session:
+                map_bytes = self.datastore.get_treasure_map(map_id=map_id, session=session)
+        except NotFound:
+            raise KeyError(map_id)
+        self.__cache_put(map_id, map_bytes)
+        return map_bytes
+
+    def prune(self, now: datetime = None) -> int:
+        """Deletes the maps expired as of `now` (in UTC), returning how many there were."""
+        with ThreadedSession(self.datastore.engine) as session:
+            expired = self.datastore.del_expired_treasure_maps(now=now, session=session)
+        self.__count_change(-len(expired))
+        self.__cache_evict(expired)
+        return len(expired)
+
+    def __setitem__(self, map_id: bytes, treasure_map) -> None:
+        self.store(map_id=map_id, map_bytes=bytes(treasure_map))
+
+    def __getitem__(self, map_id: bytes):
+        from nucypher.policy.collections import TreasureMap
+        return TreasureMap.from_bytes(self.get_bytes(map_id), verify=False)
+
+    def __contains__(self, map_id: bytes) -> bool:
+        try:
+            self.get_bytes(map_id)
+        except KeyError:
+            return False
+        return True
+
+    def __delitem__(self, map_id: bytes) -> None:
+        with ThreadedSession(self.datastore.engine) as session:
+            deleted = self.datastore.del_treasure_map(map_id=map_id, session=session)
+        self.__count_change(-deleted)
+        self.__cache_evict([map_id])
+        if not deleted:
+            raise KeyError(map_id)
+
+    def __len__(self) -> int:
+        with ThreadedSession(self.datastore.engine) as session:
+            return self.datastore.count_treasure_maps(session=session)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return dict(size=len(self),
+                    cached=len(self.__cache),
+                    hits=self.hits,
+                    misses=self.misses,
+                    hit_rate=self.hit_rate)
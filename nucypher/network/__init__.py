@@ -15,3 +15,11 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 LEARNING_LOOP_VERSION = 1
+
+# Version of the delta exchange on /node_metadata, in which a teacher sends a learner only the nodes it
+# learned about since a fleet state the learner has already seen.  Sent as the 'delta' query parameter,
+# and echoed in this header by a teacher replying with a delta rather than all of its known nodes.
+NODE_METADATA_DELTA_VERSION = 1
+NODE_METADATA_DELTA_HEADER = 'X-Node-Metadata-Delta'
+# Sent along with a delta: how many nodes the teacher knows in all, which the delta itself can't tell.
+NODE_METADATA_KNOWN_NODES_HEADER = 'X-Node-Metadata-Known-Nodes'
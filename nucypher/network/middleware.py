@@ -20,14 +20,21 @@ import requests
 import socket
 import ssl
 import time
+from collections import Counter, OrderedDict
+from threading import Lock
+from urllib.parse import urlparse
+
 from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
 from constant_sorrow.constants import CERTIFICATE_NOT_SAVED, EXEMPT_FROM_VERIFICATION
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from twisted.logger import Logger
+from typing import Tuple
 from umbral.cfrags import CapsuleFrag
 from umbral.signing import Signature
 
+from nucypher.network import NODE_METADATA_DELTA_VERSION
+
 EXEMPT_FROM_VERIFICATION.bool_value(False)
 
 
@@ -138,10 +145,124 @@ class NucypherMiddlewareClient:
         return 0  # Workaround so debuggers can represent objects of this class despite the unusual __getattr__.
 
 
+class NucypherSessionPool:
+    """
+    A bounded pool of persistent HTTP sessions, one per node (host, port, and pinned certificate),
+    so that repeated requests to the same node reuse an established TLS connection
+    instead of handshaking (and reloading the certificate file) every time.
+
+    Sessions taken with `session` are given back with `release`.  A session evicted while it is still
+    in use leaves the pool at once, but is only closed once the last thread using it is done.
+    """
+
+    DEFAULT_MAX_SESSIONS = 256
+    DEFAULT_IDLE_TIMEOUT = 60 * 5  # seconds
+
+    def __init__(self,
+                 max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        if max_sessions < 1:
+            raise ValueError("A session pool must hold at least one session.")
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+
+        self.__sessions = OrderedDict()  # (host, certificate) -> (session, last used); least recently used first
+        self.__in_use = Counter()        # session -> how many threads are using it
+        self.__evicted_in_use = set()    # sessions to close once they're released
+        self.__lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.__sessions)
+
+    @staticmethod
+    def _make_session(certificate_filepath) -> requests.Session:
+        session = requests.Session()
+        session.verify = certificate_filepath
+        return session
+
+    def session(self, host: str, certificate_filepath) -> requests.Session:
+        key = (host, str(certificate_filepath))
+        now = time.monotonic()
+        with self.__lock:
+            self.__evict_idle(now=now)
+            try:
+                session, _last_used = self.__sessions.pop(key)
+                self.hits += 1
+            except KeyError:
+                session = self._make_session(certificate_filepath)
+                self.misses += 1
+                while len(self.__sessions) >= self.max_sessions:
+                    _key, (least_recently_used, _last_used) = self.__sessions.popitem(last=False)
+                    self.__close(least_recently_used)
+                    self.evictions += 1
+            self.__sessions[key] = (session, now)
+            self.__in_use[session] += 1
+        return session
+
+    def release(self, session: requests.Session) -> None:
+        with self.__lock:
+            self.__in_use[session] -= 1
+            if self.__in_use[session] <= 0:
+                del self.__in_use[session]
+                if session in self.__evicted_in_use:
+                    self.__evicted_in_use.remove(session)
+                    session.close()
+
+    def __close(self, session: requests.Session) -> None:
+        if self.__in_use[session] > 0:
+            self.__evicted_in_use.add(session)
+        else:
+            session.close()
+
+    def __evict_idle(self, now: float) -> None:
+        # Sessions are ordered by last use, so stop at the first one that is still fresh.
+        while self.__sessions:
+            key, (session, last_used) = next(iter(self.__sessions.items()))
+            if now - last_used < self.idle_timeout:
+                break
+            del self.__sessions[key]
+            self.__close(session)
+            self.evictions += 1
+
+    def close(self) -> None:
+        with self.__lock:
+            while self.__sessions:
+                _key, (session, _last_used) = self.__sessions.popitem()
+                self.__close(session)
+
+    def stats(self) -> dict:
+        return dict(sessions=len(self), hits=self.hits, misses=self.misses, evictions=self.evictions)
+
+
+class PooledNucypherMiddlewareClient(NucypherMiddlewareClient):
+    """
+    A NucypherMiddlewareClient which sends requests through a NucypherSessionPool
+    rather than through one-shot module-level requests calls.
+    """
+
+    def __init__(self, registry=None, session_pool: NucypherSessionPool = None, *args, **kwargs):
+        super().__init__(registry=registry, *args, **kwargs)
+        self.session_pool = session_pool or NucypherSessionPool()
+
+    def invoke_method(self, method, url, *args, **kwargs):
+        host = urlparse(url).netloc
+        session = self.session_pool.session(host=host, certificate_filepath=kwargs.get("verify"))
+        try:
+            pooled_method = getattr(session, method.__name__)
+            return super().invoke_method(pooled_method, url, *args, **kwargs)
+        finally:
+            self.session_pool.release(session)
+
+
 class RestMiddleware:
     log = Logger()
 
     _client_class = NucypherMiddlewareClient
+    _pooled_client_class = PooledNucypherMiddlewareClient
 
     class UnexpectedResponse(Exception):
         def __init__(self, message, status, *args, **kwargs):
@@ -157,8 +278,11 @@ class RestMiddleware:
             self.reason = reason
             super().__init__(message=reason, status=400, *args, **kwargs)
 
-    def __init__(self, registry=None):
-        self.client = self._client_class(registry)
+    def __init__(self, registry=None, connection_pooling: bool = False):
+        if connection_pooling:
+            self.client = self._pooled_client_class(registry)
+        else:
+            self.client = self._client_class(registry)
 
     def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2,
                         current_attempt: int = 0):
@@ -186,19 +310,19 @@ class RestMiddleware:
                                                          backend=default_backend())
             return certificate
 
-    def consider_arrangement(self, arrangement):
+    def consider_arrangement(self, arrangement, timeout: float = 2):
         node = arrangement.ursula
         response = self.client.post(node_or_sprout=node,
                                     path="consider_arrangement",
                                     data=bytes(arrangement),
-                                    timeout=2)
+                                    timeout=timeout)
         return response
 
-    def enact_policy(self, ursula, kfrag_id, payload):
+    def enact_policy(self, ursula, kfrag_id, payload, timeout: float = 2):
         response = self.client.post(node_or_sprout=ursula,
                                     path=f'kFrag/{kfrag_id.hex()}',
                                     data=payload,
-                                    timeout=2)
+                                    timeout=timeout)
         return response
 
     def reencrypt(self, work_order):
@@ -252,7 +376,8 @@ class RestMiddleware:
                            node,
                            announce_nodes=None,
                            nodes_i_need=None,
-                           fleet_checksum=None):
+                           fleet_checksum=None,
+                           since_fleet_state: Tuple[str, int] = None):
         if nodes_i_need:
             # TODO: This needs to actually do something.  NRN
             # Include node_ids in the request; if the teacher node doesn't know about the
@@ -264,6 +389,12 @@ class RestMiddleware:
         else:
             params = {}
 
+        if since_fleet_state:
+            # Ask for only the nodes the teacher has learned about since its fleet state we last saw;
+            # teachers which can't (or don't know that state) send all of their known nodes instead.
+            since_checksum, since_updated = since_fleet_state
+            params.update(delta=NODE_METADATA_DELTA_VERSION, since=since_checksum, since_updated=since_updated)
+
         if announce_nodes:
             payload = bytes().join(bytes(VariableLengthBytestring(n)) for n in announce_nodes)
             response = self.client.post(node_or_sprout=node,
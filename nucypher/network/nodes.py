@@ -16,16 +16,21 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import contextlib
+import heapq
 import random
+from bisect import bisect_left
 from collections import OrderedDict, defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import suppress
+from functools import partial
+from threading import RLock
 
 import binascii
 import maya
 import requests
 import time
 from bytestring_splitter import BytestringSplitter, BytestringSplittingError, PartiallyKwargifiedBytes, \
-    VariableLengthBytestring
+    VARIABLE_HEADER_LENGTH, VariableLengthBytestring
 from constant_sorrow import constant_or_bytes
 from constant_sorrow.constants import (CERTIFICATE_NOT_SAVED, FLEET_STATES_MATCH, NEVER_SEEN, NOT_SIGNED,
                                        NO_KNOWN_NODES, NO_STORAGE_AVAILIBLE, UNKNOWN_FLEET_STATE)
@@ -35,7 +40,7 @@ from requests.exceptions import SSLError
 from twisted.internet import defer, reactor, task
 from twisted.internet.threads import deferToThread
 from twisted.logger import Logger
-from typing import Set, Tuple, Union
+from typing import Callable, Dict, List, Set, Tuple, Union
 from umbral.signing import Signature
 
 import nucypher
@@ -46,15 +51,23 @@ from nucypher.blockchain.eth.registry import BaseContractRegistry
 from nucypher.config.constants import SeednodeMetadata
 from nucypher.config.storages import ForgetfulNodeStorage
 from nucypher.crypto.api import keccak_digest, recover_address_eip_191, verify_eip_191
+from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import DecryptingPower, NoSigningPower, SigningPower, TransactingPower
 from nucypher.crypto.signing import signature_splitter
-from nucypher.network import LEARNING_LOOP_VERSION
+from nucypher.network import (
+    LEARNING_LOOP_VERSION,
+    NODE_METADATA_DELTA_HEADER,
+    NODE_METADATA_DELTA_VERSION,
+    NODE_METADATA_KNOWN_NODES_HEADER
+)
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.protocols import SuspiciousActivity
 from nucypher.network.server import TLSHostingPower
+from nucypher.network.verification import (BONDING, INTERFACE_SIGNATURE, STAKING, TLS, WORKER_SIGNATURE,
+                                           NodeVerificationPipeline, VerificationCache)
 
 
 def icon_from_checksum(checksum,
@@ -88,6 +101,8 @@ class FleetStateTracker:
     _nickname = NO_KNOWN_NODES
     _nickname_metadata = NO_KNOWN_NODES
     _tracking = False
+    _deferring = 0  # How many deferred_recording blocks we're in
+    _recording_deferred = False  # Whether a node was saved while recording was deferred
     most_recent_node_change = NO_KNOWN_NODES
     snapshot_splitter = BytestringSplitter(32, 4)
     log = Logger("Learning")
@@ -98,10 +113,36 @@ class FleetStateTracker:
         self.updated = maya.now()
         self._nodes = OrderedDict()
         self.states = OrderedDict()
+        self._deferral_lock = RLock()
+
+    @property
+    def _nodes(self):
+        return self.__nodes
+
+    @_nodes.setter
+    def _nodes(self, nodes):
+        self.__nodes = nodes
+        # Alongside the nodes, we keep them sorted by checksum address (the order in which they're
+        # hashed into the fleet state checksum) so that a change needn't re-sort the whole fleet.
+        self.__sorted_nodes = sorted(nodes.values(), key=lambda n: n.checksum_address)
+        self.__sorted_addresses = [node.checksum_address for node in self.__sorted_nodes]
 
     def __setitem__(self, key, value):
+        replaced_node = self._nodes.get(key)
+        if replaced_node is not None:
+            index = self.__sorted_index(replaced_node)
+            del self.__sorted_nodes[index]
+            del self.__sorted_addresses[index]
+        index = bisect_left(self.__sorted_addresses, value.checksum_address)
+        self.__sorted_nodes.insert(index, value)
+        self.__sorted_addresses.insert(index, value.checksum_address)
+
         self._nodes[key] = value
 
+        with self._deferral_lock:
+            if self._deferring:
+                self._recording_deferred = True
+                return
         if self._tracking:
             self.log.info("Updating fleet state after saving node {}".format(value))
             self.record_fleet_state()
@@ -166,15 +207,21 @@ class FleetStateTracker:
     def record_fleet_state(self, additional_nodes_to_track=None):
         if additional_nodes_to_track:
             self.additional_nodes_to_track.extend(additional_nodes_to_track)
+        with self._deferral_lock:
+            if self._deferring:
+                # It's recorded once, when the outermost deferred_recording block ends.
+                self._recording_deferred = True
+                return
+            self._recording_deferred = False  # Whatever was deferred is recorded now.
         if not self._nodes:
             # No news here.
             return
         sorted_nodes = self.sorted()
 
-        sorted_nodes_joined = b"".join(bytes(n) for n in sorted_nodes)
-        checksum = keccak_digest(sorted_nodes_joined).hex()
+        # Nodes memoize their own bytes, so this is one pass of hashing, without re-serializing anyone.
+        checksum = keccak_digest(*sorted_nodes).hex()
         if checksum not in self.states:
-            self.checksum = keccak_digest(b"".join(bytes(n) for n in self.sorted())).hex()
+            self.checksum = checksum
             self.updated = maya.now()
             # For now we store the sorted node list.  Someday we probably spin this out into
             # its own class, FleetState, and use it as the basis for partial updates.
@@ -186,16 +233,42 @@ class FleetStateTracker:
             self.states[checksum] = new_state
             return checksum, new_state
 
+    @contextlib.contextmanager
+    def deferred_recording(self):
+        """
+        Within this block, neither saving a node nor calling record_fleet_state records a new fleet state;
+        if either happened, the fleet state is recorded once, when the outermost block ends.
+        """
+        with self._deferral_lock:
+            self._deferring += 1
+        try:
+            yield
+        finally:
+            with self._deferral_lock:
+                self._deferring -= 1
+                if not self._deferring and self._recording_deferred:
+                    self._recording_deferred = False
+                    self.log.info("Updating fleet state after saving nodes")
+                    self.record_fleet_state()
+
     def start_tracking_state(self, additional_nodes_to_track=None):
         if additional_nodes_to_track is None:
             additional_nodes_to_track = list()
         self.additional_nodes_to_track.extend(additional_nodes_to_track)
         self._tracking = True
-        self.update_fleet_state()
+        self.record_fleet_state()
 
     def sorted(self):
-        nodes_to_consider = list(self._nodes.values()) + self.additional_nodes_to_track
-        return sorted(nodes_to_consider, key=lambda n: n.checksum_address)
+        by_address = lambda n: n.checksum_address
+        additional_nodes = sorted(self.additional_nodes_to_track, key=by_address)
+        # A stable merge: like sorting all of them together, known nodes come before additional ones at a tie.
+        return list(heapq.merge(self.__sorted_nodes, additional_nodes, key=by_address))
+
+    def __sorted_index(self, node) -> int:
+        index = bisect_left(self.__sorted_addresses, node.checksum_address)
+        while self.__sorted_nodes[index] is not node:
+            index += 1
+        return index
 
     def shuffled(self):
         nodes_we_know_about = list(self._nodes.values())
@@ -218,34 +291,138 @@ class FleetStateTracker:
                 }
 
 
+class TeacherScore:
+    """
+    How good a teacher has been to a Learner: how reliably it answers, and how many nodes
+    we didn't already know about it tells us.  Both are smoothed over recent rounds, so a teacher
+    which stops answering, or has nothing new to teach, falls out of favor.
+    """
+    SMOOTHING = 0.3              # Weight of the most recent round
+    INITIAL_RESPONSIVENESS = 1.0  # The benefit of the doubt, for teachers we haven't asked yet
+    INITIAL_NEW_NODES = 1.0
+    INITIAL_WEIGHT = INITIAL_RESPONSIVENESS * (1 + INITIAL_NEW_NODES)
+    MINIMUM_WEIGHT = 0.05         # Even the worst teacher gets asked now and then.
+
+    def __init__(self):
+        self.rounds = 0
+        self.responsiveness = self.INITIAL_RESPONSIVENESS
+        self.new_nodes = self.INITIAL_NEW_NODES
+        self.latency = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rounds={self.rounds}, weight={self.weight:.2f})"
+
+    def record(self, responded: bool, new_nodes: int = 0, latency: float = None) -> None:
+        self.rounds += 1
+        self.responsiveness += self.SMOOTHING * (float(responded) - self.responsiveness)
+        self.new_nodes += self.SMOOTHING * (new_nodes - self.new_nodes)
+        if latency is not None:
+            self.latency = latency if self.latency is None else self.latency + self.SMOOTHING * (latency - self.latency)
+
+    @property
+    def weight(self) -> float:
+        return max(self.responsiveness * (1 + self.new_nodes), self.MINIMUM_WEIGHT)
+
+
 class NodeSprout(PartiallyKwargifiedBytes):
     """
     An abridged node class designed for optimization of instantiation of > 100 nodes simultaneously.
+
+    Sprouts made with from_view go further: they only read their address and timestamp - all that's
+    needed to tell whether they're news - from their slice of a teacher's payload.  The rest of their
+    metadata isn't split out until something needs it.
     """
     verified_node = False
+    _metadata_bytes = None  # A sprout's metadata never changes, so it's serialized at most once.
 
-    def __init__(self, node_metadata):
+    def __init__(self, node_metadata=None):
         super().__init__(node_metadata)
-        self.checksum_address = to_checksum_address(self.public_address)
-        self.nickname = nickname_from_seed(self.checksum_address)[0]
-        self.timestamp = maya.MayaDT(self.timestamp)  # Weird for this to be in init. maybe this belongs in the splitter also.
-        self._hash = int.from_bytes(self.public_address, byteorder="big")  # stop-propagation logic (ie, only propagate verified, staked nodes) keeps this unique and BFT.
-        self._repr = f"({self.__class__.__name__})⇀{self.nickname}↽ ({self.checksum_address})"
+        self._view = None  # For a lazy sprout, its not-yet-split metadata (without the version).
+        self._splitter = None
+        self._timestamp_epoch = None
+        self._timestamp = None
+        self._checksum_address = None
+        self._nickname = None
+
+    @classmethod
+    def from_view(cls, node_view: memoryview, splitter, receiver, min_tail_length: int = 0) -> 'NodeSprout':
+        """
+        A lazy sprout over `node_view`, the metadata of one node (after its version) as serialized by
+        Ursula.  `splitter` splits that metadata into a regular sprout, whose `receiver` matures it.
+        At least `min_tail_length` bytes of metadata must follow the timestamp.
+        """
+        sprout = cls()
+        sprout.set_receiver(receiver)
+        sprout.set_additional_kwargs(dict())
+        sprout._view = node_view
+        sprout._splitter = splitter
+
+        # The address comes first, and the timestamp right after the domains.
+        sprout.public_address = bytes(node_view[:PUBLIC_ADDRESS_LENGTH])
+        cursor = PUBLIC_ADDRESS_LENGTH
+        domains_length = int.from_bytes(node_view[cursor:cursor + VARIABLE_HEADER_LENGTH], "big")
+        cursor += VARIABLE_HEADER_LENGTH + domains_length
+        timestamp_bytes = node_view[cursor:cursor + 4]
+        if len(timestamp_bytes) != 4 or len(node_view) < cursor + 4 + min_tail_length:
+            raise BytestringSplittingError(f"Not enough bytes for a node's metadata: {len(node_view)}")
+        sprout._timestamp_epoch = int.from_bytes(timestamp_bytes, "big")
+        return sprout
+
+    def detach(self) -> None:
+        """Copies this sprout's metadata out of the payload it came in, so that the payload can be freed."""
+        if self._view is not None and len(self._view.obj) != len(self._view):  # Not already a copy
+            self._view = memoryview(bytes(self._view))
+
+    @property
+    def processed_objects(self):
+        if self._processed_objects is None and self._view is not None:
+            split_sprout = self._splitter(bytes(self._view), partial=True)
+            self._processed_objects = split_sprout.processed_objects
+            self._original_bytes = split_sprout._original_bytes
+            self._view = None
+        return self._processed_objects
+
+    @processed_objects.setter
+    def processed_objects(self, processed_objects):
+        self._processed_objects = processed_objects
+
+    @property
+    def timestamp(self) -> maya.MayaDT:
+        if self._timestamp is None:
+            if self._timestamp_epoch is None:
+                self._timestamp_epoch = super().__getattr__('timestamp')
+            self._timestamp = maya.MayaDT(self._timestamp_epoch)
+        return self._timestamp
+
+    @property
+    def checksum_address(self) -> str:
+        if self._checksum_address is None:
+            self._checksum_address = to_checksum_address(self.public_address)
+        return self._checksum_address
+
+    @property
+    def nickname(self) -> str:
+        if self._nickname is None:
+            self._nickname = nickname_from_seed(self.checksum_address)[0]
+        return self._nickname
 
     def __hash__(self):
-        return self._hash
+        # stop-propagation logic (ie, only propagate verified, staked nodes) keeps this unique and BFT.
+        return int.from_bytes(self.public_address, byteorder="big")
 
     def __repr__(self):
-        return self._repr
+        return f"({self.__class__.__name__})⇀{self.nickname}↽ ({self.checksum_address})"
 
     def __bytes__(self):
-        b = super().__bytes__()
+        if self._metadata_bytes is None:
+            b = bytes(self._view) if self._view is not None else super().__bytes__()
 
-        # We assume that the TEACHER_VERSION of this codebase is the version for this NodeSprout.
-        # This is probably true, right?  Might need to be re-examined someday if we have
-        # different node types of different versions.
-        version = Teacher.TEACHER_VERSION.to_bytes(2, "big")
-        return version + b
+            # We assume that the TEACHER_VERSION of this codebase is the version for this NodeSprout.
+            # This is probably true, right?  Might need to be re-examined someday if we have
+            # different node types of different versions.
+            version = Teacher.TEACHER_VERSION.to_bytes(2, "big")
+            self._metadata_bytes = version + b
+        return self._metadata_bytes
 
     @property
     def stamp(self) -> bytes:
@@ -319,11 +496,35 @@ class Learner:
                  node_storage=None,
                  save_metadata: bool = False,
                  abort_on_learning_error: bool = False,
-                 lonely: bool = False
+                 lonely: bool = False,
+                 teachers_per_round: int = 1,
+                 teacher_timeout: float = None,
+                 verification_workers: int = 0,
+                 verification_cache: VerificationCache = None,
+                 metadata_flush_interval: float = None,
                  ) -> None:
 
         self.log = Logger("learning-loop")  # type: Logger
 
+        # How many teachers to ask at once in each learning round; 1 keeps the one-teacher-at-a-time cycle.
+        if teachers_per_round < 1:
+            raise ValueError(f"teachers_per_round must be at least 1, got {teachers_per_round}.")
+        self.teachers_per_round = teachers_per_round
+        self.teacher_timeout = teacher_timeout or self._SHORT_LEARNING_DELAY
+        self.teacher_scores = dict()  # type: Dict[str, TeacherScore]
+        # The fleet state each teacher was in when we last learned from it.  Kept apart from the teacher's
+        # snapshot, which may have been taken by another learner holding the same node object.
+        self._teacher_fleet_states = dict()  # type: Dict[str, Tuple[str, int]]
+
+        # With verification workers, nodes learned about eagerly are verified in the background, and only
+        # remembered once verified; otherwise, they're verified one at a time as they're remembered.
+        self._remembering = RLock()
+        if verification_workers:
+            self.verification_pipeline = NodeVerificationPipeline(learner=self, workers=verification_workers)
+        else:
+            self.verification_pipeline = None
+        self.verification_cache = verification_cache  # Spares nodes verified before from being verified again.
+
         self.learning_domains = domains
         if not self.federated_only:
             default_middleware = self.__DEFAULT_MIDDLEWARE_CLASS(registry=self.registry)
@@ -331,6 +532,15 @@ class Learner:
             default_middleware = self.__DEFAULT_MIDDLEWARE_CLASS()
         self.network_middleware = network_middleware or default_middleware
         self.save_metadata = save_metadata
+
+        # Node metadata remembered during a learning round is written to storage once, when the round ends.
+        # With a flush interval, it's instead written at most once per interval, whenever it was remembered.
+        # Either way, nodes remembered since the last write aren't stored if we crash, and are learned again.
+        self.metadata_flush_interval = metadata_flush_interval
+        self._pending_node_metadata = OrderedDict()  # By checksum address; only the latest of each node is written.
+        self._remembering_batches = 0
+        self._metadata_flush_task = task.LoopingCall(self.flush_node_metadata)
+
         self.start_learning_now = start_learning_now
         self.learn_on_same_thread = learn_on_same_thread
 
@@ -416,8 +626,43 @@ class Learner:
 
     def read_nodes_from_storage(self) -> None:
         stored_nodes = self.node_storage.all(federated_only=self.federated_only)  # TODO: #466
-        for node in stored_nodes:
-            self.remember_node(node)
+        with self.batched_remembering():
+            for node in stored_nodes:
+                self.remember_node(node)
+
+    @contextlib.contextmanager
+    def batched_remembering(self):
+        """
+        Within this block, the metadata of remembered nodes is held back from storage, and saving them
+        doesn't record a new fleet state.  Both happen once, when the outermost block ends.
+        """
+        with self._remembering:
+            self._remembering_batches += 1
+        try:
+            with self.known_nodes.deferred_recording():
+                yield
+        finally:
+            with self._remembering:
+                self._remembering_batches -= 1
+                outermost = not self._remembering_batches
+            if outermost and not self.metadata_flush_interval:
+                self.flush_node_metadata()
+
+    def flush_node_metadata(self) -> None:
+        """Writes the metadata of the nodes remembered since it was last written."""
+        with self._remembering:
+            pending_nodes = list(self._pending_node_metadata.values())
+            self._pending_node_metadata.clear()
+        if pending_nodes:
+            self.node_storage.store_nodes_metadata(pending_nodes)
+            self.log.debug(f"Wrote the metadata of {len(pending_nodes)} nodes to {self.node_storage.source}")
+
+    def _save_node_metadata(self, node) -> None:
+        with self._remembering:
+            if self._remembering_batches or self.metadata_flush_interval:
+                self._pending_node_metadata[node.checksum_address] = node
+                return
+        self.node_storage.store_node_metadata(node=node)
 
     def remember_node(self,
                       node,
@@ -431,22 +676,22 @@ class Learner:
         # VERIFIED_CERT
         # VERIFIED_STAKE
 
-        if node == self:  # No need to remember self.
-            return False
-
-        # First, determine if this is an outdated representation of an already known node.
-        # TODO: #1032 or, since it's closed and will never re-opened, i am the :=
-        with suppress(KeyError):
-            already_known_node = self.known_nodes[node.checksum_address]
-            if not node.timestamp > already_known_node.timestamp:
-                self.log.debug("Skipping already known node {}".format(already_known_node))
+        with self._remembering:  # Nodes may also be remembered once verified in the background.
+            # First, determine if this is an outdated representation of an already known node.
+            # This only needs a sprout's address and timestamp, so it's checked before anything else.
+            if self._already_know_about(node):
                 # This node is already known.  We can safely return.
                 return False
 
-        self.known_nodes[node.checksum_address] = node
+            if node == self:  # No need to remember self.
+                return False
+
+            if isinstance(node, NodeSprout):
+                node.detach()  # Otherwise, a known node keeps the whole of its teacher's payload alive.
+            self.known_nodes[node.checksum_address] = node
 
         if self.save_metadata:
-            self.node_storage.store_node_metadata(node=node)
+            self._save_node_metadata(node)
 
         if eager:
             node.mature()
@@ -462,7 +707,8 @@ class Learner:
             try:
                 node.verify_node(force=force_verification_recheck,
                                  network_middleware_client=self.network_middleware.client,
-                                 registry=self.registry)  # composed on character subclass, determines operating mode
+                                 registry=self.registry,  # composed on character subclass, determines operating mode
+                                 verification_cache=self.verification_cache)
             except SSLError:
                 # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?  567
                 return False
@@ -486,10 +732,22 @@ class Learner:
         self._node_ids_to_learn_about_immediately.discard(node.checksum_address)
 
         if record_fleet_state:
-            self.known_nodes.record_fleet_state()
+            with self._remembering:
+                if not self._remembering_batches:  # Otherwise, it's recorded once the batch ends.
+                    self.known_nodes.record_fleet_state()
 
         return node
 
+    def _already_know_about(self, node) -> bool:
+        """True if we know about this node, in a version at least as new as this one."""
+        # TODO: #1032 or, since it's closed and will never re-opened, i am the :=
+        with suppress(KeyError):
+            already_known_node = self.known_nodes[node.checksum_address]
+            if not node.timestamp > already_known_node.timestamp:
+                self.log.debug("Skipping already known node {}".format(already_known_node))
+                return True
+        return False
+
     def start_learning_loop(self, now=False):
         if self._learning_task.running:
             return False
@@ -504,6 +762,7 @@ class Learner:
                 self.load_seednodes()
 
             self.learn_from_teacher_node()
+            self._start_metadata_flushing()
             self.learning_deferred = self._learning_task.start(interval=self._SHORT_LEARNING_DELAY)
             self.learning_deferred.addErrback(self.handle_learning_errors)
             return self.learning_deferred
@@ -516,6 +775,7 @@ class Learner:
                 seeder_deferred.addErrback(self.handle_learning_errors)
                 learning_deferreds.append(seeder_deferred)
 
+            self._start_metadata_flushing()
             learner_deferred = self._learning_task.start(interval=self._SHORT_LEARNING_DELAY, now=now)
             learner_deferred.addErrback(self.handle_learning_errors)
             learning_deferreds.append(learner_deferred)
@@ -529,6 +789,16 @@ class Learner:
         """
         if self._learning_task.running:
             self._learning_task.stop()
+        if self.verification_pipeline:
+            self.verification_pipeline.stop()
+        if self._metadata_flush_task.running:
+            self._metadata_flush_task.stop()
+        self.flush_node_metadata()
+
+    def _start_metadata_flushing(self) -> None:
+        if self.metadata_flush_interval and not self._metadata_flush_task.running:
+            flushing = self._metadata_flush_task.start(interval=self.metadata_flush_interval, now=False)
+            flushing.addErrback(self.handle_learning_errors)
 
     def handle_learning_errors(self, *args, **kwargs):
         failure = args[0]
@@ -767,12 +1037,148 @@ class Learner:
         """
         self._learning_round += 1
 
+        if self.teachers_per_round > 1:
+            return self._learn_from_teachers_concurrently(eager=eager)
+
         try:
             current_teacher = self.current_teacher_node()
         except self.NotEnoughTeachers as e:
             self.log.warn("Can't learn right now: {}".format(e.args[0]))
             return
 
+        try:
+            sprouts, fleet_state, is_delta = self._get_nodes_from_teacher(current_teacher)
+        finally:
+            # Is cycling happening in the right order?
+            self.cycle_teacher_node()
+
+        if sprouts is None or sprouts is NO_KNOWN_NODES or sprouts is FLEET_STATES_MATCH:
+            self._score_teacher(current_teacher, responded=sprouts is not None)
+            return sprouts
+
+        with self.batched_remembering():
+            remembered = self._remember_sprouts(sprouts, teacher=current_teacher, fleet_state=fleet_state, eager=eager)
+            self._score_teacher(current_teacher, responded=True, new_nodes=len(remembered))
+
+            ###################
+
+
+            learning_round_log_message = "Learning round {}.  Teacher: {} {} {} nodes, {} were new."
+            self.log.info(learning_round_log_message.format(self._learning_round,
+                                                            current_teacher,
+                                                            "sent us a delta of" if is_delta else "knew about",
+                                                            len(sprouts),
+                                                            len(remembered)))
+            if remembered:
+                self.known_nodes.record_fleet_state()
+        return sprouts
+
+    def _learn_from_teachers_concurrently(self, eager=False):
+        """
+        One learning round in which several teachers are asked at once, each with its own deadline.
+        What they tell us is merged - keeping only the newest sprout of each node - before it's remembered.
+        """
+        if self.unresponsive_seed_nodes and not self.lonely:
+            self.log.info("Still have unresponsive seed nodes; trying again to connect.")
+            self.load_seednodes()
+
+        try:
+            teachers = self.select_teachers(self.teachers_per_round)
+        except self.NotEnoughTeachers as e:
+            self.log.warn("Can't learn right now: {}".format(e.args[0]))
+            return
+
+        def ask(teacher):
+            started = time.perf_counter()
+            return (*self._get_nodes_from_teacher(teacher), time.perf_counter() - started)
+
+        executor = ThreadPoolExecutor(max_workers=len(teachers), thread_name_prefix="learning")
+        try:
+            futures = {executor.submit(ask, teacher): teacher for teacher in teachers}
+            answered, _too_slow = wait(futures, timeout=self.teacher_timeout)
+        finally:
+            executor.shutdown(wait=False)  # Teachers past their deadline are left to finish on their own.
+
+        newest_sprouts = dict()  # By checksum address
+        taught_by = dict()       # Which teacher told us about each of those, by checksum address
+        fleet_states = dict()    # The fleet state each teacher told us about
+        latencies = dict()
+        for future, teacher in futures.items():
+            if future not in answered:
+                self.log.info(f"Teacher {teacher} didn't answer within {self.teacher_timeout} seconds.")
+                continue
+            try:
+                sprouts, fleet_states[teacher], _is_delta, latencies[teacher] = future.result()
+            except requests.exceptions.RequestException as e:
+                self.log.info(f"Bad Response from teacher: {teacher}:{e}.")
+                continue
+            if sprouts is None:
+                del latencies[teacher]
+                continue
+            if sprouts is NO_KNOWN_NODES or sprouts is FLEET_STATES_MATCH:
+                continue
+            for sprout in sprouts:
+                known_sprout = newest_sprouts.get(sprout.checksum_address)
+                if known_sprout is None or sprout.timestamp > known_sprout.timestamp:
+                    newest_sprouts[sprout.checksum_address] = sprout
+                    taught_by[sprout.checksum_address] = teacher
+
+        remembered = []
+        with self.batched_remembering():
+            for teacher in teachers:
+                taught = [sprout for address, sprout in newest_sprouts.items() if taught_by[address] is teacher]
+                new_nodes = self._remember_sprouts(taught,
+                                                   teacher=teacher,
+                                                   fleet_state=fleet_states.get(teacher),
+                                                   eager=eager)
+                remembered.extend(new_nodes)
+                self._score_teacher(teacher,
+                                    responded=teacher in latencies,
+                                    new_nodes=len(new_nodes),
+                                    latency=latencies.get(teacher))
+
+            learning_round_log_message = "Learning round {}.  {} of {} teachers answered with {} nodes, {} were new."
+            self.log.info(learning_round_log_message.format(self._learning_round,
+                                                            len(latencies),
+                                                            len(teachers),
+                                                            len(newest_sprouts),
+                                                            len(remembered)))
+            if remembered:
+                self.known_nodes.record_fleet_state()
+        return list(newest_sprouts.values())
+
+    def select_teachers(self, quantity: int) -> list:
+        """
+        Picks up to `quantity` distinct teachers at random, favoring those with the best scores.
+
+        These are drawn from all of the known nodes; the single-teacher cycle (`teacher_nodes` and the
+        current teacher) is neither consulted nor advanced.
+        """
+        candidates = list(self.known_nodes)
+        if not candidates:
+            raise self.NotEnoughTeachers("Need some nodes to start learning from.")
+
+        def weight(node):
+            score = self.teacher_scores.get(node.checksum_address)
+            return score.weight if score else TeacherScore.INITIAL_WEIGHT
+
+        # Weighted sampling without replacement (Efraimidis-Spirakis): keep the largest of random() ** (1 / weight).
+        keyed = ((random.random() ** (1 / weight(node)), node) for node in candidates)
+        return [node for _key, node in heapq.nlargest(quantity, keyed, key=lambda pair: pair[0])]
+
+    def _score_teacher(self, teacher, responded: bool, new_nodes: int = 0, latency: float = None) -> None:
+        score = self.teacher_scores.setdefault(teacher.checksum_address, TeacherScore())
+        score.record(responded=responded, new_nodes=new_nodes, latency=latency)
+
+    def _get_nodes_from_teacher(self, current_teacher):
+        """
+        Asks `current_teacher` about the nodes it knows, without remembering any of them.
+
+        Returns their sprouts, NO_KNOWN_NODES or FLEET_STATES_MATCH if there's nothing to learn,
+        or None if the teacher didn't give us a usable answer - along with the teacher's fleet state
+        those sprouts bring us up to, once they're remembered, and whether they're only a delta since
+        the last one.
+        """
         if Teacher in self.__class__.__bases__:
             announce_nodes = [self]
         else:
@@ -780,6 +1186,9 @@ class Learner:
 
         unresponsive_nodes = set()
 
+        # If we've already learned everything in this teacher's fleet state, only ask what's new since.
+        since_fleet_state = self._teacher_fleet_states.get(current_teacher.checksum_address)
+
         #
         # Request
         #
@@ -788,40 +1197,37 @@ class Learner:
             response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
                                                                   nodes_i_need=self._node_ids_to_learn_about_immediately,
                                                                   announce_nodes=announce_nodes,
-                                                                  fleet_checksum=self.known_nodes.checksum)
+                                                                  fleet_checksum=self.known_nodes.checksum,
+                                                                  since_fleet_state=since_fleet_state)
         except NodeSeemsToBeDown as e:
             unresponsive_nodes.add(current_teacher)
             self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
-            return
+            return None, None, False
         except current_teacher.InvalidNode as e:
             # Ugh.  The teacher is invalid.  Rough.
             # TODO: Bucket separately and report.
             unresponsive_nodes.add(current_teacher)
             self.log.info("Teacher is invalid: {}:{}.".format(current_teacher, e))
-            return
-
-        finally:
-            # Is cycling happening in the right order?
-            self.cycle_teacher_node()
+            return None, None, False
 
         # Before we parse the response, let's handle some edge cases.
         if response.status_code == 204:
             # In this case, this node knows about no other nodes.  Hopefully we've taught it something.
             if response.content == b"":
-                return NO_KNOWN_NODES
+                return NO_KNOWN_NODES, None, False
             # In the other case - where the status code is 204 but the repsonse isn't blank - we'll keep parsing.
             # It's possible that our fleet states match, and we'll check for that later.
 
         elif response.status_code != 200:
             self.log.info("Bad response from teacher {}: {} - {}".format(current_teacher, response, response.content))
-            return
+            return None, None, False
 
         if not set(self.learning_domains).intersection(set(current_teacher.serving_domains)):
             teacher_domains = ",".join(current_teacher.serving_domains)
             learner_domains = ",".join(self.learning_domains)
             self.log.debug(
                 f"{current_teacher} is serving {teacher_domains}, but we are learning {learner_domains}")
-            return  # This node is not serving any of our domains.
+            return None, None, False  # This node is not serving any of our domains.
 
 
         #
@@ -831,7 +1237,7 @@ class Learner:
             signature, node_payload = signature_splitter(response.content, return_remainder=True)
         except BytestringSplittingError as e:
             self.log.warn("No signature prepended to Teacher {} payload: {}".format(current_teacher, response.content))
-            return
+            return None, None, False
 
         try:
             self.verify_from(current_teacher, node_payload, signature=signature)
@@ -847,19 +1253,60 @@ class Learner:
         current_teacher.last_seen = maya.now()
         # TODO: This is weird - let's get a stranger FleetState going.  NRN
         checksum = fleet_state_checksum_bytes.hex()
+        updated = int.from_bytes(fleet_state_updated_bytes, byteorder="big")
 
         if constant_or_bytes(node_payload) is FLEET_STATES_MATCH:
             current_teacher.update_snapshot(checksum=checksum,
-                                            updated=maya.MayaDT(
-                                                int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                            updated=maya.MayaDT(updated),
                                             number_of_known_nodes=len(self.known_nodes))
-            return FLEET_STATES_MATCH
+            self._teacher_fleet_states[current_teacher.checksum_address] = (checksum, updated)
+            return FLEET_STATES_MATCH, None, False
 
         # Note: There was previously a version check here, but that required iterating through node bytestrings twice,
         # so it has been removed.  When we create a new Ursula bytestring version, let's put the check
         # somewhere more performant, like mature() or verify_node().
 
         sprouts = self.node_class.batch_from_bytes(node_payload)
+
+        # A delta only holds the nodes the teacher learned about since the fleet state we asked about.
+        is_delta = response.headers.get(NODE_METADATA_DELTA_HEADER) == str(NODE_METADATA_DELTA_VERSION)
+
+        number_of_known_nodes = len(sprouts)
+        if is_delta:
+            with contextlib.suppress(KeyError, ValueError):
+                number_of_known_nodes = int(response.headers[NODE_METADATA_KNOWN_NODES_HEADER])
+
+        current_teacher.update_snapshot(checksum=checksum,
+                                        updated=maya.MayaDT(updated),
+                                        number_of_known_nodes=number_of_known_nodes)
+        return sprouts, (checksum, updated), is_delta
+
+    def _remember_sprouts(self, sprouts, teacher, fleet_state=None, eager=False) -> list:
+        """
+        Remembers the sprouts `teacher` told us about, returning those which were new to us
+        (or, with a verification pipeline, those submitted to it, to be remembered once verified).
+
+        If all of them were remembered, `teacher`'s `fleet_state` is kept, so that next time we only ask
+        what's new since; otherwise, we'll be told about the ones which failed again.
+        """
+        new_sprouts = [sprout for sprout in sprouts if not self._already_know_about(sprout) and sprout != self]
+
+        if eager and self.verification_pipeline:
+            # They'll be remembered once verified.
+            submitted = [sprout for sprout in new_sprouts if self.verification_pipeline.submit(sprout)]
+            if fleet_state and not new_sprouts:
+                self._teacher_fleet_states[teacher.checksum_address] = fleet_state
+            return submitted
+
+        if eager and not self.federated_only and self.registry:
+            # Look up the stakes of all the nodes we're about to verify together, rather than one node at a time.
+            # Those failing these checks are left to fail them again as they're verified (and reported) one by one.
+            unverified_sprouts = new_sprouts
+            if self.verification_cache is not None:
+                unverified_sprouts = [sprout for sprout in unverified_sprouts if self.verification_cache.get(sprout) is None]
+            if unverified_sprouts:
+                self.node_class.validate_workers(unverified_sprouts, registry=self.registry)
+
         remembered = []
         for sprout in sprouts:
             fail_fast = True  # TODO  NRN
@@ -901,26 +1348,12 @@ class Learner:
 
             except sprout.SuspiciousActivity:
                 message = f"Suspicious Activity: Discovered sprout with bad signature: {sprout}." \
-                          f"Propagated by: {current_teacher}"
+                          f"Propagated by: {teacher}"
                 self.log.warn(message)
 
-
-        # Is cycling happening in the right order?
-        current_teacher.update_snapshot(checksum=checksum,
-                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                        number_of_known_nodes=len(sprouts))
-
-        ###################
-
-
-        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
-        self.log.info(learning_round_log_message.format(self._learning_round,
-                                                        current_teacher,
-                                                        len(sprouts),
-                                                        len(remembered)))
-        if remembered:
-            self.known_nodes.record_fleet_state()
-        return sprouts
+        if fleet_state and len(remembered) == len(new_sprouts):
+            self._teacher_fleet_states[teacher.checksum_address] = fleet_state
+        return remembered
 
 
 class Teacher:
@@ -929,6 +1362,7 @@ class Teacher:
     log = Logger("teacher")
     synchronous_query_timeout = 20  # How long to wait during REST endpoints for blockchain queries to resolve
     __DEFAULT_MIN_SEED_STAKE = 0
+    _metadata_bytes = None  # Memoized serialization of this node; see __bytes__.
 
     def __init__(self,
                  domains: Set,
@@ -969,6 +1403,10 @@ class Teacher:
         self.verified_node = False
         self.__worker_address = None
 
+        # Signed /node_metadata payloads describing the fleet state (checksum, updated) we last served.
+        self._fleet_state_payloads = dict()
+        self._fleet_state_of_payloads = None
+
     class InvalidNode(SuspiciousActivity):
         """Raised when a node has an invalid characteristic - stamp, interface, or address."""
 
@@ -1040,6 +1478,68 @@ class Teacher:
         payload += ursulas_as_bytes
         return payload
 
+    def bytestring_of_known_nodes_since(self, checksum: str) -> bytes:
+        """
+        Like bytestring_of_known_nodes, but leaving out the nodes which are unchanged since
+        the fleet state `checksum`, which the learner has already seen.
+        """
+        already_described = {bytes(node) for node in self.known_nodes.states[checksum].nodes}
+        payload = self.known_nodes.snapshot()
+        new_nodes = (n for n in self.known_nodes if bytes(n) not in already_described)
+        ursulas_as_bytes = bytes().join(bytes(VariableLengthBytestring(n)) for n in new_nodes)
+        ursulas_as_bytes += VariableLengthBytestring(bytes(self))
+
+        payload += ursulas_as_bytes
+        return payload
+
+    def signed_bytestring_of_known_nodes_since(self, checksum: str, updated: int) -> Union[bytes, None]:
+        """
+        The signed delta since the fleet state with `checksum`, last updated at epoch `updated`,
+        or None if we don't know that state - in which case the learner needs all of our known nodes.
+        """
+        state = self.known_nodes.states.get(checksum)
+        if state is None or state.updated.epoch != updated:
+            return None
+
+        def sign_delta():
+            delta_bytestring = self.bytestring_of_known_nodes_since(checksum)
+            return bytes(self.stamp(delta_bytestring)) + delta_bytestring
+        return self._signed_for_fleet_state(f'known_nodes_since_{checksum}', sign_delta)
+
+    def signed_bytestring_of_known_nodes(self) -> bytes:
+        """
+        The signed payload served at /node_metadata.  Serializing and signing every known node is
+        costly, so this is done once per fleet state and reused until a new one is recorded.
+        """
+        def sign_known_nodes():
+            known_nodes_bytestring = self.bytestring_of_known_nodes()
+            return bytes(self.stamp(known_nodes_bytestring)) + known_nodes_bytestring
+        return self._signed_for_fleet_state('known_nodes', sign_known_nodes)
+
+    def signed_fleet_state_snapshot(self) -> bytes:
+        """The signed reply to a learner whose fleet state already matches ours."""
+        def sign_snapshot():
+            payload = self.known_nodes.snapshot() + bytes(FLEET_STATES_MATCH)
+            return bytes(self.stamp(payload)) + payload
+        return self._signed_for_fleet_state('snapshot', sign_snapshot)
+
+    def _signed_for_fleet_state(self, name: str, sign) -> bytes:
+        fleet_state = (self.known_nodes.checksum, self.known_nodes.updated)
+        if self._fleet_state_of_payloads != fleet_state:
+            # Everything cached describes an older fleet state.
+            self._fleet_state_payloads = dict()
+            self._fleet_state_of_payloads = fleet_state
+        try:
+            signed_payload = self._fleet_state_payloads[name]
+        except KeyError:
+            signed_payload = self._fleet_state_payloads[name] = sign()
+        return signed_payload
+
+    def _forget_serialized_metadata(self) -> None:
+        """Drops everything serialized from this node's metadata, which has just changed."""
+        self._metadata_bytes = None
+        self._fleet_state_payloads = dict()
+
     def update_snapshot(self, checksum, updated, number_of_known_nodes):
         """
         TODO: We update the simple snapshot here, but of course if we're dealing
@@ -1122,29 +1622,124 @@ class Teacher:
 
         # Decentralized
         else:
-            if self.__decentralized_identity_evidence is NOT_SIGNED:
-                raise self.StampNotSigned
-
             # Off-chain signature verification
-            if not self._stamp_has_valid_signature_by_worker():
-                message = f"Invalid signature {self.__decentralized_identity_evidence.hex()} " \
-                          f"from worker {self.worker_address} for stamp {bytes(self.stamp).hex()} "
-                raise self.InvalidWorkerSignature(message)
+            self._validate_worker_signature()
 
             # On-chain staking check, if registry is present
             if registry:
-                if not self._worker_is_bonded_to_staker(registry=registry):  # <-- Blockchain CALL
-                    message = f"Worker {self.worker_address} is not bonded to staker {self.checksum_address}"
-                    self.log.debug(message)
-                    raise self.UnbondedWorker(message)
-
-                if self._staker_is_really_staking(registry=registry):  # <-- Blockchain CALL
-                    self.verified_worker = True
-                else:
-                    raise self.NotStaking(f"Staker {self.checksum_address} is not staking")
+                self._validate_bonding(registry=registry)
+                self._validate_staking(registry=registry)
 
             self.verified_stamp = True
 
+    @classmethod
+    def validate_workers(cls, nodes: list, registry: BaseContractRegistry) -> Dict[str, Exception]:
+        """
+        validate_worker, for many nodes (or sprouts) at once.  Each node's worker signature is still checked on its
+        own, but whom its worker is bonded to, and how much its staker has locked, are looked up for all of them
+        together - in a few batched calls rather than three per node.
+
+        Nodes which pass are marked as such; those which don't are returned by checksum address, with the reason.
+        """
+        failures = dict()
+        signed_nodes = list()
+        for node in nodes:
+            node = node.mature()
+            try:
+                if node.federated_only:
+                    raise cls.WrongMode(f"{node} is a federated node, and cannot be verified on-chain.")
+                node._validate_worker_signature()
+            except (cls.WrongMode, cls.StampNotSigned, cls.InvalidWorkerSignature) as e:
+                failures[node.checksum_address] = e
+            else:
+                signed_nodes.append(node)
+        if not signed_nodes:
+            return failures
+
+        staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)  # type: StakingEscrowAgent
+        min_stake = EconomicsFactory.get_economics(registry=registry).minimum_allowed_locked
+
+        bonded_nodes = list()
+        stakers = staking_agent.get_stakers_from_workers([node.worker_address for node in signed_nodes])
+        for node, staker_address in zip(signed_nodes, stakers):
+            if staker_address == node.checksum_address:
+                bonded_nodes.append(node)
+            else:
+                failures[node.checksum_address] = cls.UnbondedWorker(f"Worker {node.worker_address} is not bonded "
+                                                                     f"to staker {node.checksum_address}")
+
+        staker_addresses = [node.checksum_address for node in bonded_nodes]
+        stakes_current_period = staking_agent.get_locked_tokens_of_stakers(staker_addresses, periods=0)
+        stakes_next_period = staking_agent.get_locked_tokens_of_stakers(staker_addresses, periods=1)
+        for node, stake_current_period, stake_next_period in zip(bonded_nodes, stakes_current_period, stakes_next_period):
+            if max(stake_current_period, stake_next_period) >= min_stake:
+                node.verified_worker = True
+                node.verified_stamp = True
+            else:
+                failures[node.checksum_address] = cls.NotStaking(f"Staker {node.checksum_address} is not staking")
+        return failures
+
+    def _validate_worker_signature(self) -> None:
+        if self.__decentralized_identity_evidence is NOT_SIGNED:
+            raise self.StampNotSigned
+
+        if not self._stamp_has_valid_signature_by_worker():
+            message = f"Invalid signature {self.__decentralized_identity_evidence.hex()} " \
+                      f"from worker {self.worker_address} for stamp {bytes(self.stamp).hex()} "
+            raise self.InvalidWorkerSignature(message)
+
+    def _validate_bonding(self, registry: BaseContractRegistry) -> None:
+        if not self._worker_is_bonded_to_staker(registry=registry):  # <-- Blockchain CALL
+            message = f"Worker {self.worker_address} is not bonded to staker {self.checksum_address}"
+            self.log.debug(message)
+            raise self.UnbondedWorker(message)
+
+    def _validate_staking(self, registry: BaseContractRegistry) -> None:
+        if self._staker_is_really_staking(registry=registry):  # <-- Blockchain CALL
+            self.verified_worker = True
+        else:
+            raise self.NotStaking(f"Staker {self.checksum_address} is not staking")
+
+    def verification_stages(self,
+                            network_middleware_client,
+                            registry: BaseContractRegistry = None,
+                            verification_cache: VerificationCache = None) -> List[Tuple[str, Callable]]:
+        """
+        The checks made by verify_node, as (stage, check) pairs which can be run - and timed - one at a time.
+        Each check raises if this node fails it; once all have passed, this node is verified.
+        """
+        def node_answers_for_itself(cache: VerificationCache = verification_cache):
+            if self.verify_node(network_middleware_client=network_middleware_client,
+                                registry=registry,
+                                verification_cache=cache) is False:
+                raise self.InvalidNode(f"{self} could not be verified.")
+
+        if verification_cache is not None and self._restore_verification(verification_cache, registry=registry):
+            # This node's metadata was verified before, so only the round trip to it is left to make.
+            return [(TLS, partial(node_answers_for_itself, cache=None))]
+
+        stages = [(INTERFACE_SIGNATURE, self.validate_interface)]
+        if not self.federated_only:
+            def worker_is_valid():
+                self._validate_worker_signature()
+                if not registry:
+                    self.verified_stamp = True
+
+            stages.append((WORKER_SIGNATURE, worker_is_valid))
+            if registry:
+                def staker_is_staking():
+                    self._validate_staking(registry=registry)
+                    self.verified_stamp = True
+
+                stages.append((BONDING, partial(self._validate_bonding, registry=registry)))
+                stages.append((STAKING, staker_is_staking))
+        elif registry:
+            stages.append((WORKER_SIGNATURE, partial(self.validate_worker, registry=registry)))  # Raises WrongMode.
+
+        # The metadata checks have passed by now, so this is only the TLS round trip to the node.
+        stages.append((TLS, node_answers_for_itself))
+        return stages
+
     def validate_metadata(self, registry: BaseContractRegistry = None):
 
         # Verify the interface signature
@@ -1166,7 +1761,8 @@ class Teacher:
                     network_middleware_client,
                     registry: BaseContractRegistry = None,
                     certificate_filepath: str = None,
-                    force: bool = False
+                    force: bool = False,
+                    verification_cache: VerificationCache = None
                     ) -> bool:
         """
         Three things happening here:
@@ -1180,6 +1776,8 @@ class Teacher:
           checked are the same ones this node is using now. (raises InvalidNode if not valid;
           also emits a specific warning depending on which check failed).
 
+        The first two are skipped if `verification_cache` holds this node's metadata as verified,
+        and recorded there otherwise.
         """
 
         if force:
@@ -1197,11 +1795,15 @@ class Teacher:
 
         # This is both the stamp's client signature and interface metadata check; May raise InvalidNode
         try:
+            restored = verification_cache is not None and self._restore_verification(verification_cache, registry)
             self.validate_metadata(registry=registry)
         except self.UnbondedWorker:
             self.verified_node = False
             return False
 
+        if verification_cache is not None and not restored:
+            self._record_verification(verification_cache, registry=registry)
+
         # The node's metadata is valid; let's be sure the interface is in order.
         if not certificate_filepath:
             if self.certificate_filepath is CERTIFICATE_NOT_SAVED:
@@ -1235,6 +1837,45 @@ class Teacher:
             # Success
             self.verified_node = True
 
+    def _restore_verification(self, verification_cache: VerificationCache, registry: BaseContractRegistry = None) -> bool:
+        """
+        Takes the word of `verification_cache` for whatever it recorded about this node's metadata, returning
+        True if nothing is left to check.  On-chain checks are only trusted for the period they were made in;
+        once it rolls over, they're left to be made again.
+        """
+        cached = verification_cache.get(self)
+        if cached is None:
+            return False
+        worker_address, period = cached
+
+        self.verified_interface = True
+        if self.federated_only:
+            return not registry  # Otherwise, it's yet to fail verification as a decentralized node.
+
+        # The worker's signature over this exact metadata was checked already.
+        self.__worker_address = worker_address
+        if not registry:
+            self.verified_stamp = True
+            return True
+        if period is None:  # Verified without a registry; the on-chain checks have yet to be made.
+            return False
+        if period != self._current_period(registry=registry):
+            return False  # The node may have stopped staking since.
+
+        self.verified_stamp = True
+        self.verified_worker = True
+        return True
+
+    def _record_verification(self, verification_cache: VerificationCache, registry: BaseContractRegistry = None) -> None:
+        worker_address = None if self.federated_only else self.worker_address
+        period = self._current_period(registry=registry) if registry and self.verified_worker else None
+        verification_cache.record(self, worker_address=worker_address, period=period)
+
+    @staticmethod
+    def _current_period(registry: BaseContractRegistry) -> int:
+        staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)  # type: StakingEscrowAgent
+        return staking_agent.get_current_period()
+
     @property
     def decentralized_identity_evidence(self):
         return self.__decentralized_identity_evidence
@@ -1253,6 +1894,7 @@ class Teacher:
         signature = transacting_power.sign_message(message=bytes(self.stamp))
         self.__decentralized_identity_evidence = signature
         self.__worker_address = transacting_power.account
+        self._forget_serialized_metadata()
 
     #
     # Interface
@@ -1279,6 +1921,7 @@ class Teacher:
         message = self._signable_interface_info_message()
         self._timestamp = maya.now()
         self.__interface_signature = self.stamp(self.timestamp_bytes() + message)
+        self._forget_serialized_metadata()
 
     @property
     def _interface_signature(self):
@@ -0,0 +1,151 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from bytestring_splitter import VariableLengthBytestring
+from twisted.logger import Logger
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+from umbral import pre
+from umbral.cfrags import CapsuleFrag
+from umbral.config import default_params
+from umbral.keys import UmbralPublicKey
+from umbral.kfrags import KFrag
+from umbral.pre import Capsule
+
+if TYPE_CHECKING:
+    from nucypher.policy.collections import WorkOrder
+
+
+def _reencrypt_task_in_worker(job: Tuple[bytes, bytes, bytes, bytes]) -> bytes:
+    """
+    Process pool entry point; the pool only moves bytes in and out, and never holds a key.
+    Returns the serialized cfrag for one task.
+    """
+    kfrag_bytes, alice_verifying_key_bytes, capsule_bytes, reencryption_metadata = job
+
+    kfrag = KFrag.from_bytes(kfrag_bytes)
+    capsule = Capsule.from_bytes(capsule_bytes, params=default_params())
+    capsule.set_correctness_keys(verifying=UmbralPublicKey.from_bytes(alice_verifying_key_bytes))
+
+    cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)
+    return bytes(cfrag)
+
+
+class ReencryptionEngine:
+    """
+    Performs Ursula's share of a WorkOrder: for each task, sign Bob's task signature,
+    re-encrypt the capsule, and sign the resulting CFrag.
+
+    With workers > 0 the re-encryptions are fanned out to a process pool; otherwise they run
+    serially on the calling thread.  Either way, all the signing is done here, with Ursula's stamp,
+    and results are returned in task order.
+    """
+
+    LATENCY_SAMPLE_SIZE = 1000  # tasks
+    SERIAL = 'serial'
+    POOLED = 'pooled'
+
+    def __init__(self, stamp, workers: int = 0):
+        self.log = Logger(self.__class__.__name__)
+        self.stamp = stamp
+        self.workers = workers
+        self.__pool = None
+        self._task_latencies = {self.SERIAL: deque(maxlen=self.LATENCY_SAMPLE_SIZE),
+                                self.POOLED: deque(maxlen=self.LATENCY_SAMPLE_SIZE)}
+
+    @property
+    def mode(self) -> str:
+        return self.POOLED if self.workers else self.SERIAL
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self.__pool is None:
+            # Spawn rather than fork; the parent is typically running a reactor with live threads.
+            self.__pool = ProcessPoolExecutor(max_workers=self.workers,
+                                              mp_context=multiprocessing.get_context('spawn'))
+        return self.__pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=wait)
+            self.__pool = None
+
+    def reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey) -> bytes:
+        # Timed the same way in either mode: the whole work order, signatures included,
+        # spread evenly over its tasks (pooled tasks overlap, so they have no latency of their own).
+        started = time.perf_counter()
+        if self.workers:
+            chunks = self._reencrypt_pooled(kfrag, work_order.tasks, alice_verifying_key)
+        else:
+            chunks = self._reencrypt_serially(kfrag, work_order.tasks, alice_verifying_key)
+        if chunks:
+            per_task = (time.perf_counter() - started) / len(chunks)
+            self._task_latencies[self.mode].extend([per_task] * len(chunks))
+        return b''.join(chunks)
+
+    def _reencrypt_serially(self, kfrag: KFrag, tasks: Iterable, alice_verifying_key: UmbralPublicKey) -> List[bytes]:
+        chunks = list()
+        for task in tasks:
+            # Ursula signs on top of Bob's signature of each task.
+            # Now both are committed to the same task.  See #259.
+            reencryption_metadata = bytes(self.stamp(bytes(task.signature)))
+
+            # Ursula sets Alice's verifying key for capsule correctness verification.
+            capsule = task.capsule
+            capsule.set_correctness_keys(verifying=alice_verifying_key)
+
+            # Then re-encrypts the fragment.
+            cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)  # <--- pyUmbral
+            self.log.info(f"Re-encrypted capsule {capsule} -> made {cfrag}.")
+
+            # Next, Ursula signs to commit to her results.
+            reencryption_signature = self.stamp(bytes(cfrag))
+            chunks.append(bytes(VariableLengthBytestring(cfrag)) + bytes(reencryption_signature))
+        return chunks
+
+    def _reencrypt_pooled(self, kfrag: KFrag, tasks: Iterable, alice_verifying_key: UmbralPublicKey) -> List[bytes]:
+        kfrag_bytes, alice_verifying_key_bytes = bytes(kfrag), bytes(alice_verifying_key)
+        # Ursula's signatures are made here, on either side of the re-encryption; only the
+        # re-encryption itself is done by the workers.
+        jobs = [(kfrag_bytes,
+                 alice_verifying_key_bytes,
+                 bytes(task.capsule),
+                 bytes(self.stamp(bytes(task.signature))))  # The re-encryption metadata
+                for task in tasks]
+
+        chunks = list()
+        # Executor.map yields in submission order, so the response is assembled in task order.
+        for cfrag_bytes in self._get_pool().map(_reencrypt_task_in_worker, jobs):
+            cfrag = CapsuleFrag.from_bytes(cfrag_bytes)
+            reencryption_signature = self.stamp(bytes(cfrag))
+            chunks.append(bytes(VariableLengthBytestring(cfrag)) + bytes(reencryption_signature))
+        self.log.info(f"Re-encrypted {len(chunks)} capsules on {self.workers} workers.")
+        return chunks
+
+    def latency_report(self) -> dict:
+        """Time per task (in seconds) over the most recent tasks, by execution mode; see `reencrypt`."""
+        report = dict()
+        for mode, latencies in self._task_latencies.items():
+            if not latencies:
+                continue
+            report[mode] = dict(tasks=len(latencies),
+                                mean=sum(latencies) / len(latencies),
+                                max=max(latencies))
+        return report
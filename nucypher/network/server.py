@@ -19,7 +19,7 @@ import binascii
 import os
 from bytestring_splitter import BytestringSplitter
 from constant_sorrow import constants
-from constant_sorrow.constants import FLEET_STATES_MATCH, NO_BLOCKCHAIN_CONNECTION, NO_KNOWN_NODES
+from constant_sorrow.constants import NO_BLOCKCHAIN_CONNECTION, NO_KNOWN_NODES
 from flask import Flask, Response, jsonify, request
 from hendrix.experience import crosstown_traffic
 from jinja2 import Template, TemplateError
@@ -39,7 +39,12 @@ from nucypher.crypto.utils import canonical_address_from_umbral_key
 from nucypher.datastore.datastore import NotFound
 from nucypher.datastore.keypairs import HostingKeypair
 from nucypher.datastore.threading import ThreadedSession
-from nucypher.network import LEARNING_LOOP_VERSION
+from nucypher.network import (
+    LEARNING_LOOP_VERSION,
+    NODE_METADATA_DELTA_HEADER,
+    NODE_METADATA_DELTA_VERSION,
+    NODE_METADATA_KNOWN_NODES_HEADER
+)
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.protocols import InterfaceInfo
 
@@ -80,26 +85,21 @@ def make_rest_app(
         db_filepath: str,
         this_node,
         serving_domains,
-        log=Logger("http-application-layer")
+        log=Logger("http-application-layer"),
+        datastore_profile: str = 'default'
         ) -> Tuple:
 
     forgetful_node_storage = ForgetfulNodeStorage(federated_only=this_node.federated_only)
 
     from nucypher.datastore import datastore
-    from nucypher.datastore.db import Base
-    from sqlalchemy.engine import create_engine
+    from nucypher.datastore.db import create_datastore_engine, upgrade_schema
 
     log.info("Starting datastore {}".format(db_filepath))
+    engine = create_datastore_engine(db_filepath=db_filepath, profile=datastore_profile)
 
-    # See: https://docs.sqlalchemy.org/en/rel_0_9/dialects/sqlite.html#connect-strings
-    if db_filepath:
-        db_uri = f'sqlite:///{db_filepath}'
-    else:
-        db_uri = 'sqlite://'  # TODO: Is this a sane default? See #667
-
-    engine = create_engine(db_uri)
-
-    Base.metadata.create_all(engine)
+    created_indexes = upgrade_schema(engine)
+    if created_indexes and db_filepath:
+        log.info("Upgraded datastore {} with indexes {}".format(db_filepath, ', '.join(created_indexes)))
     datastore = datastore.Datastore(engine)
     db_engine = engine
 
@@ -167,9 +167,20 @@ def make_rest_app(
         if this_node.known_nodes.checksum is NO_KNOWN_NODES:
             return Response(b"", headers=headers, status=204)
 
-        known_nodes_bytestring = this_node.bytestring_of_known_nodes()
-        signature = this_node.stamp(known_nodes_bytestring)
-        return Response(bytes(signature) + known_nodes_bytestring, headers=headers)
+        # A learner which has seen one of our fleet states before may ask for only what's changed since.
+        payload = None
+        if request.args.get('delta') == str(NODE_METADATA_DELTA_VERSION):
+            try:
+                payload = this_node.signed_bytestring_of_known_nodes_since(checksum=request.args['since'],
+                                                                           updated=int(request.args['since_updated']))
+            except (KeyError, ValueError):
+                payload = None  # Not a delta we can make sense of; send everything.
+        if payload is None:
+            payload = this_node.signed_bytestring_of_known_nodes()
+        else:
+            headers[NODE_METADATA_DELTA_HEADER] = str(NODE_METADATA_DELTA_VERSION)
+            headers[NODE_METADATA_KNOWN_NODES_HEADER] = str(len(this_node.known_nodes))
+        return Response(payload, headers=headers)
 
     @rest_app.route('/node_metadata', methods=["POST"])
     def node_metadata_exchange():
@@ -179,9 +190,7 @@ def make_rest_app(
         if learner_fleet_state == this_node.known_nodes.checksum:
             log.debug("Learner already knew fleet state {}; doing nothing.".format(learner_fleet_state))
             headers = {'Content-Type': 'application/octet-stream'}
-            payload = this_node.known_nodes.snapshot() + bytes(FLEET_STATES_MATCH)
-            signature = this_node.stamp(payload)
-            return Response(bytes(signature) + payload, headers=headers)
+            return Response(this_node.signed_fleet_state_snapshot(), headers=headers)
 
         sprouts = _node_class.batch_from_bytes(request.data,
                                              registry=this_node.registry)
@@ -199,7 +208,8 @@ def make_rest_app(
 
                 try:
                     node.verify_node(this_node.network_middleware.client,
-                                     registry=this_node.registry)
+                                     registry=this_node.registry,
+                                     verification_cache=this_node.verification_cache)
 
                 # Suspicion
                 except node.SuspiciousActivity as e:
@@ -300,6 +310,7 @@ def make_rest_app(
                 id_as_hex,
                 kfrag,
                 session=session)
+        this_node.kfrag_cache.invalidate(id_as_hex.encode())
 
         # TODO: Sign the arrangement here.  #495
         return ""  # TODO: Return A 200, with whatever policy metadata.
@@ -328,6 +339,7 @@ def make_rest_app(
                 elif revocation.verify_signature(alice_pubkey):
                     datastore.del_policy_arrangement(
                         id_as_hex.encode(), session=session)
+                    this_node.kfrag_cache.invalidate(id_as_hex.encode())
         except (NotFound, InvalidSignature) as e:
             log.debug("Exception attempting to revoke: {}".format(e))
             return Response(response='KFrag not found or revocation signature is invalid.', status=404)
@@ -343,21 +355,36 @@ def make_rest_app(
             arrangement_id = binascii.unhexlify(id_as_hex)
         except (binascii.Error, TypeError):
             return Response(response=b'Invalid arrangement ID', status=405)
-        try:
-            with ThreadedSession(db_engine) as session:
-                arrangement = datastore.get_policy_arrangement(arrangement_id=id_as_hex.encode(), session=session)
-        except NotFound:
-            return Response(response=arrangement_id, status=404)
-
-        # Get KFrag
-        # TODO: Yeah, well, what if this arrangement hasn't been enacted?  1702
-        kfrag = KFrag.from_bytes(arrangement.kfrag)
+        decoded_arrangement = this_node.kfrag_cache.get(id_as_hex.encode())
+        if decoded_arrangement is None:
+            # Taken before reading, so that an arrangement revoked meanwhile isn't cached again.
+            cache_generation = this_node.kfrag_cache.generation
+            try:
+                with ThreadedSession(db_engine) as session:
+                    arrangement = datastore.get_policy_arrangement(arrangement_id=id_as_hex.encode(), session=session)
+            except NotFound:
+                return Response(response=arrangement_id, status=404)
+
+            # Get KFrag
+            # TODO: Yeah, well, what if this arrangement hasn't been enacted?  1702
+            kfrag = KFrag.from_bytes(arrangement.kfrag)
+
+            alice_verifying_key_bytes = arrangement.alice_verifying_key.key_data
+            alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
+            alice_address = canonical_address_from_umbral_key(alice_verifying_key)
+            decoded_arrangement = this_node.kfrag_cache.put(arrangement_id=id_as_hex.encode(),
+                                                            kfrag=kfrag,
+                                                            alice_verifying_key=alice_verifying_key,
+                                                            alice_address=alice_address,
+                                                            expiration=arrangement.expiration,
+                                                            generation=cache_generation)
+
+        kfrag = decoded_arrangement.kfrag
+        alice_verifying_key = decoded_arrangement.alice_verifying_key
+        alice_address = decoded_arrangement.alice_address
 
         # Get Work Order
         from nucypher.policy.collections import WorkOrder  # Avoid circular import
-        alice_verifying_key_bytes = arrangement.alice_verifying_key.key_data
-        alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
-        alice_address = canonical_address_from_umbral_key(alice_verifying_key)
         work_order_payload = request.data
         work_order = WorkOrder.from_rest_payload(arrangement_id=arrangement_id,
                                                  rest_payload=work_order_payload,
@@ -371,10 +398,18 @@ def make_rest_app(
                                         alice_verifying_key=alice_verifying_key)
 
         # Now, Ursula saves this workorder to her database...
-        with ThreadedSession(db_engine):
-            this_node.datastore.save_workorder(bob_verifying_key=bytes(work_order.bob.stamp),
-                                               bob_signature=bytes(work_order.receipt_signature),
-                                               arrangement_id=work_order.arrangement_id)
+        if this_node.workorder_commit_queue:
+            # ...in the same transaction as those of other concurrent requests.
+            committed = this_node.workorder_commit_queue.save(bob_verifying_key=bytes(work_order.bob.stamp),
+                                                              bob_signature=bytes(work_order.receipt_signature),
+                                                              arrangement_id=work_order.arrangement_id)
+            if not this_node.workorder_commit_queue.asynchronous:
+                committed.result()
+        else:
+            with ThreadedSession(db_engine):
+                this_node.datastore.save_workorder(bob_verifying_key=bytes(work_order.bob.stamp),
+                                                   bob_signature=bytes(work_order.receipt_signature),
+                                                   arrangement_id=work_order.arrangement_id)
 
         headers = {'Content-Type': 'application/octet-stream'}
         return Response(headers=headers, response=response)
@@ -387,8 +422,9 @@ def make_rest_app(
 
         try:
 
-            treasure_map = this_node.treasure_maps[treasure_map_index]
-            response = Response(bytes(treasure_map), headers=headers)
+            # Served as the exact bytes Alice pushed; no need to deserialize.
+            treasure_map_bytes = this_node.treasure_maps.get_bytes(treasure_map_index)
+            response = Response(treasure_map_bytes, headers=headers)
             log.info("{} providing TreasureMap {}".format(this_node.nickname, treasure_map_id))
 
         except KeyError:
@@ -415,8 +451,8 @@ def make_rest_app(
 
             # TODO 341 - what if we already have this TreasureMap?
             treasure_map_index = bytes.fromhex(treasure_map_id)
-            this_node.treasure_maps[treasure_map_index] = treasure_map
-            return Response(bytes(treasure_map), status=202)
+            this_node.treasure_maps.store(map_id=treasure_map_index, map_bytes=request.data)
+            return Response(request.data, status=202)
         else:
             # TODO: Make this a proper 500 or whatever.  #341
             log.info("Bad TreasureMap ID; not storing {}".format(treasure_map_id))
@@ -0,0 +1,305 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import Optional, Tuple
+
+from twisted.internet import reactor
+from twisted.logger import Logger
+
+from nucypher.crypto.api import keccak_digest
+
+# Verification stages, in the order a node goes through them.
+MATURATION = 'maturation'
+INTERFACE_SIGNATURE = 'interface_signature'
+WORKER_SIGNATURE = 'worker_signature'
+BONDING = 'bonding'
+STAKING = 'staking'
+TLS = 'tls'
+STAGES = (MATURATION, INTERFACE_SIGNATURE, WORKER_SIGNATURE, BONDING, STAKING, TLS)
+
+
+class NodeVerificationPipeline:
+    """
+    Verifies the nodes a Learner hears about in the background, instead of one after another
+    inside its learning loop.
+
+    Sprouts are queued, and a bounded pool of workers takes each through the stages of
+    verification (see Teacher.verification_stages), each stage with its own timeout.  Only nodes
+    which pass every stage are promoted into the Learner's known nodes - on the reactor's thread,
+    if it's running, like everything else which reads them.
+    """
+
+    DEFAULT_WORKERS = 4
+    DEFAULT_MAX_QUEUED = 10_000  # sprouts
+    DEFAULT_STAGE_TIMEOUTS = {BONDING: 10, STAKING: 10, TLS: 5}  # seconds; the other stages are local
+    TIMEOUT = 'timeout'
+
+    __STOP = object()
+
+    def __init__(self,
+                 learner,
+                 workers: int = DEFAULT_WORKERS,
+                 stage_timeouts: dict = None,
+                 max_queued: int = DEFAULT_MAX_QUEUED):
+        self.log = Logger(self.__class__.__name__)
+        self.learner = learner
+        self.workers = workers
+        self.stage_timeouts = dict(self.DEFAULT_STAGE_TIMEOUTS, **(stage_timeouts or dict()))
+
+        self._queue = Queue(maxsize=max_queued)
+        self._pending = dict()  # Sprouts queued or being verified, by checksum address
+        self._pending_lock = Lock()
+        self._workers = list()
+        # Stages run here, so that a worker can give up on one which takes too long.  A stage which
+        # times out keeps its thread until it returns, so the pool stays bounded; stages queued behind
+        # it are only timed once they start.
+        self._stage_executor = None
+
+        self._started = None
+        self._metrics_lock = Lock()
+        self.verified = 0
+        self.failed = 0
+        self.dropped = 0
+        self._stage_passes = Counter()
+        self._stage_time = Counter()
+        self._stage_failures = defaultdict(Counter)  # By stage, then by reason
+
+    @property
+    def running(self) -> bool:
+        return any(worker.is_alive() for worker in self._workers)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._started = time.monotonic()
+        self._stage_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='verification-stage')
+        self._workers = [Thread(target=self._run, name=f'{self.__class__.__name__}-{i}', daemon=True)
+                         for i in range(self.workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self) -> None:
+        """Stops the workers once they're done with the nodes they're verifying; queued sprouts are dropped."""
+        if not self.running:
+            return
+        with self._queue.mutex:
+            self._queue.queue.clear()
+        for _worker in self._workers:
+            self._queue.put(self.__STOP)
+        for worker in self._workers:
+            worker.join()
+        self._workers = list()
+        self._stage_executor.shutdown(wait=False)
+        with self._pending_lock:
+            self._pending.clear()
+
+    def submit(self, sprout) -> bool:
+        """
+        Queues a sprout for verification, returning False if a version of this node
+        at least as new is already waiting or being verified, or if the queue is full.
+        """
+        if not self.running:
+            self.start()
+        with self._pending_lock:
+            pending = self._pending.get(sprout.checksum_address)
+            if pending is not None and not sprout.timestamp > pending.timestamp:
+                return False
+            self._pending[sprout.checksum_address] = sprout
+        try:
+            self._queue.put_nowait(sprout)
+        except Full:
+            # Rather than hold up the learning loop, drop it; a teacher will tell us about it again.
+            with self._pending_lock:
+                if self._pending.get(sprout.checksum_address) is sprout:
+                    del self._pending[sprout.checksum_address]
+            with self._metrics_lock:
+                self.dropped += 1
+            return False
+        return True
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def throughput(self) -> float:
+        """Nodes verified per second since the pipeline started."""
+        if not self._started:
+            return 0.0
+        elapsed = time.monotonic() - self._started
+        return self.verified / elapsed if elapsed else 0.0
+
+    def stats(self) -> dict:
+        stages = dict()
+        for stage in STAGES:
+            passes = self._stage_passes[stage]
+            stages[stage] = dict(passed=passes,
+                                 failures=dict(self._stage_failures[stage]),
+                                 mean_latency=self._stage_time[stage] / passes if passes else None)
+        return dict(queue_depth=self.queue_depth,
+                    in_progress=len(self._pending) - self.queue_depth,
+                    verified=self.verified,
+                    failed=self.failed,
+                    dropped=self.dropped,
+                    throughput=self.throughput(),
+                    stages=stages)
+
+    def _run(self) -> None:
+        while True:
+            sprout = self._queue.get()
+            if sprout is self.__STOP:
+                return
+            try:
+                node = self._verify(sprout)
+            except Exception as e:
+                self.log.warn(f"Unhandled error while verifying {sprout}: {e}")
+                node = None
+            finally:
+                with self._pending_lock:
+                    if self._pending.get(sprout.checksum_address) is sprout:
+                        del self._pending[sprout.checksum_address]
+
+            if node is not None:
+                if reactor.running:
+                    reactor.callFromThread(self._promote, node)
+                else:
+                    self._promote(node)
+
+    def _promote(self, node) -> None:
+        self.learner.remember_node(node, eager=False)
+        with self._metrics_lock:
+            self.verified += 1
+
+    def _verify(self, sprout):
+        def mature():
+            node = sprout.mature()
+            # Store node's certificate - It has been seen.
+            node.certificate_filepath = self.learner.node_storage.store_node_certificate(certificate=node.certificate)
+            return node
+
+        node = self._run_stage(sprout, MATURATION, mature)
+        if node is None:
+            return None
+
+        stages = node.verification_stages(network_middleware_client=self.learner.network_middleware.client,
+                                          registry=self.learner.registry,
+                                          verification_cache=self.learner.verification_cache)
+        for stage, check in stages:
+            if self._run_stage(node, stage, check) is None:
+                return None
+        return node
+
+    def _run_stage(self, node, stage: str, check):
+        """Runs one stage of verification, returning its result (True if it has none), or None if the node fails it."""
+        stage_started = Event()
+
+        def timed_check():
+            stage_started.set()
+            return check()
+
+        stage_result = self._stage_executor.submit(timed_check)
+        # A stage that timed out earlier may still hold a thread; time spent waiting for one isn't this stage's.
+        stage_started.wait()
+        started = time.perf_counter()
+        try:
+            result = stage_result.result(timeout=self.stage_timeouts.get(stage))
+        except TimeoutError:
+            reason = self.TIMEOUT
+        except Exception as e:
+            reason = e.__class__.__name__
+        else:
+            with self._metrics_lock:
+                self._stage_passes[stage] += 1
+                self._stage_time[stage] += time.perf_counter() - started
+            return True if result is None else result
+
+        with self._metrics_lock:
+            self.failed += 1
+            self._stage_failures[stage][reason] += 1
+        self.log.info(f"Verification Failed - {node} failed at {stage} ({reason}).")
+        return None
+
+
+class VerificationCache:
+    """
+    Remembers which nodes have been verified, so that a node rebuilt from the same metadata - after a
+    restart, or when a learner hears about it again - needn't be verified all over again.
+
+    Entries are keyed by the digest of a node's serialized metadata; the signatures over it (the
+    interface's and the worker's) hold for as long as it doesn't change.  The on-chain checks (bonding
+    and staking) are recorded along with the period they were made in, since they may not hold in the next.
+    """
+
+    DB_FILE_NAME = 'verified_nodes.sqlite'
+    TABLE_NAME = 'verified_nodes'
+    SCHEMA = [('metadata_digest', 'blob primary key'), ('checksum_address', 'text'),
+              ('worker_address', 'text'), ('period', 'integer')]
+
+    def __init__(self, db_filepath: str = ':memory:'):
+        self.db_filepath = db_filepath
+        self.__db_conn = None  # Connected on first use; the configuration root may not exist yet.
+        self._lock = Lock()
+
+    @property
+    def db_conn(self) -> sqlite3.Connection:
+        if self.__db_conn is None:
+            # Nodes are verified from more than one thread (see NodeVerificationPipeline).
+            self.__db_conn = sqlite3.connect(self.db_filepath, check_same_thread=False)
+            schema = ", ".join(f"{column} {column_type}" for column, column_type in self.SCHEMA)
+            with self.__db_conn:
+                self.__db_conn.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} ({schema})")
+        return self.__db_conn
+
+    @staticmethod
+    def digest(node) -> bytes:
+        return keccak_digest(bytes(node))
+
+    def get(self, node) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """
+        The worker address recovered from `node`'s metadata and the period its on-chain checks were
+        made in (either may be None), or None if this metadata hasn't been verified.
+        """
+        with self._lock:
+            row = self.db_conn.execute(f"SELECT worker_address, period FROM {self.TABLE_NAME} WHERE metadata_digest=?",
+                                       (self.digest(node),)).fetchone()
+        return tuple(row) if row is not None else None
+
+    def record(self, node, worker_address: str = None, period: int = None) -> None:
+        """Records `node`'s metadata as verified, replacing anything recorded for its older metadata."""
+        digest = self.digest(node)
+        with self._lock, self.db_conn:
+            self.db_conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE checksum_address=? AND metadata_digest!=?",
+                                 (node.checksum_address, digest))
+            self.db_conn.execute(f"REPLACE INTO {self.TABLE_NAME} VALUES(?,?,?,?)",
+                                 (digest, node.checksum_address, worker_address, period))
+
+    def forget(self, node) -> None:
+        with self._lock, self.db_conn:
+            self.db_conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE checksum_address=?", (node.checksum_address,))
+
+    def clear(self) -> None:
+        with self._lock, self.db_conn:
+            self.db_conn.execute(f"DELETE FROM {self.TABLE_NAME}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.db_conn.execute(f"SELECT COUNT(*) FROM {self.TABLE_NAME}").fetchone()[0]
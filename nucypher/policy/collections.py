@@ -27,7 +27,7 @@ from constant_sorrow.constants import CFRAG_NOT_RETAINED, NO_DECRYPTION_PERFORME
 from cryptography.hazmat.backends.openssl import backend
 from cryptography.hazmat.primitives import hashes
 from eth_utils import to_canonical_address, to_checksum_address
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from umbral.cfrags import CapsuleFrag
 from umbral.config import default_params
 from umbral.curvebn import CurveBN
@@ -161,6 +161,20 @@ class TreasureMap:
             raise TypeError("This TreasureMap is encrypted.  You can't add another node without decrypting it.")
         self.destinations[arrangement.ursula.checksum_address] = arrangement.id
 
+    @staticmethod
+    def rank_nodes_for_map(map_id: str, nodes: Iterable) -> List:
+        """
+        Orders nodes by rendezvous (highest random weight) hashing of the map ID against each node's address.
+        The first k nodes are the map's k replica holders; everyone who knows the same nodes computes the same
+        holders without coordination, and the choice only moves for maps whose holders join or leave.
+        """
+        map_id_bytes = bytes.fromhex(map_id)
+
+        def weight(node) -> bytes:
+            return keccak_digest(map_id_bytes + to_canonical_address(node.checksum_address))
+
+        return sorted(nodes, key=weight, reverse=True)
+
     def public_id(self) -> str:
         """
         We need an ID that Bob can glean from knowledge he already has *and* which Ursula can verify came from Alice.
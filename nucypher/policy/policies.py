@@ -16,7 +16,10 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import random
+import time
 from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 
 import maya
 from abc import ABC, abstractmethod
@@ -189,11 +192,18 @@ class Policy(ABC):
                  kfrags=(UNKNOWN_KFRAG,),
                  public_key=None,
                  m: int = None,
-                 alice_signature=NOT_SIGNED) -> None:
+                 alice_signature=NOT_SIGNED,
+                 negotiation_workers: int = 1,
+                 negotiation_timeout: float = None,
+                 treasure_map_replicas: int = None) -> None:
 
         """
         :param kfrags:  A list of KFrags to distribute per this Policy.
         :param label: The identity of the resource to which Bob is granted access.
+        :param negotiation_workers: How many Ursulas to negotiate with (and enact upon) at once; 1 is serial.
+        :param negotiation_timeout: Seconds to wait on any one Ursula during concurrent negotiation and enactment.
+        :param treasure_map_replicas: Push the TreasureMap only to this many rendezvous-hashed nodes, in parallel.
+                                      By default it is pushed to every known node.
         """
         from nucypher.policy.collections import TreasureMap  # TODO: Circular Import
 
@@ -215,6 +225,15 @@ class Policy(ABC):
         self._enacted_arrangements = OrderedDict()
         self._published_arrangements = OrderedDict()
 
+        if negotiation_workers < 1:
+            raise ValueError(f"negotiation_workers must be at least 1, got {negotiation_workers}.")
+        self.negotiation_workers = negotiation_workers
+        self.negotiation_timeout = negotiation_timeout
+        self.treasure_map_replicas = treasure_map_replicas
+
+        # Wall-clock seconds spent in each phase of granting, for profiling.
+        self.phase_timings = OrderedDict()
+
         self.alice_signature = alice_signature  # TODO: This is unused / To Be Implemented?
 
     class MoreKFragsThanArrangements(TypeError):
@@ -255,6 +274,13 @@ class Policy(ABC):
         return keccak_digest(bytes(self.alice.stamp) + bytes(self.bob.stamp) + self.label)
 
     def publish_treasure_map(self, network_middleware: RestMiddleware) -> dict:
+        started = time.perf_counter()
+        try:
+            return self._publish_treasure_map(network_middleware=network_middleware)
+        finally:
+            self.phase_timings['treasure_map_publication'] = time.perf_counter() - started
+
+    def _publish_treasure_map(self, network_middleware: RestMiddleware) -> dict:
         self.treasure_map.prepare_for_publication(self.bob.public_keys(DecryptingPower),
                                                   self.bob.public_keys(SigningPower),
                                                   self.alice.stamp,
@@ -263,18 +289,42 @@ class Policy(ABC):
             # TODO: Optionally, block.
             raise RuntimeError("Alice hasn't learned of any nodes.  Thus, she can't push the TreasureMap.")
 
-        responses = dict()
-        self.log.debug(f"Pushing {self.treasure_map} to all known nodes from {self.alice}")
-        for node in self.alice.known_nodes:
-            # TODO: # 342 - It's way overkill to push this to every node we know about.  Come up with a system.
+        treasure_map_id = self.treasure_map.public_id()
+        map_payload = bytes(self.treasure_map)
 
+        if self.treasure_map_replicas:
+            # Bob ranks the nodes he knows the same way, so he'll ask these first.
+            ranked_nodes = self.treasure_map.rank_nodes_for_map(treasure_map_id, self.alice.known_nodes)
+            target_nodes = ranked_nodes[:self.treasure_map_replicas]
+            workers = len(target_nodes)
+            self.log.debug(f"Pushing {self.treasure_map} to {len(target_nodes)} replica holders from {self.alice}")
+        else:
+            # TODO: # 342 - It's way overkill to push this to every node we know about.  Use treasure_map_replicas.
+            target_nodes = list(self.alice.known_nodes)
+            workers = self.negotiation_workers
+            self.log.debug(f"Pushing {self.treasure_map} to all known nodes from {self.alice}")
+
+        def push(node):
+            # TODO: Certificate filepath needs to be looked up and passed here
+            return network_middleware.put_treasure_map_on_node(node=node,
+                                                               map_id=treasure_map_id,
+                                                               map_payload=map_payload)
+
+        if workers > 1:
+            executor = ThreadPoolExecutor(max_workers=workers,
+                                          thread_name_prefix=f"{self.__class__.__name__}-treasure-map")
             try:
-                treasure_map_id = self.treasure_map.public_id()
+                futures = [executor.submit(push, node) for node in target_nodes]
+            finally:
+                executor.shutdown(wait=True)
+            outcomes = [(node, future.result) for node, future in zip(target_nodes, futures)]
+        else:
+            outcomes = [(node, partial(push, node)) for node in target_nodes]
 
-                # TODO: Certificate filepath needs to be looked up and passed here
-                response = network_middleware.put_treasure_map_on_node(node=node,
-                                                                       map_id=treasure_map_id,
-                                                                       map_payload=bytes(self.treasure_map))
+        responses = dict()
+        for node, outcome in outcomes:
+            try:
+                response = outcome()
             except NodeSeemsToBeDown:
                 # TODO: Introduce good failure mode here if too few nodes receive the map.
                 self.log.debug(f"Failed pushing {self.treasure_map} to unresponsive {node}")
@@ -333,47 +383,124 @@ class Policy(ABC):
         """
         Assign kfrags to ursulas_on_network, and distribute them via REST,
         populating enacted_arrangements
-        """
-        for arrangement in self.__assign_kfrags():
-            arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
-
-            try:
-                response = network_middleware.enact_policy(arrangement.ursula,
-                                                           arrangement.id,
-                                                           arrangement_message_kit.to_bytes())
-            except network_middleware.UnexpectedResponse as e:
-                arrangement.status = e.status
-            else:
-                arrangement.status = response.status_code
-
-            # Assuming response is what we hope for.
-            self.treasure_map.add_arrangement(arrangement)
 
+        Whether enacted one at a time or concurrently, an Ursula which is down is left off the TreasureMap;
+        the policy stands as long as m Ursulas remain.
+        """
+        started = time.perf_counter()
+        if self.negotiation_workers > 1:
+            self._enact_arrangements_concurrently(network_middleware=network_middleware)
         else:
-            # OK, let's check: if two or more Ursulas claimed we didn't pay,
-            # we need to re-evaulate our situation here.
-            arrangement_statuses = [a.status for a in self._accepted_arrangements]
-            number_of_claims_of_freeloading = sum(status==402 for status in arrangement_statuses)
+            for arrangement in list(self.__assign_kfrags()):
+                try:
+                    self._enact_arrangement(network_middleware=network_middleware, arrangement=arrangement)
+                except NodeSeemsToBeDown:
+                    self.log.debug(f"Failed enacting {arrangement} with unresponsive {arrangement.ursula}")
+                    del self._enacted_arrangements[arrangement.kfrag]
+                    continue
+                # Assuming response is what we hope for.
+                self.treasure_map.add_arrangement(arrangement)
+        self.phase_timings['enactment'] = time.perf_counter() - started
+
+        # OK, let's check: if two or more Ursulas claimed we didn't pay,
+        # we need to re-evaulate our situation here.
+        arrangement_statuses = [a.status for a in self._accepted_arrangements]
+        number_of_claims_of_freeloading = sum(status==402 for status in arrangement_statuses)
+
+        if number_of_claims_of_freeloading > 2:
+            raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+
+        self.treasure_map.check_for_sufficient_destinations()
+
+        # TODO: Leave a note to try any failures later.
+        pass
 
-            if number_of_claims_of_freeloading > 2:
-                raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+        # ...After *all* the arrangements are enacted
+        # Create Alice's revocation kit
+        self.revocation_kit = RevocationKit(self, self.alice.stamp)
+        self.alice.add_active_policy(self)
+
+        if publish is True:
+            return self.publish_treasure_map(network_middleware=network_middleware)
 
-            self.treasure_map.check_for_sufficient_destinations()
+    @property
+    def _request_timeout(self) -> dict:
+        """Bounds each negotiation or enactment request by negotiation_timeout, when there is one."""
+        return dict(timeout=self.negotiation_timeout) if self.negotiation_timeout else dict()
 
-            # TODO: Leave a note to try any failures later.
-            pass
+    @staticmethod
+    def _started_at(started: dict, key, request, *args, **kwargs):
+        """Runs request, noting in started when a thread actually got to it (rather than when it was queued)."""
+        started[key] = time.monotonic()
+        return request(*args, **kwargs)
 
-            # ...After *all* the arrangements are enacted
-            # Create Alice's revocation kit
-            self.revocation_kit = RevocationKit(self, self.alice.stamp)
-            self.alice.add_active_policy(self)
+    @staticmethod
+    def _enact_arrangement(network_middleware, arrangement, **request_kwargs) -> None:
+        arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
+        try:
+            response = network_middleware.enact_policy(arrangement.ursula,
+                                                       arrangement.id,
+                                                       arrangement_message_kit.to_bytes(),
+                                                       **request_kwargs)
+        except network_middleware.UnexpectedResponse as e:
+            arrangement.status = e.status
+        else:
+            arrangement.status = response.status_code
 
-            if publish is True:
-                return self.publish_treasure_map(network_middleware=network_middleware)
+    def _enact_arrangements_concurrently(self, network_middleware) -> None:
+        """
+        Sends every assigned KFrag over a bounded pool.  An Ursula that is down or does not answer within
+        negotiation_timeout of being sent her KFrag is left off the TreasureMap, and her KFrag is unassigned;
+        the policy stands as long as m Ursulas remain.
+        """
+        assigned = list(self.__assign_kfrags())
+        started = dict()  # arrangement -> when its request was actually sent
+        executor = ThreadPoolExecutor(max_workers=self.negotiation_workers,
+                                      thread_name_prefix=f"{self.__class__.__name__}-enactment")
+        try:
+            futures = [executor.submit(self._started_at, started, arrangement, self._enact_arrangement,
+                                       network_middleware, arrangement, **self._request_timeout)
+                       for arrangement in assigned]
+
+            # Each Ursula gets negotiation_timeout from when her own request goes out, not from when it was queued.
+            pending = dict(zip(futures, assigned))
+            timed_out = set()
+            while pending:
+                timeout = None
+                if self.negotiation_timeout:
+                    now = time.monotonic()
+                    earliest = min(started.get(arrangement, now) for arrangement in pending.values())
+                    timeout = max(0, earliest + self.negotiation_timeout - time.monotonic())
+                done, _not_done = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+                for future, arrangement in list(pending.items()):
+                    if future in done:
+                        del pending[future]
+                    elif self.negotiation_timeout and now >= started.get(arrangement, now) + self.negotiation_timeout:
+                        # Any late answer is ignored; she won't be on the map.
+                        del pending[future]
+                        timed_out.add(future)
+
+            # Add destinations in assignment order, regardless of the order responses arrived in.
+            for arrangement, future in zip(assigned, futures):
+                if future in timed_out:
+                    self.log.debug(f"Timed out enacting {arrangement} with {arrangement.ursula}")
+                elif isinstance(future.exception(), NodeSeemsToBeDown):
+                    self.log.debug(f"Failed enacting {arrangement} with unresponsive {arrangement.ursula}")
+                else:
+                    future.result()
+                    # Assuming response is what we hope for.
+                    self.treasure_map.add_arrangement(arrangement)
+                    continue
+                del self._enacted_arrangements[arrangement.kfrag]
+        finally:
+            executor.shutdown(wait=False)
 
     def consider_arrangement(self, network_middleware, ursula, arrangement) -> bool:
         negotiation_response = network_middleware.consider_arrangement(arrangement=arrangement)
+        return self._bucket_arrangement(arrangement=arrangement, negotiation_response=negotiation_response)
 
+    def _bucket_arrangement(self, arrangement, negotiation_response) -> bool:
         # TODO: check out the response: need to assess the result and see if we're actually good to go.
         arrangement_is_accepted = negotiation_response.status_code == 200
 
@@ -397,10 +524,16 @@ class Policy(ABC):
                  know which nodes to use.  Either pass them here or when you make ' \
                  the Policy.".format(self.n))
 
-        # TODO: One of these layers needs to add concurrency.
-        self._consider_arrangements(network_middleware=network_middleware,
-                                    candidate_ursulas=sampled_ursulas,
-                                    *args, **kwargs)
+        started = time.perf_counter()
+        if self.negotiation_workers > 1:
+            self._consider_arrangements_concurrently(network_middleware=network_middleware,
+                                                     candidate_ursulas=sampled_ursulas,
+                                                     *args, **kwargs)
+        else:
+            self._consider_arrangements(network_middleware=network_middleware,
+                                        candidate_ursulas=sampled_ursulas,
+                                        *args, **kwargs)
+        self.phase_timings['negotiation'] = time.perf_counter() - started
 
         if len(self._accepted_arrangements) < self.n:
             raise self.Rejected(f'Selected Ursulas rejected too many arrangements '
@@ -464,6 +597,83 @@ class Policy(ABC):
                     self._rejected_arrangements.add(arrangement)
 
 
+    def _consider_arrangements_concurrently(self,
+                                            network_middleware: RestMiddleware,
+                                            candidate_ursulas: Set[Ursula],
+                                            consider_everyone: bool = False,
+                                            *args,
+                                            **kwargs) -> None:
+        """
+        Negotiates with up to negotiation_workers Ursulas at a time.  Only as many negotiations as could still
+        be needed to reach n acceptances are kept in flight; when an Ursula rejects, is down, or does not answer
+        within negotiation_timeout of being asked, the next candidate (falling back to _spare_candidates) takes
+        her place.  A request given up on keeps its thread until the middleware times it out, so new candidates
+        are only asked as threads come free.  Candidates never contacted are kept as spares.
+        """
+        candidates = deque(candidate_ursulas)
+        in_flight = dict()   # future -> arrangement
+        abandoned = set()    # futures given up on, which may still be holding a thread
+        started = dict()     # arrangement -> when its request was actually sent
+        executor = ThreadPoolExecutor(max_workers=self.negotiation_workers,
+                                      thread_name_prefix=f"{self.__class__.__name__}-negotiation")
+        try:
+            while consider_everyone or len(self._accepted_arrangements) < self.n:
+                abandoned = {future for future in abandoned if not future.done()}
+                have_candidates = bool(candidates) or (bool(self._spare_candidates) and not consider_everyone)
+
+                # Keep the free threads busy, but never ask more Ursulas than we could still need.
+                free_threads = self.negotiation_workers - len(in_flight) - len(abandoned)
+                while free_threads > 0:
+                    if not consider_everyone and len(self._accepted_arrangements) + len(in_flight) >= self.n:
+                        break
+                    if candidates:
+                        ursula = candidates.popleft()
+                    elif self._spare_candidates and not consider_everyone:
+                        ursula = self._spare_candidates.pop()
+                    else:
+                        break
+                    arrangement = self.make_arrangement(ursula=ursula, *args, **kwargs)
+                    future = executor.submit(self._started_at, started, arrangement,
+                                             network_middleware.consider_arrangement,
+                                             arrangement=arrangement, **self._request_timeout)
+                    in_flight[future] = arrangement
+                    free_threads -= 1
+
+                if not in_flight and not (abandoned and have_candidates):
+                    break  # Out of candidates.
+
+                timeout = None
+                if self.negotiation_timeout and in_flight:
+                    now = time.monotonic()
+                    earliest = min(started.get(arrangement, now) for arrangement in in_flight.values())
+                    timeout = max(0, earliest + self.negotiation_timeout - time.monotonic())
+                done, _not_done = wait(set(in_flight) | abandoned, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                now = time.monotonic()
+                for future, arrangement in list(in_flight.items()):
+                    if future in done:
+                        del in_flight[future]
+                        try:
+                            negotiation_response = future.result()
+                        except NodeSeemsToBeDown:  # TODO: #355 Also catch InvalidNode here?
+                            self.log.debug(f"Arrangement failed with unresponsive {arrangement.ursula}")
+                            continue
+                        if self._bucket_arrangement(arrangement=arrangement, negotiation_response=negotiation_response):
+                            self.log.debug(f"Arrangement accepted by {arrangement.ursula}")
+                        else:
+                            self.log.debug(f"Arrangement failed with {arrangement.ursula}")
+                    elif self.negotiation_timeout and now >= started.get(arrangement, now) + self.negotiation_timeout:
+                        # Any late answer is ignored; she won't be sent a KFrag.
+                        del in_flight[future]
+                        abandoned.add(future)
+                        self.log.debug(f"Arrangement timed out with {arrangement.ursula}")
+        finally:
+            self._spare_candidates.update(candidates)
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
 class FederatedPolicy(Policy):
 
     _arrangement_class = Arrangement
@@ -663,7 +873,9 @@ class BlockchainPolicy(Policy):
         populating enacted_arrangements
         """
         if publish is True:
+            started = time.perf_counter()
             self.publish_to_blockchain()
+            self.phase_timings['blockchain_publication'] = time.perf_counter() - started
 
             # Not in love with this block here, but I want 121 closed.
             for arrangement in self._accepted_arrangements:
@@ -101,7 +101,11 @@ def collect_prometheus_metrics(ursula, event_metrics_collectors: List[BaseEventM
 
     node_metrics["learning_status"].state('running' if ursula._learning_task.running else 'stopped')
     node_metrics["known_nodes_gauge"].set(len(ursula.known_nodes))
-    node_metrics["work_orders_gauge"].set(len(ursula.work_orders()))
+    # This runs on the reactor, so don't wait for queued work orders to be written; the gauge may lag a little.
+    node_metrics["work_orders_gauge"].set(len(ursula.work_orders(flush=False)))
+    node_metrics["treasure_maps_gauge"].set(len(ursula.treasure_maps))
+    node_metrics["treasure_map_cache_hit_rate_gauge"].set(ursula.treasure_maps.hit_rate)
+    node_metrics["kfrag_cache_hit_rate_gauge"].set(ursula.kfrag_cache.hit_rate)
 
     if not ursula.federated_only:
 
@@ -291,6 +295,10 @@ def initialize_prometheus_exporter(ursula, listen_address: str, port: NETWORK_PO
     node_metrics = {
         "known_nodes_gauge": Gauge(f'{metrics_prefix}_known_nodes', 'Number of currently known nodes'),
         "work_orders_gauge": Gauge(f'{metrics_prefix}_work_orders', 'Number of accepted work orders'),
+        "treasure_maps_gauge": Gauge(f'{metrics_prefix}_treasure_maps', 'Number of stored treasure maps'),
+        "treasure_map_cache_hit_rate_gauge": Gauge(f'{metrics_prefix}_treasure_map_cache_hit_rate',
+                                                   'Treasure map cache hit rate'),
+        "kfrag_cache_hit_rate_gauge": Gauge(f'{metrics_prefix}_kfrag_cache_hit_rate', 'Decoded KFrag cache hit rate'),
         "missing_commitments_gauge": Gauge(f'{metrics_prefix}_missing_commitments',
                                            'Currently missed commitments'),
         "learning_status": Enum(f'{metrics_prefix}_node_discovery', 'Learning loop status',
@@ -122,6 +122,26 @@ def test_stakers_and_workers_relationships(testerchain, agency):
     assert NULL_ADDRESS == staking_agent.get_staker_from_worker(worker_address=random_address)
 
 
+def test_get_stakers_and_locked_tokens_in_batch(testerchain, agency, stakers):
+    _token_agent, staking_agent, _policy_agent = agency
+
+    staker_addresses = [staker.checksum_address for staker in stakers]
+    worker_addresses = [staking_agent.get_worker_from_staker(staker_address=address) for address in staker_addresses]
+    random_address = to_checksum_address(os.urandom(20))
+
+    # Results come back in the order they were asked for.
+    stakers_from_workers = staking_agent.get_stakers_from_workers(worker_addresses + [random_address])
+    assert stakers_from_workers == staker_addresses + [NULL_ADDRESS]
+
+    for periods in (0, 1):
+        locked_tokens = staking_agent.get_locked_tokens_of_stakers(staker_addresses, periods=periods)
+        assert locked_tokens == [staking_agent.get_locked_tokens(staker_address=address, periods=periods)
+                                 for address in staker_addresses]
+
+    with pytest.raises(ValueError):
+        staking_agent.get_locked_tokens_of_stakers(staker_addresses, periods=-1)
+
+
 @pytest.mark.slow()
 def test_get_staker_population(agency, stakers):
     _token_agent, staking_agent, _policy_agent = agency
@@ -143,6 +163,17 @@ def test_get_swarm(agency, blockchain_ursulas):
     assert isinstance(staker_addr, str)
     assert is_address(staker_addr)
 
+    # Looked up a few at a time, the stakers come in the same order.
+    assert list(staking_agent.swarm(batch_size=2)) == swarm_addresses
+    assert staking_agent.get_stakers(batch_size=2) == swarm_addresses
+
+    last_committed_periods = staking_agent.get_last_committed_periods(swarm_addresses, batch_size=2)
+    assert last_committed_periods == [staking_agent.get_last_committed_period(staker_address=address)
+                                      for address in swarm_addresses]
+
+    active, pending, missing = staking_agent.partition_stakers_by_activity(batch_size=2)
+    assert sorted(active + pending + missing) == sorted(swarm_addresses)
+
 
 @pytest.mark.slow()
 @pytest.mark.usefixtures("blockchain_ursulas")
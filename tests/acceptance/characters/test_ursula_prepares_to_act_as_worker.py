@@ -19,10 +19,12 @@ import maya
 import pytest
 from eth_account._utils.signing import to_standard_signature_bytes
 
-from nucypher.characters.lawful import Enrico
+from nucypher.blockchain.eth.agents import ContractAgency, StakingEscrowAgent
+from nucypher.characters.lawful import Enrico, Ursula
 from nucypher.characters.unlawful import Vladimir
 from nucypher.crypto.api import verify_eip_191
 from nucypher.crypto.powers import SigningPower
+from nucypher.network.verification import VerificationCache
 from nucypher.policy.policies import Policy
 from tests.constants import INSECURE_DEVELOPMENT_PASSWORD
 from tests.utils.middleware import NodeIsDownMiddleware
@@ -64,6 +66,42 @@ def test_blockchain_ursula_verifies_stamp(blockchain_ursulas):
     assert first_ursula.verified_stamp
 
 
+def test_blockchain_ursulas_are_validated_in_batch(blockchain_ursulas, test_registry):
+    ursulas = list(blockchain_ursulas)
+    sprouts = [Ursula.from_bytes(bytes(ursula), registry=test_registry) for ursula in ursulas]
+
+    failures = Ursula.validate_workers(sprouts, registry=test_registry)
+    assert not failures
+    assert all(node.verified_stamp and node.verified_worker for node in sprouts)
+
+
+def test_blockchain_ursula_verification_is_cached_for_the_period(blockchain_ursulas, test_registry, tmpdir):
+    ursula = list(blockchain_ursulas)[0]
+    staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=test_registry)
+    current_period = staking_agent.get_current_period()
+    verification_cache = VerificationCache(db_filepath=str(tmpdir.join(VerificationCache.DB_FILE_NAME)))
+
+    node = Ursula.from_bytes(bytes(ursula), registry=test_registry).mature()
+    node.validate_metadata(registry=test_registry)
+    node._record_verification(verification_cache, registry=test_registry)
+    assert verification_cache.get(node) == (ursula.worker_address, current_period)
+
+    # This period, a node rebuilt from the same metadata needn't be checked again, on-chain or off.
+    rebuilt_node = Ursula.from_bytes(bytes(ursula), registry=test_registry).mature()
+    assert rebuilt_node._restore_verification(verification_cache, registry=test_registry)
+    assert rebuilt_node.verified_interface and rebuilt_node.verified_stamp and rebuilt_node.verified_worker
+    assert rebuilt_node.worker_address == ursula.worker_address
+
+    # What was recorded in an earlier period isn't trusted; the on-chain checks are left to be made again.
+    verification_cache.record(node, worker_address=ursula.worker_address, period=current_period - 1)
+    stale_node = Ursula.from_bytes(bytes(ursula), registry=test_registry).mature()
+    assert not stale_node._restore_verification(verification_cache, registry=test_registry)
+    assert not stale_node.verified_stamp and not stale_node.verified_worker
+    stale_node.validate_metadata(registry=test_registry)
+    stale_node._record_verification(verification_cache, registry=test_registry)
+    assert verification_cache.get(node) == (ursula.worker_address, current_period)
+
+
 @pytest.mark.skip("See Issue #1075")  # TODO: Issue #1075
 def test_vladimir_cannot_verify_interface_with_ursulas_signing_key(blockchain_ursulas):
     his_target = list(blockchain_ursulas)[4]
@@ -21,6 +21,7 @@ import os
 import pytest
 import time
 from constant_sorrow.constants import NO_DECRYPTION_PERFORMED
+from requests.exceptions import ConnectTimeout
 from twisted.internet.task import Clock
 
 from nucypher.characters.lawful import Bob, Enrico, Ursula
@@ -214,6 +215,80 @@ def test_bob_retrieves_with_treasure_map(
     assert text1[0] == text2[0] == b'Welcome to flippering number 2.'
 
 
+def test_bob_retrieves_concurrently(federated_bob, federated_ursulas,
+                                    enacted_federated_policy, capsule_side_channel):
+    enrico = capsule_side_channel.enrico
+    message_kit = capsule_side_channel()
+    treasure_map = enacted_federated_policy.treasure_map
+    alice_verifying_key = enacted_federated_policy.alice.stamp
+    m = treasure_map.m
+
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    middleware = federated_bob.network_middleware
+    original_reencrypt = middleware.reencrypt
+    requested = list()
+
+    def counting_reencrypt(work_order):
+        requested.append(work_order.ursula)
+        return original_reencrypt(work_order)
+
+    middleware.reencrypt = counting_reencrypt
+    federated_bob.retrieval_concurrency = m
+    try:
+        cleartexts = federated_bob.retrieve(message_kit,
+                                            enrico=enrico,
+                                            alice_verifying_key=alice_verifying_key,
+                                            label=enacted_federated_policy.label,
+                                            treasure_map=treasure_map)
+    finally:
+        federated_bob.retrieval_concurrency = 1
+        del middleware.reencrypt
+
+    assert cleartexts[0] == b'Welcome to flippering number %d.' % (len(capsule_side_channel.messages) - 1)
+
+    # The first m responses activate the capsule; nobody else is asked.
+    assert len(requested) == m
+
+
+def test_bob_concurrent_retrieval_replaces_unreachable_ursula(federated_bob, federated_ursulas,
+                                                              enacted_federated_policy, capsule_side_channel):
+    enrico = capsule_side_channel.enrico
+    message_kit = capsule_side_channel()
+    treasure_map = enacted_federated_policy.treasure_map
+    alice_verifying_key = enacted_federated_policy.alice.stamp
+    m = treasure_map.m
+
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    middleware = federated_bob.network_middleware
+    original_reencrypt = middleware.reencrypt
+    requested = list()
+
+    def flaky_reencrypt(work_order):
+        requested.append(work_order.ursula)
+        if len(requested) == 1:
+            raise ConnectTimeout
+        return original_reencrypt(work_order)
+
+    middleware.reencrypt = flaky_reencrypt
+    federated_bob.retrieval_concurrency = m
+    try:
+        cleartexts = federated_bob.retrieve(message_kit,
+                                            enrico=enrico,
+                                            alice_verifying_key=alice_verifying_key,
+                                            label=enacted_federated_policy.label,
+                                            treasure_map=treasure_map)
+    finally:
+        federated_bob.retrieval_concurrency = 1
+        del middleware.reencrypt
+
+    assert cleartexts[0] == b'Welcome to flippering number %d.' % (len(capsule_side_channel.messages) - 1)
+    assert len(requested) == m + 1
+
+
 def test_bob_retrieves_too_late(federated_bob, federated_ursulas,
                                 enacted_federated_policy, capsule_side_channel):
 
@@ -15,6 +15,9 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import pytest
+from bytestring_splitter import BytestringSplittingError, VARIABLE_HEADER_LENGTH, VariableLengthBytestring
+
 from nucypher.characters.lawful import Ursula
 
 
@@ -23,3 +26,45 @@ def test_serialize_ursula(federated_ursulas):
     ursula_as_bytes = bytes(ursula)
     ursula_object = Ursula.from_bytes(ursula_as_bytes)
     assert ursula == ursula_object
+
+
+def test_ursulas_batched_from_bytes_are_split_lazily(federated_ursulas):
+    others = list(federated_ursulas)[1:]
+    nodes_as_vbytes = b"".join(bytes(VariableLengthBytestring(bytes(ursula))) for ursula in others)
+
+    sprouts = Ursula.batch_from_bytes(nodes_as_vbytes)
+    assert len(sprouts) == len(others)
+
+    for sprout, ursula in zip(sprouts, others):
+        # What a learner needs to know whether a node is news is read without splitting the rest.
+        assert sprout.checksum_address == ursula.checksum_address
+        assert sprout.timestamp == ursula.timestamp
+        assert sprout._view is not None
+
+        assert bytes(sprout) == bytes(ursula)
+
+        matured = sprout.mature()
+        assert matured == ursula
+        assert bytes(matured.rest_interface) == bytes(ursula.rest_interface)
+
+
+def test_sprouts_batched_from_bytes_do_not_keep_the_payload(federated_ursulas):
+    others = list(federated_ursulas)[1:]
+    nodes_as_vbytes = b"".join(bytes(VariableLengthBytestring(bytes(ursula))) for ursula in others)
+    sprout = Ursula.batch_from_bytes(nodes_as_vbytes)[0]
+    assert len(sprout._view.obj) == len(nodes_as_vbytes)
+
+    # Once detached, say, when remembered, a sprout holds a copy of only its own metadata.
+    sprout.detach()
+    assert bytes(sprout._view.obj) == bytes(others[0])[2:]
+    assert sprout.mature() == others[0]
+
+
+def test_truncated_node_metadata_is_rejected(federated_ursulas):
+    ursula_as_bytes = bytes(list(federated_ursulas)[0])
+    # Long enough for its version, address, domains and timestamp, but not much of the rest.
+    domains_length = int.from_bytes(ursula_as_bytes[22:22 + VARIABLE_HEADER_LENGTH], "big")
+    timestamp_end = 22 + VARIABLE_HEADER_LENGTH + domains_length + 4
+    truncated = ursula_as_bytes[:timestamp_end + 10]
+    with pytest.raises(BytestringSplittingError):
+        Ursula.batch_from_bytes(bytes(VariableLengthBytestring(truncated)))
@@ -18,9 +18,10 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import datetime
 import maya
 import pytest
+import time
 from umbral.kfrags import KFrag
 
-from nucypher.characters.lawful import Enrico
+from nucypher.characters.lawful import Enrico, Ursula
 from nucypher.crypto.api import keccak_digest
 from nucypher.policy.collections import Revocation
 
@@ -60,6 +61,165 @@ def test_federated_grant(federated_alice, federated_bob):
         assert kfrag == retrieved_kfrag
 
 
+@pytest.mark.usefixtures('federated_ursulas')
+def test_federated_grant_with_concurrent_negotiation(federated_alice, federated_bob):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"this_is_the_path_to_which_access_is_being_granted_concurrently"
+
+    policy = federated_alice.grant(federated_bob, label, m=m, n=n, expiration=policy_end_datetime,
+                                   negotiation_workers=n, negotiation_timeout=10)
+
+    assert policy.negotiation_workers == n
+    assert len(policy._accepted_arrangements) == n
+    assert len(policy._enacted_arrangements) == n
+    assert len(policy.treasure_map.destinations) == n
+    assert set(policy.phase_timings) == {'negotiation', 'enactment', 'treasure_map_publication'}
+
+    for kfrag in policy.kfrags:
+        arrangement = policy._enacted_arrangements[kfrag]
+        retrieved_policy = arrangement.ursula.datastore.get_policy_arrangement(arrangement.id.hex().encode())
+        assert kfrag == KFrag.from_bytes(retrieved_policy.kfrag)
+
+
+def test_concurrent_negotiation_replaces_rejecting_ursula(federated_alice, federated_bob, federated_ursulas):
+    m, n = 2, 3
+    policy = federated_alice.create_policy(bob=federated_bob,
+                                           label=b"rejected_once",
+                                           m=m,
+                                           n=n,
+                                           expiration=maya.now() + datetime.timedelta(days=5),
+                                           negotiation_workers=n)
+
+    middleware = federated_alice.network_middleware
+    original_consider_arrangement = middleware.consider_arrangement
+    contacted = list()
+
+    class Rejection:
+        status_code = 403
+
+    def picky_consider_arrangement(arrangement):
+        contacted.append(arrangement.ursula)
+        if len(contacted) == 1:
+            return Rejection()
+        return original_consider_arrangement(arrangement=arrangement)
+
+    middleware.consider_arrangement = picky_consider_arrangement
+    try:
+        policy.make_arrangements(network_middleware=middleware, handpicked_ursulas=set(federated_ursulas))
+    finally:
+        del middleware.consider_arrangement
+
+    # The rejecting Ursula was replaced by the next candidate, and nobody else was bothered.
+    assert len(contacted) == n + 1
+    assert len(policy._accepted_arrangements) == n
+    assert len(policy._rejected_arrangements) == 1
+    assert len(policy._spare_candidates) == len(federated_ursulas) - len(contacted)
+
+
+@pytest.mark.parametrize('negotiation_workers', (1, 3))
+def test_enactment_leaves_unresponsive_ursulas_off_the_map(federated_alice,
+                                                           federated_bob,
+                                                           federated_ursulas,
+                                                           negotiation_workers):
+    m, n = 2, 3
+    policy = federated_alice.create_policy(bob=federated_bob,
+                                           label=b"enacted_with_one_down_%d" % negotiation_workers,
+                                           m=m,
+                                           n=n,
+                                           expiration=maya.now() + datetime.timedelta(days=5),
+                                           negotiation_workers=negotiation_workers)
+    middleware = federated_alice.network_middleware
+    policy.make_arrangements(network_middleware=middleware, handpicked_ursulas=set(federated_ursulas))
+
+    original_enact_policy = middleware.enact_policy
+    down_ursula = next(iter(policy._accepted_arrangements)).ursula
+
+    def flaky_enact_policy(ursula, *args, **kwargs):
+        if ursula is down_ursula:
+            raise ConnectionRefusedError  # One of the ways a node seems to be down
+        return original_enact_policy(ursula, *args, **kwargs)
+
+    middleware.enact_policy = flaky_enact_policy
+    try:
+        policy.enact(network_middleware=middleware, publish=False)
+    finally:
+        del middleware.enact_policy
+
+    # Serially or not, the Ursula that was down isn't on the map, and the policy stands with the others.
+    assert len(policy.treasure_map.destinations) == n - 1
+    assert down_ursula.checksum_address not in policy.treasure_map.destinations
+    assert down_ursula not in {arrangement.ursula for arrangement in policy._enacted_arrangements.values()}
+
+
+def test_concurrent_enactment_times_out_each_ursula_from_her_own_request(federated_alice,
+                                                                         federated_bob,
+                                                                         federated_ursulas):
+    m, n = 2, 3
+    timeout = 0.5
+    policy = federated_alice.create_policy(bob=federated_bob,
+                                           label=b"enacted_with_one_hung",
+                                           m=m,
+                                           n=n,
+                                           expiration=maya.now() + datetime.timedelta(days=5),
+                                           negotiation_workers=2,
+                                           negotiation_timeout=timeout)
+    middleware = federated_alice.network_middleware
+    policy.make_arrangements(network_middleware=middleware, handpicked_ursulas=set(federated_ursulas))
+
+    original_enact_policy = middleware.enact_policy
+    hung_ursula = next(iter(policy._accepted_arrangements)).ursula
+
+    def slow_enact_policy(ursula, *args, **kwargs):
+        # Every request holds its thread for most of the timeout, so the third one is queued behind the others.
+        time.sleep(timeout * 3 if ursula is hung_ursula else timeout * 0.8)
+        return original_enact_policy(ursula, *args, **kwargs)
+
+    middleware.enact_policy = slow_enact_policy
+    try:
+        policy.enact(network_middleware=middleware, publish=False)
+    finally:
+        del middleware.enact_policy
+
+    # Only the hung Ursula is dropped; the queued one wasn't timed out before she was even asked.
+    assert len(policy.treasure_map.destinations) == n - 1
+    assert hung_ursula.checksum_address not in policy.treasure_map.destinations
+    assert len(policy._enacted_arrangements) == n - 1
+
+
+def test_concurrent_negotiation_only_asks_as_threads_come_free(federated_alice, federated_bob, federated_ursulas):
+    m, n = 2, 3
+    timeout = 0.5
+    policy = federated_alice.create_policy(bob=federated_bob,
+                                           label=b"negotiated_with_one_hung",
+                                           m=m,
+                                           n=n,
+                                           expiration=maya.now() + datetime.timedelta(days=5),
+                                           negotiation_workers=n,
+                                           negotiation_timeout=timeout)
+
+    middleware = federated_alice.network_middleware
+    original_consider_arrangement = middleware.consider_arrangement
+    contacted = list()
+
+    def hanging_consider_arrangement(arrangement, **kwargs):
+        contacted.append(arrangement.ursula)
+        if len(contacted) == 1:
+            time.sleep(timeout * 4)  # Holds its thread well past the timeout.
+        return original_consider_arrangement(arrangement=arrangement, **kwargs)
+
+    middleware.consider_arrangement = hanging_consider_arrangement
+    try:
+        policy.make_arrangements(network_middleware=middleware, handpicked_ursulas=set(federated_ursulas))
+    finally:
+        del middleware.consider_arrangement
+
+    # The hung Ursula was replaced, and everyone else who was asked answered in time.
+    assert len(policy._accepted_arrangements) == n
+    assert contacted[0] not in policy.accepted_ursulas
+    assert len(contacted) == n + 1
+
+
 def test_federated_alice_can_decrypt(federated_alice, federated_bob):
     """
     Test that alice can decrypt data encrypted by an enrico
@@ -129,3 +289,39 @@ def test_revocation(federated_alice, federated_bob):
     # Try to revoke the already revoked policy
     already_revoked = federated_alice.revoke(policy)
     assert len(already_revoked) == 3
+
+
+def test_revocation_invalidates_decoded_kfrag_cache(federated_alice, federated_bob, federated_ursulas):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"revocation with a warm kfrag cache"
+
+    policy = federated_alice.grant(federated_bob, label, m=m, n=n, expiration=policy_end_datetime)
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    enrico = Enrico(policy_encrypting_key=policy.public_key)
+    message_kit, _signature = enrico.encrypt_message(b"hot arrangement")
+    federated_bob.join_policy(label, federated_alice.stamp)
+    cleartexts = federated_bob.retrieve(message_kit,
+                                        enrico=enrico,
+                                        alice_verifying_key=federated_alice.stamp,
+                                        label=label)
+    assert cleartexts == [b"hot arrangement"]
+
+    arrangements = {arrangement.ursula: arrangement.id.hex().encode() for arrangement in policy._enacted_arrangements.values()}
+    warm = [ursula for ursula, arrangement_id in arrangements.items() if ursula.kfrag_cache.get(arrangement_id)]
+    assert len(warm) >= m
+
+    failed_revocations = federated_alice.revoke(policy)
+    assert len(failed_revocations) == 0
+
+    for ursula, arrangement_id in arrangements.items():
+        assert ursula.kfrag_cache.get(arrangement_id) is None
+
+    message_kit.capsule.clear_cfrags()
+    with pytest.raises(Ursula.NotEnoughUrsulas):
+        federated_bob.retrieve(message_kit,
+                               enrico=enrico,
+                               alice_verifying_key=federated_alice.stamp,
+                               label=label)
@@ -0,0 +1,108 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.config.constants import TEMPORARY_DOMAIN
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.network.reencryption import ReencryptionEngine
+
+
+def _issue_work_order(policy, bob, alice, ursulas, capsule_side_channel, number_of_capsules):
+    treasure_map = policy.treasure_map
+    map_id = treasure_map.public_id()
+    bob.treasure_maps[map_id] = treasure_map
+    for ursula in ursulas:
+        bob.remember_node(ursula)
+
+    capsules = [capsule_side_channel().capsule for _ in range(number_of_capsules)]
+    for capsule in capsules:
+        capsule.set_correctness_keys(delegating=policy.public_key,
+                                     receiving=bob.public_keys(DecryptingPower),
+                                     verifying=alice.stamp.as_umbral_pubkey())
+
+    work_orders, _ = bob.work_orders_for_capsules(*capsules,
+                                                  map_id=map_id,
+                                                  alice_verifying_key=alice.stamp.as_umbral_pubkey(),
+                                                  num_ursulas=1)
+    _address, work_order = list(work_orders.items())[0]
+    for ursula in ursulas:
+        if ursula.rest_interface.port == work_order.ursula.rest_interface.port:
+            return capsules, work_order, ursula
+    raise RuntimeError("Lost track of the Ursula that has the WorkOrder.")
+
+
+def test_ursula_reencrypts_serially_by_default(enacted_federated_policy,
+                                               federated_bob,
+                                               federated_alice,
+                                               federated_ursulas,
+                                               capsule_side_channel):
+    capsules, work_order, ursula = _issue_work_order(enacted_federated_policy,
+                                                     federated_bob,
+                                                     federated_alice,
+                                                     federated_ursulas,
+                                                     capsule_side_channel,
+                                                     number_of_capsules=3)
+    assert ursula.reencryption_engine.mode == ReencryptionEngine.SERIAL
+
+    cfrags = federated_bob.get_reencrypted_cfrags(work_order)
+    assert len(cfrags) == len(capsules)
+    for capsule, cfrag in zip(capsules, cfrags):
+        assert cfrag.verify_correctness(capsule)
+
+    report = ursula.reencryption_engine.latency_report()
+    assert ReencryptionEngine.POOLED not in report
+    assert report[ReencryptionEngine.SERIAL]['tasks'] >= len(capsules)
+
+
+def test_ursula_reencrypts_on_process_pool(enacted_federated_policy,
+                                           federated_bob,
+                                           federated_alice,
+                                           federated_ursulas,
+                                           capsule_side_channel):
+    capsules, work_order, ursula = _issue_work_order(enacted_federated_policy,
+                                                     federated_bob,
+                                                     federated_alice,
+                                                     federated_ursulas,
+                                                     capsule_side_channel,
+                                                     number_of_capsules=5)
+
+    pooled_engine = ReencryptionEngine(stamp=ursula.stamp, workers=2)
+    serial_engine, ursula.reencryption_engine = ursula.reencryption_engine, pooled_engine
+    try:
+        cfrags = federated_bob.get_reencrypted_cfrags(work_order)
+    finally:
+        ursula.reencryption_engine = serial_engine
+        pooled_engine.shutdown()
+
+    # CFrags come back in task order, each signed and correct for its own capsule.
+    assert len(cfrags) == len(capsules)
+    for capsule, cfrag in zip(capsules, cfrags):
+        assert cfrag.verify_correctness(capsule)
+
+    report = pooled_engine.latency_report()
+    assert report[ReencryptionEngine.POOLED]['tasks'] == len(capsules)
+    assert report[ReencryptionEngine.POOLED]['max'] >= report[ReencryptionEngine.POOLED]['mean'] > 0
+
+
+
+def test_ursula_configuration_sets_reencryption_workers():
+    config = UrsulaConfiguration(dev_mode=True, federated_only=True, domains={TEMPORARY_DOMAIN}, reencryption_workers=2)
+    assert config.static_payload()['reencryption_workers'] == 2
+
+    ursula = config()
+    assert ursula.reencryption_engine.mode == ReencryptionEngine.POOLED
+    assert ursula.reencryption_engine.workers == 2
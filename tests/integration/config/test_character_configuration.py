@@ -36,6 +36,7 @@ from nucypher.config.constants import TEMPORARY_DOMAIN
 from nucypher.config.keyring import NucypherKeyring
 from nucypher.config.node import CharacterConfiguration
 from nucypher.config.storages import ForgetfulNodeStorage
+from nucypher.network.middleware import PooledNucypherMiddlewareClient
 
 # Main Cast
 configurations = (AliceConfiguration, BobConfiguration, UrsulaConfiguration)
@@ -93,6 +94,16 @@ def test_federated_development_character_configurations(character, configuration
         _characters.append(another_character)
 
 
+@pytest.mark.parametrize("character,configuration", characters_and_configurations)
+def test_character_configuration_connection_pooling(character, configuration):
+    config = configuration(dev_mode=True, federated_only=True, domains={TEMPORARY_DOMAIN}, connection_pooling=True)
+    assert config.static_payload()['connection_pooling'] is True
+    assert isinstance(config.network_middleware.client, PooledNucypherMiddlewareClient)
+
+    thing = config()
+    assert isinstance(thing.network_middleware.client, PooledNucypherMiddlewareClient)
+
+
 @pytest.mark.parametrize('configuration_class', all_configurations)
 def test_default_character_configuration_preservation(configuration_class, testerchain, test_registry_source_manager):
 
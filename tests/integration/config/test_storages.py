@@ -15,11 +15,13 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
 import pytest
+import tempfile
 
 from nucypher.characters.lawful import Ursula
-from nucypher.config.storages import (ForgetfulNodeStorage, NodeStorage, SQLiteForgetfulNodeStorage,
-                                      TemporaryFileBasedNodeStorage)
+from nucypher.config.storages import (ForgetfulNodeStorage, MemoryMappedNodeStorage, NodeStorage,
+                                      SQLiteForgetfulNodeStorage, TemporaryFileBasedNodeStorage)
 from tests.constants import (
     MOCK_URSULA_DB_FILEPATH)
 from tests.utils.ursula import MOCK_URSULA_STARTING_PORT
@@ -119,3 +121,52 @@ class TestTemporaryFileBasedNodeStorage(BaseTestNodeStorageBackends):
     storage_backend = TemporaryFileBasedNodeStorage(character_class=BaseTestNodeStorageBackends.character_class,
                                                     federated_only=BaseTestNodeStorageBackends.federated_only)
     storage_backend.initialize()
+
+
+class TestMemoryMappedNodeStorage(BaseTestNodeStorageBackends):
+    storage_backend = MemoryMappedNodeStorage(storage_root=tempfile.mkdtemp(prefix='nucypher-tmp-nodes-'),
+                                              character_class=BaseTestNodeStorageBackends.character_class,
+                                              federated_only=BaseTestNodeStorageBackends.federated_only)
+    storage_backend.initialize()
+
+    def test_nodes_are_read_back_after_reopening(self, light_ursula):
+        storage_root = tempfile.mkdtemp(prefix='nucypher-tmp-nodes-')
+        node_storage = MemoryMappedNodeStorage(storage_root=storage_root, federated_only=True)
+        node_storage.store_node_metadata(node=light_ursula)
+
+        # Storing a node which hasn't changed doesn't write anything.
+        size = os.path.getsize(node_storage.nodes_filepath)
+        node_storage.store_node_metadata(node=light_ursula)
+        assert os.path.getsize(node_storage.nodes_filepath) == size
+
+        # A record that was only partly written (say, because of a crash) is discarded.
+        with open(node_storage.nodes_filepath, 'ab') as nodes_file:
+            nodes_file.write(MemoryMappedNodeStorage.STORE_RECORD + bytes(light_ursula)[:10])
+
+        reopened_storage = MemoryMappedNodeStorage(storage_root=storage_root, federated_only=True)
+        stored_nodes = reopened_storage.all(federated_only=True)
+        assert len(stored_nodes) == 1
+        stored_node = stored_nodes.pop()
+        assert stored_node.checksum_address == light_ursula.checksum_address
+        assert bytes(stored_node) == bytes(light_ursula)
+        assert os.path.getsize(reopened_storage.nodes_filepath) == size
+
+    def test_superseded_records_are_compacted(self, light_ursula, mocker):
+        node_storage = MemoryMappedNodeStorage(storage_root=tempfile.mkdtemp(prefix='nucypher-tmp-nodes-'),
+                                               federated_only=True)
+        mocker.patch.object(MemoryMappedNodeStorage, 'MIN_COMPACTION_SIZE', 0)
+        compact = mocker.spy(node_storage, 'compact')
+
+        node_storage.store_node_metadata(node=light_ursula)
+        size = os.path.getsize(node_storage.nodes_filepath)
+
+        # Once most of the file is superseded records, it's rewritten with only the latest ones.
+        node_storage.remove(checksum_address=light_ursula.checksum_address, certificate=False)
+        assert compact.call_count == 1
+        assert os.path.getsize(node_storage.nodes_filepath) == len(MemoryMappedNodeStorage.FILE_HEADER)
+        assert not node_storage.all(federated_only=True)
+
+        node_storage.store_node_metadata(node=light_ursula)
+        assert os.path.getsize(node_storage.nodes_filepath) == size
+        node_from_storage = node_storage.get(checksum_address=light_ursula.checksum_address, federated_only=True)
+        assert bytes(node_from_storage) == bytes(light_ursula)
@@ -15,9 +15,16 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import pytest
-from datetime import datetime
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, inspect
 
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.config.constants import TEMPORARY_DOMAIN
 from nucypher.datastore import datastore, keypairs
+from nucypher.datastore.db import create_datastore_engine, upgrade_schema
+from nucypher.datastore.group_commit import WorkOrderCommitQueue
+from nucypher.datastore.treasure_maps import TreasureMapStore
 
 
 @pytest.mark.usefixtures('testerchain')
@@ -75,3 +82,276 @@ def test_workorder_sqlite_datastore(test_datastore):
     deleted = test_datastore.del_workorders(arrangement_id)
     assert deleted > 0
     assert len(test_datastore.get_workorders(arrangement_id)) == 0
+
+
+def test_bulk_policy_arrangements_and_chunked_expiry(test_datastore):
+    alice_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    now = datetime.now()
+
+    arrangements = [dict(expiration=now - timedelta(days=1) if index % 2 else now + timedelta(days=1),
+                         arrangement_id=b'bulk%d' % index,
+                         alice_verifying_key=alice_keypair_sig.pubkey)
+                    for index in range(10)]
+    added = test_datastore.add_policy_arrangements(arrangements)
+    assert len(added) == 10
+
+    # All of them share a single stored key for Alice.
+    assert len({arrangement.alice_verifying_key.id for arrangement in added}) == 1
+
+    deleted = test_datastore.del_expired_policy_arrangements(now=now, chunk_size=2)
+    assert deleted == 5
+    assert test_datastore.get_policy_arrangement(b'bulk0')
+    with pytest.raises(datastore.NotFound):
+        test_datastore.get_policy_arrangement(b'bulk1')
+
+    for index in range(0, 10, 2):
+        test_datastore.del_policy_arrangement(b'bulk%d' % index)
+
+
+def test_bulk_workorders(test_datastore):
+    bob_keypair_sig1 = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    bob_keypair_sig2 = keypairs.SigningKeypair(generate_keys_if_needed=True)
+
+    arrangement_id = b'bulk-test'
+    workorders = [dict(bob_verifying_key=keypair.pubkey, bob_signature=b'bulk%d' % index, arrangement_id=arrangement_id)
+                  for index, keypair in enumerate((bob_keypair_sig1, bob_keypair_sig2, bob_keypair_sig1))]
+
+    assert test_datastore.save_workorders(workorders) == 3
+    assert len(test_datastore.get_workorders(arrangement_id)) == 3
+    assert len(test_datastore.get_workorders(bob_verifying_key=bob_keypair_sig1.pubkey)) == 2
+
+    assert test_datastore.del_workorders(arrangement_id) == 3
+
+
+def test_upgrade_schema_adds_missing_indexes():
+    engine = create_engine('sqlite:///:memory:')
+
+    # A datastore created before the indexes existed.
+    with engine.connect() as connection:
+        connection.execute("CREATE TABLE workorders (id INTEGER PRIMARY KEY, bob_verifying_key_id INTEGER, "
+                           "bob_signature BLOB UNIQUE, arrangement_id BLOB, created_at DATETIME)")
+
+    created = upgrade_schema(engine)
+    assert 'ix_workorders_arrangement_id' in created
+    assert 'ix_workorders_bob_verifying_key_id' in created
+
+    index_names = {index['name'] for index in inspect(engine).get_indexes('workorders')}
+    assert {'ix_workorders_arrangement_id', 'ix_workorders_bob_verifying_key_id'} <= index_names
+
+    # Running it again is a no-op.
+    assert upgrade_schema(engine) == []
+
+
+def test_treasure_map_sqlite_datastore(test_datastore):
+    now = datetime.now()
+
+    # Test add TreasureMap
+    assert test_datastore.add_treasure_map(b'map0', b'a treasure map', expiration=now + timedelta(days=1), now=now)
+    assert test_datastore.add_treasure_map(b'map1', b'an expiring treasure map', expiration=now,
+                                           now=now + timedelta(seconds=1))
+
+    # Test get TreasureMap
+    assert test_datastore.get_treasure_map(b'map0') == b'a treasure map'
+    assert test_datastore.count_treasure_maps() == 2
+
+    # Test re-adding replaces, and counts as the most recently stored
+    assert not test_datastore.add_treasure_map(b'map0', b'a newer treasure map', expiration=now + timedelta(days=1),
+                                               now=now + timedelta(seconds=2))
+    assert test_datastore.get_treasure_map(b'map0') == b'a newer treasure map'
+    assert test_datastore.count_treasure_maps() == 2
+    assert test_datastore.del_oldest_treasure_maps(keep=1) == [b'map1']
+    test_datastore.add_treasure_map(b'map1', b'an expiring treasure map', expiration=now)
+
+    # Test del expired TreasureMaps
+    assert test_datastore.del_expired_treasure_maps(now=now) == [b'map1']
+    with pytest.raises(datastore.NotFound):
+        test_datastore.get_treasure_map(b'map1')
+
+    # Test del TreasureMap
+    assert test_datastore.del_treasure_map(b'map0') == 1
+    assert test_datastore.count_treasure_maps() == 0
+
+
+def test_treasure_map_store(test_datastore, mocker):
+    store = TreasureMapStore(datastore=test_datastore, cache_size=2, max_maps=3, ttl=timedelta(days=1))
+    counts = mocker.spy(test_datastore, 'count_treasure_maps')
+    evictions = mocker.spy(test_datastore, 'del_oldest_treasure_maps')
+
+    pushed = datetime.utcnow()
+    for index in range(3):
+        store.store(map_id=b'map%d' % index, map_bytes=b'treasure map %d' % index, now=pushed + timedelta(seconds=index))
+    store.store(map_id=b'map0', map_bytes=b'treasure map 0', now=pushed + timedelta(seconds=3))  # Now the most recent
+
+    # The maps are only counted once, and nothing is pruned while they're within the cap.
+    assert counts.call_count == 1
+    assert not evictions.call_count
+
+    store.store(map_id=b'map3', map_bytes=b'treasure map 3', now=pushed + timedelta(seconds=4))
+    assert evictions.call_count == 1
+
+    # Bounded: the least recently pushed map was evicted, from both the datastore and the cache.
+    assert len(store) == 3
+    assert b'map1' not in store
+    assert store.get_bytes(b'map0') == b'treasure map 0'
+    assert store.get_bytes(b'map3') == b'treasure map 3'
+
+    # Maps evicted from the LRU cache are still served from the datastore.
+    store.hits = store.misses = 0
+    assert store.get_bytes(b'map2') == b'treasure map 2'
+    assert store.get_bytes(b'map2') == b'treasure map 2'
+    assert (store.hits, store.misses) == (1, 1)
+    assert store.stats()['hit_rate'] == 0.5
+
+    # Expired maps are pruned.
+    assert store.prune(now=datetime.utcnow() + timedelta(days=2)) == 3
+    assert len(store) == 0
+    with pytest.raises(KeyError):
+        store.get_bytes(b'map1')
+
+
+def test_wal_datastore_engine_profile(tmpdir):
+    engine = create_datastore_engine(db_filepath=str(tmpdir.join('ursula.db')), profile='wal')
+    with engine.connect() as connection:
+        assert connection.execute("PRAGMA journal_mode").scalar().lower() == 'wal'
+        assert connection.execute("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert connection.execute("PRAGMA secure_delete").scalar() == 1
+
+    with pytest.raises(ValueError):
+        create_datastore_engine(db_filepath=str(tmpdir.join('other.db')), profile='yolo')
+
+
+def test_workorder_group_commit(tmpdir):
+    engine = create_datastore_engine(db_filepath=str(tmpdir.join('ursula.db')), profile='wal')
+    upgrade_schema(engine)
+    test_datastore = datastore.Datastore(engine)
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+
+    commit_queue = WorkOrderCommitQueue(datastore=test_datastore, max_batch_size=10, max_latency=1)
+    commit_queue.start()
+    try:
+        # Ten work orders fill a batch, well before the flush latency.
+        committed = [commit_queue.save(bob_verifying_key=bob_keypair_sig.pubkey,
+                                       bob_signature=b'group%d' % index,
+                                       arrangement_id=b'group-commit')
+                     for index in range(10)]
+        assert all(future.result(timeout=1) for future in committed)
+        assert commit_queue.batches_committed == 1
+
+        # A replayed signature fails on its own, without taking its batch down with it.
+        replayed = commit_queue.save(bob_verifying_key=bob_keypair_sig.pubkey,
+                                     bob_signature=b'group0',
+                                     arrangement_id=b'group-commit')
+        fresh = commit_queue.save(bob_verifying_key=bob_keypair_sig.pubkey,
+                                  bob_signature=b'group10',
+                                  arrangement_id=b'group-commit')
+        assert fresh.result(timeout=5)
+        with pytest.raises(Exception):
+            replayed.result(timeout=5)
+    finally:
+        commit_queue.stop()
+
+    assert len(test_datastore.get_workorders(b'group-commit')) == 11
+    assert commit_queue.work_orders_committed == 11
+
+
+def test_asynchronous_workorder_persistence(tmpdir):
+    engine = create_datastore_engine(db_filepath=str(tmpdir.join('ursula.db')), profile='wal')
+    upgrade_schema(engine)
+    test_datastore = datastore.Datastore(engine)
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+
+    commit_queue = WorkOrderCommitQueue(datastore=test_datastore, max_pending=5, asynchronous=True)
+    assert commit_queue.asynchronous
+
+    # Nothing is written until the writer runs; and with max_pending waiting, saving more would block.
+    for index in range(5):
+        commit_queue._queue.put((dict(bob_verifying_key=bob_keypair_sig.pubkey,
+                                      bob_signature=b'async%d' % index,
+                                      arrangement_id=b'async'), Future()))
+    assert commit_queue.pending == 5
+    assert commit_queue._queue.full()
+
+    commit_queue.start()
+    commit_queue.save(bob_verifying_key=bob_keypair_sig.pubkey, bob_signature=b'async5', arrangement_id=b'async')
+    commit_queue.flush()
+    assert commit_queue.pending == 0
+    assert len(test_datastore.get_workorders(b'async')) == 6
+
+    # Stopping drains whatever is still queued.
+    commit_queue.save(bob_verifying_key=bob_keypair_sig.pubkey, bob_signature=b'async6', arrangement_id=b'async')
+    commit_queue.stop()
+    assert not commit_queue.running
+    assert len(test_datastore.get_workorders(b'async')) == 7
+
+
+def test_in_memory_datastore_engine_skips_profile_pragmas():
+    for db_filepath in (None, ''):
+        engine = create_datastore_engine(db_filepath=db_filepath, profile='wal')
+        with engine.connect() as connection:
+            assert connection.execute("PRAGMA journal_mode").scalar().lower() == 'memory'
+            assert connection.execute("PRAGMA synchronous").scalar() == 2  # FULL, the default
+
+
+def test_workorder_commit_queue_flush_does_not_hang_on_dead_writer(tmpdir, mocker):
+    engine = create_datastore_engine(db_filepath=str(tmpdir.join('ursula.db')), profile='wal')
+    upgrade_schema(engine)
+    test_datastore = datastore.Datastore(engine)
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+
+    commit_queue = WorkOrderCommitQueue(datastore=test_datastore, max_latency=0)
+    mocker.patch.object(commit_queue, '_commit', side_effect=SystemExit)  # Kills the writer thread.
+    commit_queue.start()
+    commit_queue.save(bob_verifying_key=bob_keypair_sig.pubkey, bob_signature=b'dead', arrangement_id=b'dead')
+    with pytest.raises(RuntimeError):
+        commit_queue.flush(timeout=10)
+    assert not commit_queue.running
+
+
+def test_workorder_commit_queue_flush_waits_only_for_earlier_work_orders(tmpdir, mocker):
+    engine = create_datastore_engine(db_filepath=str(tmpdir.join('ursula.db')), profile='wal')
+    upgrade_schema(engine)
+    test_datastore = datastore.Datastore(engine)
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+
+    commit_queue = WorkOrderCommitQueue(datastore=test_datastore, max_latency=0)
+    commit_queue.start()
+    try:
+        earlier = commit_queue.save(bob_verifying_key=bob_keypair_sig.pubkey,
+                                    bob_signature=b'earlier',
+                                    arrangement_id=b'flush')
+
+        # Work orders saved after the flush starts keep the queue busy, but don't hold the flush up.
+        original_commit = commit_queue._commit
+
+        def commit_and_save_another(batch):
+            original_commit(batch)
+            commit_queue._queue.put((dict(bob_verifying_key=bob_keypair_sig.pubkey,
+                                          bob_signature=b'later%d' % commit_queue.batches_committed,
+                                          arrangement_id=b'flush'), Future()))
+
+        mocker.patch.object(commit_queue, '_commit', side_effect=commit_and_save_another)
+        commit_queue.flush(timeout=10)
+        assert earlier.done()
+    finally:
+        mocker.stopall()
+        commit_queue.stop()
+
+
+def test_ursula_configuration_sets_workorder_persistence():
+    config = UrsulaConfiguration(dev_mode=True,
+                                 federated_only=True,
+                                 domains={TEMPORARY_DOMAIN},
+                                 datastore_profile='wal',
+                                 workorder_group_commit=True,
+                                 async_workorder_persistence=True)
+    payload = config.static_payload()
+    assert payload['datastore_profile'] == 'wal'
+    assert payload['workorder_group_commit'] is True
+    assert payload['async_workorder_persistence'] is True
+
+    ursula = config()
+    try:
+        assert ursula.workorder_commit_queue.running
+        assert ursula.workorder_commit_queue.asynchronous
+    finally:
+        ursula.workorder_commit_queue.stop()
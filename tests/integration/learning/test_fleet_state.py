@@ -20,6 +20,11 @@ from functools import partial
 from hendrix.experience import crosstown_traffic
 from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
 
+from nucypher.network import (
+    NODE_METADATA_DELTA_HEADER,
+    NODE_METADATA_DELTA_VERSION,
+    NODE_METADATA_KNOWN_NODES_HEADER
+)
 from tests.utils.ursula import make_federated_ursulas
 
 
@@ -124,3 +129,118 @@ def test_state_is_recorded_after_learning(federated_ursulas, ursula_federated_te
 
     assert len(states[0].nodes) == 2  # This and one other.
     assert len(states[1].nodes) == len(federated_ursulas) + 1  # Again, accounting for this Learner.
+
+
+def test_node_metadata_payload_is_reused_until_fleet_state_changes(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+    some_ursula_in_the_fleet, another_ursula_in_the_fleet = list(federated_ursulas)[:2]
+
+    lonely_teacher.remember_node(some_ursula_in_the_fleet)
+    first_payload = lonely_teacher.signed_bytestring_of_known_nodes()
+    assert first_payload.endswith(lonely_teacher.bytestring_of_known_nodes())
+
+    # Nothing has changed, so neither the nodes nor the payload are serialized or signed again.
+    assert lonely_teacher.signed_bytestring_of_known_nodes() is first_payload
+    assert bytes(lonely_teacher) is bytes(lonely_teacher)
+
+    # It's the payload served over REST.
+    rest_client = lonely_teacher.rest_app.test_client()
+    assert rest_client.get('/node_metadata').data == first_payload
+
+    # A new fleet state gets a new payload.
+    lonely_teacher.remember_node(another_ursula_in_the_fleet)
+    second_payload = lonely_teacher.signed_bytestring_of_known_nodes()
+    assert second_payload != first_payload
+    assert bytes(another_ursula_in_the_fleet) in second_payload
+    assert rest_client.get('/node_metadata').data == second_payload
+
+    # So does re-signing our own metadata.
+    lonely_teacher._sign_and_date_interface_info()
+    assert lonely_teacher.signed_bytestring_of_known_nodes() is not second_payload
+
+
+def test_learner_gets_only_nodes_learned_since_teachers_last_fleet_state(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+    lonely_learner = lonely_ursula_maker(known_nodes=[lonely_teacher]).pop()
+    fleet = list(federated_ursulas)
+
+    learning_callers = []
+    crosstown_traffic.decorator = crosstownTaskListDecoratorFactory(learning_callers)
+
+    for ursula in fleet[:4]:
+        lonely_teacher.remember_node(ursula)
+
+    # The first time, the learner gets all of the teacher's known nodes (and the teacher itself).
+    sprouts = lonely_learner.learn_from_teacher_node()
+    assert len(sprouts) == 5
+    assert lonely_teacher.checksum_address in lonely_learner.known_nodes.addresses()
+    assert lonely_teacher.known_nodes.checksum == lonely_learner.known_nodes[lonely_teacher.checksum_address].fleet_state_checksum
+
+    # After that, only what the teacher has learned since.
+    lonely_teacher.remember_node(fleet[4])
+    lonely_learner._current_teacher_node = lonely_learner.known_nodes[lonely_teacher.checksum_address]
+    sprouts = lonely_learner.learn_from_teacher_node()
+    assert {sprout.checksum_address for sprout in sprouts} == {fleet[4].checksum_address, lonely_teacher.checksum_address}
+    assert fleet[4].checksum_address in lonely_learner.known_nodes.addresses()
+
+    # Along with a delta, the teacher tells how many nodes it knows in all.
+    rest_client = lonely_teacher.rest_app.test_client()
+    since_checksum, since_updated = lonely_learner._teacher_fleet_states[lonely_teacher.checksum_address]
+    lonely_teacher.remember_node(fleet[5])
+    response = rest_client.get('/node_metadata', query_string=dict(delta=NODE_METADATA_DELTA_VERSION,
+                                                                  since=since_checksum,
+                                                                  since_updated=since_updated))
+    assert response.headers[NODE_METADATA_DELTA_HEADER] == str(NODE_METADATA_DELTA_VERSION)
+    assert response.headers[NODE_METADATA_KNOWN_NODES_HEADER] == str(len(lonely_teacher.known_nodes))
+
+    # A teacher that doesn't know the fleet state a learner asks about sends everything.
+    response = rest_client.get('/node_metadata', query_string=dict(delta=NODE_METADATA_DELTA_VERSION,
+                                                                  since=NO_KNOWN_NODES,
+                                                                  since_updated=0))
+    assert NODE_METADATA_DELTA_HEADER not in response.headers
+    assert response.data == lonely_teacher.signed_bytestring_of_known_nodes()
+
+
+def test_teachers_fleet_state_is_kept_once_all_it_taught_is_remembered(federated_ursulas,
+                                                                       ursula_federated_test_config,
+                                                                       mocker):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+    lonely_learner = lonely_ursula_maker(known_nodes=[lonely_teacher]).pop()
+    fleet = list(federated_ursulas)
+
+    learning_callers = []
+    crosstown_traffic.decorator = crosstownTaskListDecoratorFactory(learning_callers)
+
+    for ursula in fleet[:4]:
+        lonely_teacher.remember_node(ursula)
+
+    # One of the nodes the teacher tells us about fails to be remembered...
+    remember_node = lonely_learner.remember_node
+    failing_address = fleet[0].checksum_address
+    mocker.patch.object(lonely_learner, 'remember_node',
+                        side_effect=lambda node, **kwargs: False if node.checksum_address == failing_address
+                        else remember_node(node, **kwargs))
+    lonely_learner.learn_from_teacher_node()
+    assert failing_address not in lonely_learner.known_nodes.addresses()
+    assert lonely_teacher.checksum_address not in lonely_learner._teacher_fleet_states
+
+    # ...so next time, we ask about everything again, rather than for a delta which wouldn't include it.
+    mocker.stopall()
+    lonely_learner._current_teacher_node = lonely_learner.known_nodes[lonely_teacher.checksum_address]
+    sprouts = lonely_learner.learn_from_teacher_node()
+    assert len(sprouts) == 5
+    assert failing_address in lonely_learner.known_nodes.addresses()
+    checksum, _updated = lonely_learner._teacher_fleet_states[lonely_teacher.checksum_address]
+    assert checksum == lonely_teacher.known_nodes.checksum
@@ -0,0 +1,233 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest_twisted
+import time
+from hendrix.experience import crosstown_traffic
+from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
+from twisted.internet import reactor, task
+
+from nucypher.network.nodes import Teacher, TeacherScore
+from nucypher.network.verification import INTERFACE_SIGNATURE, TLS, NodeVerificationPipeline, VerificationCache
+from tests.utils.middleware import NodeIsDownMiddleware
+from tests.utils.ursula import make_federated_ursulas
+
+
+def test_learner_asks_several_teachers_at_once(federated_ursulas, ursula_federated_test_config):
+    learning_callers = []
+    crosstown_traffic.decorator = crosstownTaskListDecoratorFactory(learning_callers)
+
+    fleet = list(federated_ursulas)
+    teachers = fleet[:3]
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     known_nodes=teachers,
+                                     network_middleware=NodeIsDownMiddleware(),
+                                     teachers_per_round=3).pop()
+    down_teacher = teachers[0]
+    learner.network_middleware.node_is_down(down_teacher)
+
+    sprouts = learner.learn_from_teacher_node()
+
+    # Both teachers that answered told us about the whole fleet, but each node is only remembered once.
+    assert len(sprouts) == len({sprout.checksum_address for sprout in sprouts})
+    assert set(learner.known_nodes.addresses()) == {ursula.checksum_address for ursula in fleet}
+
+    # The teacher that didn't answer has fallen out of favor.
+    scores = learner.teacher_scores
+    assert all(scores[teacher.checksum_address].rounds == 1 for teacher in teachers)
+    assert scores[down_teacher.checksum_address].weight < TeacherScore.INITIAL_WEIGHT
+    assert all(scores[down_teacher.checksum_address].weight < scores[teacher.checksum_address].weight
+               for teacher in teachers[1:])
+
+
+@pytest_twisted.inlineCallbacks
+def test_nodes_learned_eagerly_are_verified_in_the_background(federated_ursulas, ursula_federated_test_config):
+    learning_callers = []
+    crosstown_traffic.decorator = crosstownTaskListDecoratorFactory(learning_callers)
+
+    fleet = list(federated_ursulas)
+    teacher, down_node = fleet[:2]
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     known_nodes=[teacher],
+                                     network_middleware=NodeIsDownMiddleware(),
+                                     verification_workers=3).pop()
+    learner.network_middleware.node_is_down(down_node)
+
+    sprouts = learner.learn_from_teacher_node(eager=True)
+    assert len(sprouts) == len(fleet)
+
+    pipeline = learner.verification_pipeline
+    deadline = time.monotonic() + 10
+    while pipeline.verified + pipeline.failed < len(fleet) - 1:  # We already knew (and verified) the teacher.
+        assert time.monotonic() < deadline
+        yield task.deferLater(reactor, .1, lambda: None)  # Verified nodes are promoted on the reactor.
+
+    # Only the nodes which passed every stage were remembered.
+    assert set(learner.known_nodes.addresses()) == {ursula.checksum_address for ursula in fleet} - {down_node.checksum_address}
+    assert all(node.verified_node for node in learner.known_nodes)
+
+    stats = pipeline.stats()
+    assert stats['queue_depth'] == stats['in_progress'] == 0
+    assert stats['verified'] == len(fleet) - 2
+    assert stats['stages'][TLS]['failures'] == {'gaierror': 1}  # The node seems to be down.
+    assert stats['stages'][INTERFACE_SIGNATURE]['passed'] == len(fleet) - 1
+
+    learner.stop_learning_loop()
+    assert not pipeline.running
+
+
+def test_verification_pipeline_drops_sprouts_when_full(federated_ursulas, ursula_federated_test_config, mocker):
+    fleet = list(federated_ursulas)
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     verification_workers=1).pop()
+    pipeline = learner.verification_pipeline
+    pipeline._queue.maxsize = 1
+    # With no workers taking sprouts off the queue, the first one fills it...
+    mocker.patch.object(NodeVerificationPipeline, 'running', new_callable=mocker.PropertyMock, return_value=True)
+    assert pipeline.submit(fleet[0])
+
+    # ...and the next is dropped, rather than holding up the learning loop.
+    assert not pipeline.submit(fleet[1])
+    assert pipeline.stats()['dropped'] == 1
+    assert fleet[1].checksum_address not in pipeline._pending
+
+
+def test_verification_stages_are_timed_from_when_they_start(federated_ursulas, ursula_federated_test_config):
+    node = list(federated_ursulas)[0]
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     verification_workers=1).pop()
+    pipeline = learner.verification_pipeline
+    pipeline.stage_timeouts[TLS] = 0.5
+    pipeline.start()
+    try:
+        # A hung stage times out, but keeps the only stage thread for a while yet...
+        assert pipeline._run_stage(node, TLS, lambda: time.sleep(1)) is None
+
+        # ...so the next stage waits for it, and only then gets its full timeout.
+        assert pipeline._run_stage(node, TLS, lambda: time.sleep(0.3))
+    finally:
+        pipeline.stop()
+
+    tls = pipeline.stats()['stages'][TLS]
+    assert tls['failures'] == {NodeVerificationPipeline.TIMEOUT: 1}
+    assert tls['passed'] == 1
+
+
+def test_nodes_are_not_verified_again_from_the_same_metadata(federated_ursulas,
+                                                             ursula_federated_test_config,
+                                                             tmpdir,
+                                                             mocker):
+    learning_callers = []
+    crosstown_traffic.decorator = crosstownTaskListDecoratorFactory(learning_callers)
+
+    fleet = list(federated_ursulas)
+    teacher = fleet[0]
+    cache_filepath = str(tmpdir.join(VerificationCache.DB_FILE_NAME))
+
+    def learn_with_fresh_learner():
+        learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                         quantity=1,
+                                         know_each_other=False,
+                                         known_nodes=[teacher],
+                                         verification_cache=VerificationCache(db_filepath=cache_filepath)).pop()
+        learner.learn_from_teacher_node(eager=True)
+        assert set(learner.known_nodes.addresses()) == {ursula.checksum_address for ursula in fleet}
+        return learner
+
+    interface_checks = mocker.spy(Teacher, 'validate_interface')
+    learner = learn_with_fresh_learner()
+    verified = interface_checks.call_count
+    assert verified
+    assert len(learner.verification_cache) == verified
+
+    # After a restart, nodes with the same metadata are taken at the cache's word...
+    learner = learn_with_fresh_learner()
+    assert interface_checks.call_count == verified
+    assert all(node.verified_node for node in learner.known_nodes)
+
+    # ...but not once their metadata changes.
+    changed_node = fleet[-1]
+    changed_node._sign_and_date_interface_info()
+    verification_cache = learner.verification_cache
+    assert verification_cache.get(changed_node) is None
+    changed_node.verify_node(learner.network_middleware.client, force=True, verification_cache=verification_cache)
+    assert interface_checks.call_count == verified + 1
+    assert verification_cache.get(changed_node) is not None
+    assert len(verification_cache) == verified  # Its outdated entry is gone.
+
+
+def test_nodes_learned_in_a_round_are_stored_together(federated_ursulas, ursula_federated_test_config, mocker):
+    learning_callers = []
+    crosstown_traffic.decorator = crosstownTaskListDecoratorFactory(learning_callers)
+
+    fleet = list(federated_ursulas)
+    teacher = fleet[0]
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     known_nodes=[teacher],
+                                     save_metadata=True).pop()
+    learner.known_nodes.start_tracking_state()
+    states = len(learner.known_nodes.states)
+    store_one = mocker.spy(learner.node_storage, 'store_node_metadata')
+    store_many = mocker.spy(learner.node_storage, 'store_nodes_metadata')
+
+    learner.learn_from_teacher_node()
+
+    # All the new nodes were written at once, and only one fleet state was recorded for them.
+    assert store_many.call_count == 1
+    stored_nodes = store_many.call_args[0][0]
+    assert {ursula.checksum_address for ursula in fleet[1:]} <= {node.checksum_address for node in stored_nodes}
+    assert store_one.call_count == len(stored_nodes)  # By the storage itself, one at a time.
+    assert len(learner.known_nodes.states) == states + 1
+
+    # With a flush interval, nodes are held back until the next flush, even outside a learning round.
+    learner.metadata_flush_interval = 60
+    store_many.reset_mock()
+    newer_teacher = make_federated_ursulas(ursula_config=ursula_federated_test_config, quantity=1).pop()
+    learner.remember_node(newer_teacher)
+    assert not store_many.call_count
+    learner.stop_learning_loop()
+    assert store_many.call_count == 1
+    assert list(store_many.call_args[0][0]) == [newer_teacher]
+
+
+def test_fleet_state_is_recorded_once_when_reading_nodes_from_storage(federated_ursulas,
+                                                                       ursula_federated_test_config,
+                                                                       mocker):
+    fleet = list(federated_ursulas)
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False).pop()
+    for ursula in fleet:
+        learner.node_storage.store_node_metadata(node=ursula)
+    states = len(learner.known_nodes.states)
+    record = mocker.spy(learner.known_nodes, 'record_fleet_state')
+
+    learner.read_nodes_from_storage()
+
+    assert {ursula.checksum_address for ursula in fleet} <= set(learner.known_nodes.addresses())
+    assert record.call_count == 1
+    assert len(learner.known_nodes.states) == states + 1
@@ -15,6 +15,8 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import datetime
+import maya
 import pytest
 
 from nucypher.characters.lawful import Ursula
@@ -88,6 +90,43 @@ def test_bob_can_retreive_the_treasure_map_and_decrypt_it(enacted_federated_poli
     assert enacted_federated_policy.treasure_map == treasure_map_from_wire
 
 
+def test_treasure_map_is_pushed_to_replica_holders_only(federated_alice, federated_bob, federated_ursulas):
+    replicas = 3
+    policy = federated_alice.grant(federated_bob,
+                                   label=b"a_map_with_few_holders",
+                                   m=2,
+                                   n=3,
+                                   expiration=maya.now() + datetime.timedelta(days=5),
+                                   treasure_map_replicas=replicas)
+
+    map_id = policy.treasure_map.public_id()
+    holders = {ursula for ursula in federated_ursulas if bytes.fromhex(map_id) in ursula.treasure_maps}
+    expected_holders = policy.treasure_map.rank_nodes_for_map(map_id, federated_alice.known_nodes)[:replicas]
+    assert holders == set(expected_holders)
+
+    # Bob, knowing the same fleet, asks a holder first.
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    middleware = federated_bob.network_middleware
+    original_get_treasure_map_from_node = middleware.get_treasure_map_from_node
+    asked = list()
+
+    def counting_get_treasure_map_from_node(node, map_id):
+        asked.append(node)
+        return original_get_treasure_map_from_node(node=node, map_id=map_id)
+
+    middleware.get_treasure_map_from_node = counting_get_treasure_map_from_node
+    try:
+        treasure_map = federated_bob.get_treasure_map(federated_alice.stamp, policy.label)
+    finally:
+        del middleware.get_treasure_map_from_node
+
+    assert treasure_map == policy.treasure_map
+    assert len(asked) == 1
+    assert asked[0] in holders
+
+
 def test_treasure_map_is_legit(enacted_federated_policy):
     """
     Sure, the TreasureMap can get to Bob, but we also need to know that each Ursula in the TreasureMap is on the network.
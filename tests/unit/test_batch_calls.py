@@ -0,0 +1,86 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from unittest.mock import patch
+
+from eth_utils import to_checksum_address
+from web3 import HTTPProvider, Web3
+from web3.contract import ContractFunction
+
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
+
+CONTRACT_ADDRESS = to_checksum_address('0x' + '11' * 20)
+STAKER_ADDRESS = to_checksum_address('0x' + 'ab' * 20)
+WORKER_ADDRESS = to_checksum_address('0x' + '22' * 20)
+
+MOCK_ABI = [
+    {"name": "stakerFromWorker", "type": "function", "stateMutability": "view",
+     "inputs": [{"name": "_worker", "type": "address"}],
+     "outputs": [{"name": "", "type": "address"}]},
+    {"name": "getLockedTokens", "type": "function", "stateMutability": "view",
+     "inputs": [{"name": "_staker", "type": "address"}, {"name": "_periods", "type": "uint16"}],
+     "outputs": [{"name": "", "type": "uint256"}]},
+]
+
+
+class MockBatchResponse:
+
+    def __init__(self, replies):
+        self.replies = replies
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.replies
+
+
+def test_batch_call_over_http():
+    provider = HTTPProvider('http://127.0.0.1:8545')
+    interface = BlockchainInterface(provider=provider, provider_uri=provider.endpoint_uri)
+    interface.w3 = Web3(provider)
+    contract = interface.w3.eth.contract(address=CONTRACT_ADDRESS, abi=MOCK_ABI)
+
+    calls = [contract.functions.stakerFromWorker(WORKER_ADDRESS),
+             contract.functions.getLockedTokens(STAKER_ADDRESS, 1),
+             contract.functions.getLockedTokens(STAKER_ADDRESS, 0)]
+
+    # Replies may come in any order; one of them failed.
+    replies = [dict(jsonrpc='2.0', id=1, result='0x' + hex(42)[2:].zfill(64)),
+               dict(jsonrpc='2.0', id=0, result='0x' + STAKER_ADDRESS[2:].lower().zfill(64)),
+               dict(jsonrpc='2.0', id=2, error=dict(code=-32000, message='header not found'))]
+
+    with patch('requests.post', return_value=MockBatchResponse(replies)) as post, \
+            patch.object(ContractFunction, 'call', return_value=7) as single_call:
+        results = interface.batch_call(calls)
+
+    # All the calls went out in a single request, and the failed one was made again on its own.
+    assert post.call_count == 1
+    batch = post.call_args[1]['json']
+    assert [request['id'] for request in batch] == [0, 1, 2]
+    assert all(request['method'] == 'eth_call' for request in batch)
+    assert single_call.call_count == 1
+
+    # Results are in the order the calls were given.
+    assert results == [STAKER_ADDRESS, 42, 7]
+
+    # Larger sets of calls are split across several requests.
+    replies = [dict(jsonrpc='2.0', id=request_id, result='0x' + hex(42)[2:].zfill(64)) for request_id in range(2)]
+    with patch('requests.post', return_value=MockBatchResponse(replies)) as post:
+        results = interface.batch_call(calls[1:] * 2, batch_size=2)
+    assert post.call_count == 2
+    assert results == [42] * 4
@@ -0,0 +1,100 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import math
+from constant_sorrow.constants import CONTRACT_CALL, TRANSACTION
+from eth_utils import to_checksum_address
+
+from nucypher.blockchain.eth.caches import ContractCallCache
+from nucypher.blockchain.eth.decorators import cached_call, contract_api
+
+CONTRACT_ADDRESS = to_checksum_address('0x' + '11' * 20)
+STAKER_ADDRESS = to_checksum_address('0x' + 'ab' * 20)
+
+
+class MockClient:
+    block_number = 1
+
+
+class MockBlockchain:
+    client = MockClient()
+
+
+class MockAgent:
+    contract_address = CONTRACT_ADDRESS
+
+    def __init__(self, call_cache=None):
+        self.call_cache = call_cache
+        self.calls = 0
+
+    @cached_call
+    @contract_api(CONTRACT_CALL)
+    def get_locked_tokens(self, staker_address, periods: int = 0) -> int:
+        self.calls += 1
+        return periods
+
+    @cached_call
+    @contract_api(CONTRACT_CALL)
+    def staking_parameters(self) -> tuple:
+        self.calls += 1
+        return 1, 2, 3
+
+    @contract_api(TRANSACTION)
+    def lock(self, staker_address) -> None:
+        pass
+
+
+def test_contract_calls_are_cached_for_one_block():
+    blockchain = MockBlockchain()
+    call_cache = ContractCallCache(blockchain=blockchain, block_number_ttl=0)
+    agent = MockAgent(call_cache=call_cache)
+
+    assert agent.get_locked_tokens(STAKER_ADDRESS, 1) == 1
+    assert agent.get_locked_tokens(STAKER_ADDRESS, 1) == 1
+    assert agent.get_locked_tokens(STAKER_ADDRESS, 2) == 2  # Different arguments
+    assert agent.calls == 2
+    assert call_cache.hits['get_locked_tokens'] == 1
+    assert call_cache.misses['get_locked_tokens'] == 2
+
+    # A new block arrives.
+    blockchain.client.block_number += 1
+    agent.get_locked_tokens(STAKER_ADDRESS, 1)
+    assert agent.calls == 3
+
+    # Immutable parameters outlive blocks.
+    assert call_cache.ttls['staking_parameters'] == math.inf
+    agent.staking_parameters()
+    blockchain.client.block_number += 1
+    agent.staking_parameters()
+    assert agent.calls == 4
+
+    # Transactions clear the cache.
+    agent.lock(STAKER_ADDRESS)
+    agent.staking_parameters()
+    assert agent.calls == 5
+
+    stats = call_cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 5
+    assert stats['methods']['staking_parameters'] == dict(hits=1, misses=2)
+
+    # Without a cache, every call is made.
+    agent = MockAgent()
+    agent.get_locked_tokens(STAKER_ADDRESS)
+    agent.get_locked_tokens(STAKER_ADDRESS)
+    assert agent.calls == 2
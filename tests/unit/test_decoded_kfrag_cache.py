@@ -0,0 +1,59 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timedelta
+
+from nucypher.datastore.kfrags import DecodedKFragCache
+
+
+def put(cache, arrangement_id, **kwargs):
+    return cache.put(arrangement_id=arrangement_id,
+                     kfrag=b'kfrag',
+                     alice_verifying_key=b'alice verifying key',
+                     alice_address=b'alice address',
+                     expiration=datetime.utcnow() + timedelta(days=1),
+                     **kwargs)
+
+
+def test_arrangement_revoked_while_being_read_is_not_cached():
+    cache = DecodedKFragCache()
+    arrangement_id = b'arrangement'
+
+    # A reencryption misses the cache and starts reading the arrangement...
+    assert cache.get(arrangement_id) is None
+    generation = cache.generation
+
+    # ...while it's revoked and invalidated...
+    cache.invalidate(arrangement_id)
+
+    # ...so what it read isn't cached, although it's still handed back for this request.
+    entry = put(cache, arrangement_id, generation=generation)
+    assert entry.kfrag == b'kfrag'
+    assert cache.get(arrangement_id) is None
+
+    # Without an invalidation in between, it is.
+    generation = cache.generation
+    put(cache, arrangement_id, generation=generation)
+    assert cache.get(arrangement_id) == entry
+
+
+def test_arrangement_pruned_while_being_read_is_not_cached():
+    cache = DecodedKFragCache()
+    generation = cache.generation
+    cache.prune(now=datetime.utcnow())
+    put(cache, b'arrangement', generation=generation)
+    assert not len(cache)
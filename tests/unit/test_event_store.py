@@ -0,0 +1,207 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+from types import SimpleNamespace
+
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+
+from nucypher.blockchain.eth.events import ContractEvents, EventReader, EventStore
+
+CONTRACT_ADDRESS = to_checksum_address('0x' + '11' * 20)
+STAKERS = [to_checksum_address('0x' + f'{i:02x}' * 20) for i in (1, 2)]
+
+
+class MockEvent:
+    event_name = 'Deposited'
+
+    def __init__(self, logs):
+        self.logs = logs
+        self.requested_ranges = []
+
+    def getLogs(self, fromBlock, toBlock, argument_filters=None):
+        self.requested_ranges.append((fromBlock, toBlock))
+        return [log for log in self.logs if fromBlock <= log['blockNumber'] <= toBlock]
+
+
+class MockEth:
+
+    def __init__(self):
+        self.blockNumber = 0
+        self.requested_blocks = []
+
+    def getBlock(self, block_number):
+        self.requested_blocks.append(block_number)
+        return dict(timestamp=1000 + block_number)
+
+
+class MockContract:
+
+    def __init__(self, logs):
+        self.address = CONTRACT_ADDRESS
+        self.web3 = SimpleNamespace(eth=MockEth())
+        self.deposited = MockEvent(logs)
+        self.events = SimpleNamespace(Deposited=self.deposited)
+
+    def advance(self, block_number: int):
+        self.web3.eth.blockNumber = block_number
+
+
+def make_log(block_number: int, log_index: int, staker: str, value: int) -> dict:
+    return dict(args=dict(staker=staker, value=value, data=HexBytes(b'\x01\x02')),
+                blockNumber=block_number,
+                logIndex=log_index,
+                transactionHash=HexBytes(block_number.to_bytes(32, "big")))
+
+
+def test_events_are_indexed_incrementally_and_queried_locally():
+    logs = [make_log(3, 0, STAKERS[0], 10),
+            make_log(3, 1, STAKERS[1], 20),
+            make_log(15, 0, STAKERS[0], 30),
+            make_log(27, 0, STAKERS[1], 40)]
+    contract = MockContract(logs[:3])
+    store = EventStore(chunk_size=10, confirmations=2)
+
+    contract.advance(22)
+    assert store.sync(contract=contract, event_name='Deposited') == 20
+    assert contract.deposited.requested_ranges == [(0, 9), (10, 19), (20, 20)]
+    assert contract.web3.eth.requested_blocks == [3, 15]  # Once per block
+
+    # Only the blocks since the last sync are asked for.
+    contract.deposited.logs = logs
+    contract.advance(30)
+    assert store.sync(contract=contract, event_name='Deposited') == 28
+    assert contract.deposited.requested_ranges[3:] == [(21, 28)]
+
+    records = list(store.query(contract_address=CONTRACT_ADDRESS, event_name='Deposited'))
+    assert [(record.block_number, record.args['value']) for record in records] == [(3, 10), (3, 20), (15, 30), (27, 40)]
+    assert records[0].timestamp == 1003
+    assert records[0].args['data'] == HexBytes(b'\x01\x02')
+    assert records[0].transaction_hash == HexBytes((3).to_bytes(32, "big")).hex()
+
+    # By block range and arguments
+    records = store.query(contract_address=CONTRACT_ADDRESS, event_name='Deposited', from_block=4, staker=STAKERS[0])
+    assert [record.args['value'] for record in records] == [30]
+    records = store.query(contract_address=CONTRACT_ADDRESS, event_name='Deposited', to_block=20, value=[20, 30])
+    assert [record.args['value'] for record in records] == [20, 30]
+
+
+def test_contract_events_are_read_from_the_event_store():
+    contract = MockContract([make_log(3, 0, STAKERS[0], 10)])
+    contract.advance(5)
+    events = ContractEvents.__new__(ContractEvents)  # The mock contract can't list its events.
+    events.contract, events.names, events.event_store = contract, ('Deposited',), EventStore(confirmations=0)
+
+    records = list(events.Deposited(staker=STAKERS[0]))
+    assert [record.args['value'] for record in records] == [10]
+    assert events.event_store.last_synced_block(CONTRACT_ADDRESS, 'Deposited') == 5
+
+
+class LimitedMockEvent(MockEvent):
+    """Refuses queries with more than a few results, as providers do."""
+    MAX_RESULTS = 3
+
+    def getLogs(self, fromBlock, toBlock, argument_filters=None):
+        logs = super().getLogs(fromBlock, toBlock)
+        if len(logs) > self.MAX_RESULTS:
+            raise ValueError({'code': -32005, 'message': 'query returned more than 3 results'})
+        return logs
+
+
+def test_events_are_read_in_adaptive_windows():
+    # A burst of events in a few blocks, and then none for a long while.
+    logs = [make_log(block_number, 0, STAKERS[0], block_number) for block_number in range(10, 20)]
+    logs.append(make_log(5000, 0, STAKERS[1], 5000))
+
+    for prefetch in (False, True):
+        event = LimitedMockEvent(logs)
+        reader = EventReader(event_method=event, from_block=0, to_block=6000, window=8, prefetch=prefetch)
+        records = list(reader)
+        assert [record.args['value'] for record in records] == list(range(10, 20)) + [5000]
+
+        # Windows shrank through the burst, and grew past it.
+        windows = [end - start + 1 for start, end in event.requested_ranges]
+        assert min(windows) < 8
+        assert max(windows) > 8
+        assert len(event.requested_ranges) < 100
+
+    # A single block with too many events can't be read.
+    event = LimitedMockEvent([make_log(7, log_index, STAKERS[0], log_index) for log_index in range(5)])
+    reader = EventReader(event_method=event, from_block=0, to_block=10)
+    try:
+        list(reader)
+    except EventReader.RangeTooLarge:
+        pass
+    else:
+        raise AssertionError("Expected RangeTooLarge")
+
+
+class FlakyMockEvent(MockEvent):
+    """Times out on its first few queries, or fails them with an error that has nothing to do with their size."""
+
+    def __init__(self, logs, failures: int, error: Exception):
+        super().__init__(logs)
+        self.failures = failures
+        self.error = error
+
+    def getLogs(self, fromBlock, toBlock, argument_filters=None):
+        if self.failures:
+            self.failures -= 1
+            self.requested_ranges.append((fromBlock, toBlock))
+            raise self.error
+        return super().getLogs(fromBlock, toBlock)
+
+
+def test_event_reader_retries_timeouts_without_shrinking_its_window():
+    logs = [make_log(3, 0, STAKERS[0], 10)]
+    event = FlakyMockEvent(logs, failures=2, error=TimeoutError())
+    reader = EventReader(event_method=event, from_block=0, to_block=9, window=10)
+    assert [record.args['value'] for record in reader] == [10]
+    assert event.requested_ranges == [(0, 9)] * 3
+
+    # Past TIMEOUT_RETRIES, the timeout is raised rather than mistaken for too many results.
+    event = FlakyMockEvent(logs, failures=EventReader.TIMEOUT_RETRIES + 1, error=TimeoutError())
+    reader = EventReader(event_method=event, from_block=0, to_block=9, window=10)
+    try:
+        list(reader)
+    except TimeoutError:
+        pass
+    else:
+        raise AssertionError("Expected TimeoutError")
+
+
+def test_event_reader_only_shrinks_its_window_for_too_many_results():
+    too_many_results = 'query returned more than 10000 results'
+    assert EventReader._is_too_many_results(ValueError({'code': -32005, 'message': too_many_results}))
+    assert EventReader._is_too_many_results(ValueError({'code': -32000, 'message': too_many_results}))
+    assert EventReader._is_too_many_results(SimpleNamespace(args=(), response=SimpleNamespace(status_code=413)))
+
+    # Outages, and errors that only happen to mention a 413 or a limit, are raised as they are.
+    assert not EventReader._is_too_many_results(ValueError({'code': -32000, 'message': 'header not found'}))
+    assert not EventReader._is_too_many_results(ValueError("block 0x413 not found"))
+    assert not EventReader._is_too_many_results(ConnectionError("connection refused; more than one attempt made"))
+
+    event = FlakyMockEvent([], failures=1, error=ValueError({'code': -32000, 'message': 'header not found'}))
+    reader = EventReader(event_method=event, from_block=0, to_block=9, window=10)
+    try:
+        list(reader)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError")
+    assert event.requested_ranges == [(0, 9)]
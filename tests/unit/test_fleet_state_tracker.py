@@ -0,0 +1,96 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+
+from eth_utils import to_checksum_address
+
+from nucypher.crypto.api import keccak_digest
+from nucypher.network.nodes import FleetStateTracker
+
+
+class FakeNode:
+
+    def __init__(self, checksum_address=None):
+        self.checksum_address = checksum_address or to_checksum_address(os.urandom(20))
+        self.metadata = os.urandom(64)
+
+    def __bytes__(self):
+        return self.metadata
+
+
+def checksum_of(nodes) -> str:
+    """The fleet state checksum, as learners running any version compute it."""
+    sorted_nodes = sorted(nodes, key=lambda n: n.checksum_address)
+    return keccak_digest(b"".join(bytes(n) for n in sorted_nodes)).hex()
+
+
+def test_fleet_state_checksum_is_maintained_incrementally():
+    tracker = FleetStateTracker()
+    this_node = FakeNode()
+    nodes = [FakeNode() for _ in range(20)]
+
+    tracker.record_fleet_state(additional_nodes_to_track=[this_node])
+    for node in nodes:
+        tracker[node.checksum_address] = node
+        tracker.record_fleet_state()
+        assert tracker.sorted() == sorted(list(tracker) + [this_node], key=lambda n: n.checksum_address)
+    assert tracker.checksum == checksum_of(nodes + [this_node])
+
+    # A node that re-signs its metadata replaces its older self in place.
+    newer_node = FakeNode(checksum_address=nodes[7].checksum_address)
+    tracker[newer_node.checksum_address] = newer_node
+    nodes[7] = newer_node
+    tracker.record_fleet_state()
+    assert len(tracker.sorted()) == len(nodes) + 1
+    assert tracker.checksum == checksum_of(nodes + [this_node])
+    assert len(tracker.states) == len(nodes) + 1
+
+    # Replacing the nodes wholesale rebuilds the order.
+    tracker._nodes = {node.checksum_address: node for node in nodes[10:15]}
+    tracker.record_fleet_state()
+    assert tracker.checksum == checksum_of(nodes[10:15] + [this_node])
+
+
+def test_fleet_state_is_recorded_once_for_nodes_saved_in_a_batch():
+    tracker = FleetStateTracker()
+    tracker.start_tracking_state()
+    nodes = [FakeNode() for _ in range(10)]
+
+    with tracker.deferred_recording():
+        for node in nodes[:5]:
+            tracker[node.checksum_address] = node
+        with tracker.deferred_recording():
+            for node in nodes[5:]:
+                tracker[node.checksum_address] = node
+        assert not tracker.states
+
+    assert len(tracker.states) == 1
+    assert tracker.checksum == checksum_of(nodes)
+
+    # A batch in which nothing was saved doesn't record anything.
+    with tracker.deferred_recording():
+        pass
+    assert len(tracker.states) == 1
+
+    # Recording explicitly within a batch is deferred too.
+    newer_node = FakeNode()
+    with tracker.deferred_recording():
+        tracker._nodes[newer_node.checksum_address] = newer_node
+        tracker.record_fleet_state()
+        assert len(tracker.states) == 1
+    assert len(tracker.states) == 2
@@ -0,0 +1,94 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+import requests
+
+from nucypher.network.middleware import NucypherSessionPool, PooledNucypherMiddlewareClient, RestMiddleware
+
+
+def test_session_pool_reuses_sessions_per_node_and_certificate():
+    pool = NucypherSessionPool()
+
+    first = pool.session(host='127.0.0.1:9151', certificate_filepath='/certs/a.pem')
+    again = pool.session(host='127.0.0.1:9151', certificate_filepath='/certs/a.pem')
+    assert first is again
+    assert first.verify == '/certs/a.pem'
+
+    # A different port or a different pinned certificate is a different session.
+    other_port = pool.session(host='127.0.0.1:9152', certificate_filepath='/certs/a.pem')
+    other_cert = pool.session(host='127.0.0.1:9151', certificate_filepath='/certs/b.pem')
+    assert len({id(first), id(other_port), id(other_cert)}) == 3
+
+    assert pool.stats() == dict(sessions=3, hits=1, misses=3, evictions=0)
+
+
+def test_session_pool_is_bounded():
+    pool = NucypherSessionPool(max_sessions=2)
+    oldest = pool.session(host='127.0.0.1:1', certificate_filepath='a')
+    pool.session(host='127.0.0.1:2', certificate_filepath='b')
+    pool.session(host='127.0.0.1:1', certificate_filepath='a')  # Refresh; now the second one is least recent.
+    pool.session(host='127.0.0.1:3', certificate_filepath='c')
+
+    assert len(pool) == 2
+    assert pool.evictions == 1
+    assert pool.session(host='127.0.0.1:1', certificate_filepath='a') is oldest
+
+    with pytest.raises(ValueError):
+        NucypherSessionPool(max_sessions=0)
+
+
+def test_session_pool_evicts_idle_sessions():
+    pool = NucypherSessionPool(idle_timeout=0)
+    first = pool.session(host='127.0.0.1:1', certificate_filepath='a')
+    second = pool.session(host='127.0.0.1:1', certificate_filepath='a')
+    assert first is not second
+    assert pool.misses == 2
+    assert pool.evictions == 1
+
+
+def test_pooled_client_routes_requests_through_the_pool(mocker):
+    middleware = RestMiddleware(connection_pooling=True)
+    client = middleware.client
+    assert isinstance(client, PooledNucypherMiddlewareClient)
+
+    response = mocker.Mock(status_code=200)
+    session_get = mocker.patch.object(requests.Session, 'get', autospec=True, return_value=response)
+
+    for _ in range(3):
+        client.get(host='127.0.0.1', port=9151, path='public_information', certificate_filepath='/certs/a.pem')
+
+    assert session_get.call_count == 3
+    session, url = session_get.call_args[0]
+    assert url == 'https://127.0.0.1:9151/public_information'
+    assert session_get.call_args[1]['verify'] == '/certs/a.pem'
+    assert client.session_pool.stats() == dict(sessions=1, hits=2, misses=1, evictions=0)
+
+
+def test_session_pool_does_not_close_sessions_in_use(mocker):
+    pool = NucypherSessionPool(max_sessions=1)
+    in_use = pool.session(host='127.0.0.1:1', certificate_filepath='a')
+    close = mocker.spy(in_use, 'close')
+
+    # Evicted to make room, but another thread is still sending through it...
+    pool.session(host='127.0.0.1:2', certificate_filepath='b')
+    assert pool.evictions == 1
+    assert close.call_count == 0
+
+    # ...so it's only closed once that thread gives it back.
+    pool.release(in_use)
+    assert close.call_count == 1
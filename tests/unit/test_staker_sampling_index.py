@@ -0,0 +1,50 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import os
+import random
+
+from eth_utils import to_checksum_address
+
+from nucypher.blockchain.eth.caches import StakerSamplingIndex
+
+
+def staker_at_by_walking(stakers: dict, point: int):
+    """The staker whose stake spans `point`, found by walking the stakes in order."""
+    sum_of_locked_tokens = 0
+    for staker, staker_tokens in stakers.items():
+        if sum_of_locked_tokens <= point < sum_of_locked_tokens + staker_tokens:
+            return staker
+        sum_of_locked_tokens += staker_tokens
+
+
+def test_sampling_index_finds_the_staker_spanning_each_point():
+    stakers = {to_checksum_address(os.urandom(20)): random.choice((0, 1, 10, 12345)) for _ in range(200)}
+    stakers[to_checksum_address(os.urandom(20))] = 1  # At least one stake
+    index = StakerSamplingIndex(stakers=stakers)
+    assert len(index) == len(stakers)
+    assert index.total_stake == sum(stakers.values())
+
+    # Including the edges of each stake; stakers without locked tokens are never sampled.
+    points = [0, index.total_stake - 1] + index.cumulative_stakes[:-1]
+    points += [random.randrange(index.total_stake) for _ in range(1000)]
+    for point in points:
+        assert index.stakers_at([point]) == {staker_at_by_walking(stakers, point)}
+    assert index.stakers_at(points) == {staker_at_by_walking(stakers, point) for point in points}
+
+    assert StakerSamplingIndex(stakers=dict()).total_stake == 0